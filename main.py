@@ -7,10 +7,6 @@ PySide6 ベースの実装を使用します。
 import argparse
 import sys
 
-from src.logger import get_logger
-
-logger = get_logger(__name__)
-
 # 言語設定はアプリケーション内で処理されます
 
 
@@ -27,6 +23,10 @@ def main() -> int:
     parser.add_argument("pdf_file", nargs="?", help="PDF ファイルのパスです。")
     args = parser.parse_args()
 
+    # --help などで終了する場合に src 配下の読み込みコストを払わないよう、引数の解析後にインポートします。
+    from src.logger import get_logger
+
+    logger = get_logger(__name__)
     logger.info("Starting application with PySide6 UI")
 
     # PySide6 ベースのアプリケーションをインポートします。
@@ -1,6 +1,6 @@
 """Common types, protocols, and base classes for PDFCrop."""
 
-from .base import BaseComponent, BaseController
+from .base import BaseComponent, BaseController, ComponentBase
 from .mixins import CleanupMixin, ConfigMixin, LoggingMixin, SettingsMixin, StatusMixin, ValidationMixin
 from .protocols import AppProtocol, CacheServiceProtocol, PDFServiceProtocol, ServiceProtocol, ViewerProtocol
 
@@ -12,6 +12,7 @@ __all__ = [
     "ViewerProtocol",
     "BaseComponent",
     "BaseController",
+    "ComponentBase",
     "StatusMixin",
     "SettingsMixin",
     "ValidationMixin",
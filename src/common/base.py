@@ -4,14 +4,33 @@ from abc import ABC, abstractmethod
 from typing import Any
 
 from ..logger import get_logger
+from .mixins import CleanupMixin, ConfigMixin, LoggingMixin, SettingsMixin, StatusMixin
+
+
+def _resolve_logger(instance: object, name: str):
+    """インスタンス用のロガーを返します。
+
+    名前がクラス名と同じ場合は、クラスごとに一度だけ作成したロガーを再利用します。
+    """
+    cls = type(instance)
+    if name == cls.__name__:
+        return cls._class_logger
+    return get_logger(f"{cls.__module__}.{name}")
 
 
 class BaseComponent(ABC):
     """すべての UI コンポーネントのベースクラスです。"""
 
+    __slots__ = ("_name", "_logger", "_initialized")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # 同じクラスのインスタンス間でロガーを共有します。
+        cls._class_logger = get_logger(f"{cls.__module__}.{cls.__name__}")
+
     def __init__(self, name: str = None):
         self._name = name or self.__class__.__name__
-        self._logger = get_logger(f"{self.__module__}.{self._name}")
+        self._logger = _resolve_logger(self, self._name)
         self._initialized = False
 
     @abstractmethod
@@ -38,9 +57,16 @@ class BaseComponent(ABC):
 class BaseController(ABC):
     """すべてのコントローラーのベースクラスです。"""
 
+    __slots__ = ("_name", "_logger", "_components", "_initialized")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # 同じクラスのインスタンス間でロガーを共有します。
+        cls._class_logger = get_logger(f"{cls.__module__}.{cls.__name__}")
+
     def __init__(self, name: str = None):
         self._name = name or self.__class__.__name__
-        self._logger = get_logger(f"{self.__module__}.{self._name}")
+        self._logger = _resolve_logger(self, self._name)
         self._components: dict[str, Any] = {}
         self._initialized = False
 
@@ -72,3 +98,60 @@ class BaseController(ABC):
         """コントローラーを初期化済みとしてマークします。"""
         self._initialized = True
         self._logger.debug(f"{self._name} initialized")
+
+
+class ComponentBase(BaseComponent):
+    """ステータス、設定、クリーンアップ、ロギング、設定値アクセスの機能を備えたコンポーネントのベースクラスです。
+
+    各ミックスインを多重継承する代わりに、ミックスインのメソッドをクラス属性として直接取り込みます。
+    MRO が ``ComponentBase -> BaseComponent`` の 1 本になるため、属性の探索や
+    ``super().__init__`` の連鎖が短くなります。
+    """
+
+    __slots__ = ("_app", "_cleanup_handlers")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # log_* メソッドが使用するプレフィックスを事前に構築します。
+        cls._log_prefix = f"{cls.__name__}: %s"
+
+    def __init__(self, name: str = None):
+        super().__init__(name)
+        self._app = None
+        self._cleanup_handlers: list = []
+
+    # ステータス更新です。
+    set_app = StatusMixin.set_app
+    update_status = StatusMixin.update_status
+
+    # 設定アクセスです。
+    get_settings = SettingsMixin.get_settings
+    save_settings = SettingsMixin.save_settings
+
+    # ロギングです。
+    logger = LoggingMixin.logger
+    log_debug = LoggingMixin.log_debug
+    log_info = LoggingMixin.log_info
+    log_warning = LoggingMixin.log_warning
+    log_error = LoggingMixin.log_error
+
+    # 設定値アクセスです。
+    get_config = staticmethod(ConfigMixin.get_config)
+
+    # クリーンアップです。
+    register_cleanup = CleanupMixin.register_cleanup
+
+    def cleanup(self) -> None:
+        """登録されたすべてのクリーンアップ ハンドラーを実行してから、リソースをクリーンアップします。"""
+        # ハンドラーの実行中に登録や削除が行われても安全なように、スナップショットを取ってから実行します。
+        handlers = tuple(self._cleanup_handlers)
+        self._cleanup_handlers.clear()
+
+        logger = self._logger
+        for handler in handlers:
+            try:
+                handler()
+            except Exception as e:
+                logger.error(f"Error during cleanup: {e}")
+
+        super().cleanup()
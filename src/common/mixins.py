@@ -1,12 +1,50 @@
-"""共有動作パターンのための共通ミックスインです。"""
+"""共有動作パターンのための共通ミックスインです。
 
+ミックスインは互いに、またベースクラスと自由に組み合わせられるように空の ``__slots__`` を宣言します。
+空でないスロットを持つクラスを複数継承するとインスタンス レイアウトが衝突するため、
+ミックスインが使用する属性の格納先は、組み合わせ先の具象クラスが用意します。
+"""
+
+import os
+from functools import lru_cache
+
+from ..config import app_config, cache_config, file_config, pdf_config, ui_config, window_config
 from ..logger import get_logger
 from .protocols import AppProtocol
 
+# 設定の種類と設定オブジェクトの対応表です。設定オブジェクトは不変なので一度だけ構築します。
+_CONFIG_MAP = {
+    "window": window_config,
+    "pdf": pdf_config,
+    "ui": ui_config,
+    "cache": cache_config,
+    "file": file_config,
+    "app": app_config,
+}
+
+
+@lru_cache(maxsize=1)
+def _resolve_settings():
+    """Resolve the shared settings instance once for the whole process.
+
+    Settings is a singleton, so the container lookup is only needed the first time.
+    """
+    from ..container import get_service
+
+    try:
+        return get_service("settings")
+    except (RuntimeError, ValueError):
+        # Fallback if container not configured
+        from ..models.settings import get_settings
+
+        return get_settings()
+
 
 class StatusMixin:
     """ステータスメッセージを更新する必要があるコンポーネントのためのミックスインです。"""
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._app: AppProtocol | None = None
@@ -34,23 +72,11 @@ class StatusMixin:
 class SettingsMixin:
     """Mixin for components that need settings access."""
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._settings = None
+    __slots__ = ()
 
     def get_settings(self):
-        """Get settings instance (lazy loaded)."""
-        if self._settings is None:
-            from ..container import ServiceLocator
-
-            try:
-                self._settings = ServiceLocator.get("settings")
-            except (RuntimeError, ValueError):
-                # Fallback if container not configured
-                from ..models.settings import ApplicationSettings
-
-                self._settings = ApplicationSettings()
-        return self._settings
+        """Get settings instance (resolved once per process)."""
+        return _resolve_settings()
 
     def save_settings(self) -> None:
         """Save current settings."""
@@ -62,6 +88,8 @@ class SettingsMixin:
 class ValidationMixin:
     """Mixin for input validation functionality."""
 
+    __slots__ = ()
+
     @staticmethod
     def validate_file_path(filepath: str) -> bool:
         """Validate if file path exists and is PDF.
@@ -72,11 +100,11 @@ class ValidationMixin:
         Returns:
             True if valid PDF file
         """
-        import os
-
-        if not filepath or not os.path.exists(filepath):
+        # Check the extension first: it is far cheaper than a filesystem call.
+        # Only the 4-character suffix is lowercased, not the whole path.
+        if not filepath or filepath[-4:].lower() not in pdf_config.SUPPORTED_EXTENSION_SET:
             return False
-        return filepath.lower().endswith(".pdf")
+        return os.path.isfile(filepath)
 
     @staticmethod
     def validate_page_number(page_num: int, max_pages: int) -> bool:
@@ -107,6 +135,8 @@ class ValidationMixin:
 class CleanupMixin:
     """Mixin for proper resource cleanup."""
 
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._cleanup_handlers = []
@@ -121,15 +151,17 @@ class CleanupMixin:
 
     def cleanup(self) -> None:
         """Execute all registered cleanup handlers."""
-        for handler in self._cleanup_handlers:
+        # Take a snapshot so handlers may safely register or clear handlers while running.
+        handlers = tuple(self._cleanup_handlers)
+        self._cleanup_handlers.clear()
+
+        logger = get_logger(self.__class__.__module__)
+        for handler in handlers:
             try:
                 handler()
             except Exception as e:
-                logger = get_logger(self.__class__.__module__)
                 logger.error(f"Error during cleanup: {e}")
 
-        self._cleanup_handlers.clear()
-
         # Call parent cleanup if it exists
         if hasattr(super(), "cleanup"):
             super().cleanup()
@@ -138,45 +170,44 @@ class CleanupMixin:
 class LoggingMixin:
     """Mixin for consistent logging functionality."""
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._logger = None
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Share one logger between all instances of the class.
+        cls._class_logger = get_logger(f"{cls.__module__}.{cls.__name__}")
+        # Let logging format lazily so disabled levels cost nothing.
+        cls._log_prefix = f"{cls.__name__}: %s"
 
     @property
     def logger(self):
-        """Get logger instance (lazy loaded)."""
-        if self._logger is None:
-            self._logger = get_logger(self.__class__.__module__)
-        return self._logger
+        """Get the class-level logger instance."""
+        return type(self)._class_logger
 
     def log_debug(self, message: str) -> None:
         """Log debug message."""
-        self.logger.debug(f"{self.__class__.__name__}: {message}")
+        self.logger.debug(self._log_prefix, message)
 
     def log_info(self, message: str) -> None:
         """Log info message."""
-        self.logger.info(f"{self.__class__.__name__}: {message}")
+        self.logger.info(self._log_prefix, message)
 
     def log_warning(self, message: str) -> None:
         """Log warning message."""
-        self.logger.warning(f"{self.__class__.__name__}: {message}")
+        self.logger.warning(self._log_prefix, message)
 
     def log_error(self, message: str, exc: Exception = None) -> None:
         """Log error message."""
-        if exc:
-            self.logger.error(f"{self.__class__.__name__}: {message}", exc_info=exc)
-        else:
-            self.logger.error(f"{self.__class__.__name__}: {message}")
+        self.logger.error(self._log_prefix, message, exc_info=exc)
 
 
 class ConfigMixin:
     """Mixin for configuration access."""
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._config_cache = {}
+    __slots__ = ()
 
-    def get_config(self, config_type: str):
+    @staticmethod
+    def get_config(config_type: str):
         """Get configuration object by type.
 
         Args:
@@ -185,18 +216,4 @@ class ConfigMixin:
         Returns:
             Configuration object
         """
-        if config_type not in self._config_cache:
-            from ..config import app_config, cache_config, file_config, pdf_config, ui_config, window_config
-
-            config_map = {
-                "window": window_config,
-                "pdf": pdf_config,
-                "ui": ui_config,
-                "cache": cache_config,
-                "file": file_config,
-                "app": app_config,
-            }
-
-            self._config_cache[config_type] = config_map.get(config_type)
-
-        return self._config_cache[config_type]
+        return _CONFIG_MAP.get(config_type)
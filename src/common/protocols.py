@@ -1,9 +1,8 @@
 """循環インポートを回避し、インターフェースを定義するためのプロトコル定義です。"""
 
-from typing import Any, Protocol, runtime_checkable
+from typing import Any, Protocol
 
 
-@runtime_checkable
 class AppProtocol(Protocol):
     """循環インポートを回避するためのメインアプリケーションのプロトコルです。"""
 
@@ -20,7 +19,6 @@ class AppProtocol(Protocol):
         ...
 
 
-@runtime_checkable
 class ServiceProtocol(Protocol):
     """Base protocol for all services."""
 
@@ -33,7 +31,6 @@ class ServiceProtocol(Protocol):
         ...
 
 
-@runtime_checkable
 class PDFServiceProtocol(Protocol):
     """Protocol for PDF-related services."""
 
@@ -50,7 +47,6 @@ class PDFServiceProtocol(Protocol):
         ...
 
 
-@runtime_checkable
 class CacheServiceProtocol(Protocol):
     """Protocol for cache services."""
 
@@ -67,7 +63,6 @@ class CacheServiceProtocol(Protocol):
         ...
 
 
-@runtime_checkable
 class ViewerProtocol(Protocol):
     """Protocol for PDF viewer components."""
 
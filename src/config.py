@@ -5,13 +5,30 @@
 """
 
 import os
-from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
-from typing import Final
+from typing import Final, NamedTuple
 
 
-@dataclass(frozen=True)
-class WindowConfig:
+@cache
+def _temp_root() -> Path:
+    """一時ファイル用のルート ディレクトリを返します。初回呼び出し時にのみ環境変数を参照します。"""
+    return Path(os.getenv("TEMP", "temp")) / "PDFCrop"
+
+
+@cache
+def _app_data_root() -> Path:
+    """アプリケーション データ用のルート ディレクトリを返します。初回呼び出し時にのみ環境変数を参照します。"""
+    return Path(os.getenv("LOCALAPPDATA", str(Path.home()))) / "PDFCrop"
+
+
+@cache
+def _cache_root() -> Path:
+    """ページ キャッシュ用のルート ディレクトリを返します。初回呼び出し時にのみ環境変数を参照します。"""
+    return Path(os.getenv("LOCALAPPDATA", "cache")) / "PDFCrop" / "cache"
+
+
+class WindowConfig(NamedTuple):
     """ウィンドウに関連する設定定数です。
 
     Parameters
@@ -34,15 +51,14 @@ class WindowConfig:
 
     """
 
-    WIDTH: Final[int] = 800
-    HEIGHT: Final[int] = 600
-    DEFAULT_SIZE: Final[str] = f"{WIDTH}x{HEIGHT}"
-    MIN_WIDTH: Final[int] = 400
-    MIN_HEIGHT: Final[int] = 300
+    WIDTH: int = 800
+    HEIGHT: int = 600
+    DEFAULT_SIZE: str = f"{WIDTH}x{HEIGHT}"
+    MIN_WIDTH: int = 400
+    MIN_HEIGHT: int = 300
 
 
-@dataclass(frozen=True)
-class PDFConfig:
+class PDFConfig(NamedTuple):
     """PDF 操作に関連する設定定数です。
 
     Parameters
@@ -59,6 +75,8 @@ class PDFConfig:
         ズームアウト倍率です。
     MIN_SELECTION_SIZE: int
         最小選択サイズです。
+    ARCHIVE_CAPTURES: bool
+        スクリーン キャプチャを一時ディレクトリにも PNG ファイルとして保存するかどうかです。
 
     Notes
     -----
@@ -66,21 +84,29 @@ class PDFConfig:
 
     """
 
-    DEFAULT_ZOOM_SCALE: Final[float] = 1.0
-    DEFAULT_MAX_EXTRACT_PAGES: Final[int] = 3
-    ZOOM_IN_FACTOR: Final[float] = 1.1
-    ZOOM_OUT_FACTOR: Final[float] = 1.1
-    MIN_SELECTION_SIZE: Final[int] = 5
-
-    TEMP_DIRECTORY: Final[str] = str(Path(os.getenv("TEMP", "temp")) / "PDFCrop" / "pdfs")
-    TEMP_IMAGE_DIRECTORY: Final[str] = str(Path(os.getenv("TEMP", "temp")) / "PDFCrop" / "images")
+    DEFAULT_ZOOM_SCALE: float = 1.0
+    DEFAULT_MAX_EXTRACT_PAGES: int = 3
+    ZOOM_IN_FACTOR: float = 1.1
+    ZOOM_OUT_FACTOR: float = 1.1
+    MIN_SELECTION_SIZE: int = 5
+    ARCHIVE_CAPTURES: bool = False
 
     # サポートされているファイル拡張子です。
-    SUPPORTED_EXTENSIONS: Final[tuple[str, ...]] = (".pdf",)
+    SUPPORTED_EXTENSIONS: tuple[str, ...] = (".pdf",)
+    # 拡張子を O(1) で照合するための小文字の集合です。
+    SUPPORTED_EXTENSION_SET: frozenset[str] = frozenset(SUPPORTED_EXTENSIONS)
+
+    # パスは環境変数に依存するため、インポート時ではなく最初のアクセス時に計算します。
+    @property
+    def TEMP_DIRECTORY(self) -> str:
+        return str(_temp_root() / "pdfs")
+
+    @property
+    def TEMP_IMAGE_DIRECTORY(self) -> str:
+        return str(_temp_root() / "images")
 
 
-@dataclass(frozen=True)
-class UIConfig:
+class UIConfig(NamedTuple):
     """ユーザー インターフェースに関連する設定定数です。
 
     Parameters
@@ -109,18 +135,17 @@ class UIConfig:
 
     """
 
-    TOOLBAR_PADDING: Final[int] = 2
-    TOOLBAR_SEPARATOR_PADDING: Final[int] = 5
-    MAX_PAGES_ENTRY_WIDTH: Final[int] = 3
-    SCROLLBAR_WIDTH: Final[int] = 16
-    PAGE_PADDING: Final[int] = 10
-    MENU_BUTTON_MIN_WIDTH: Final[int] = 70
-    MAX_MENU_PATH_LENGTH: Final[int] = 40
-    PATH_TRUNCATION_SUFFIX: Final[str] = "..."
+    TOOLBAR_PADDING: int = 2
+    TOOLBAR_SEPARATOR_PADDING: int = 5
+    MAX_PAGES_ENTRY_WIDTH: int = 3
+    SCROLLBAR_WIDTH: int = 16
+    PAGE_PADDING: int = 10
+    MENU_BUTTON_MIN_WIDTH: int = 70
+    MAX_MENU_PATH_LENGTH: int = 40
+    PATH_TRUNCATION_SUFFIX: str = "..."
 
 
-@dataclass(frozen=True)
-class FileConfig:
+class FileConfig(NamedTuple):
     """ファイル操作に関連する設定定数です。
 
     Parameters
@@ -138,9 +163,15 @@ class FileConfig:
 
     """
 
-    APP_DATA_DIR: Final[str] = str(Path(os.getenv("LOCALAPPDATA", str(Path.home()))) / "PDFCrop")
-    SETTINGS_FILE: Final[str] = str(Path(APP_DATA_DIR) / "settings.json")
-    DEFAULT_RECENT_FILES_LIMIT: Final[int] = 20
+    DEFAULT_RECENT_FILES_LIMIT: int = 20
+
+    @property
+    def APP_DATA_DIR(self) -> str:
+        return str(_app_data_root())
+
+    @property
+    def SETTINGS_FILE(self) -> str:
+        return str(_app_data_root() / "settings.json")
 
 
 def _default_settings() -> dict:
@@ -157,13 +188,12 @@ def _default_file_settings() -> dict:
     """ファイルごとのデフォルト設定値を返します。"""
     return {
         "scroll_position": 0.0,
-        "last_accessed": "",
-        "max_extract_pages": PDFConfig.DEFAULT_MAX_EXTRACT_PAGES,
+        "last_accessed_ns": 0,
+        "max_extract_pages": pdf_config.DEFAULT_MAX_EXTRACT_PAGES,
     }
 
 
-@dataclass(frozen=True)
-class CacheConfig:
+class CacheConfig(NamedTuple):
     """キャッシュに関連する設定定数です。
 
     Parameters
@@ -180,6 +210,18 @@ class CacheConfig:
         プレースホルダーの色です。
     LOW_RES_SCALE_FACTOR: float
         低解像度プレースホルダーのスケールファクターです。
+    MAX_CACHED_PAGES: int
+        キャンバスが保持するレンダリング済みページ画像の最大数です。
+    MAX_CACHE_BYTES: int
+        レンダラーが保持するページ画像の合計サイズ (バイト) の上限です。
+    MAX_CACHE_ENTRIES: int
+        レンダラーが保持するページ画像の数の上限です。
+    MUPDF_STORE_SHRINK_INTERVAL: int
+        MuPDF の内部ストアを縮小するまでに LRU から削除するページ画像の数です。
+    MUPDF_STORE_SHRINK_PERCENT: int
+        MuPDF の内部ストアを縮小するときに解放する割合 (%) です。
+    MAX_DISK_CACHE_BYTES: int
+        ディスクに保存するページ画像の合計サイズ (バイト) の上限です。
 
     Notes
     -----
@@ -187,12 +229,21 @@ class CacheConfig:
 
     """
 
-    CACHE_DIRECTORY: Final[str] = str(Path(os.getenv("LOCALAPPDATA", "cache")) / "PDFCrop" / "cache")
-    MAX_CACHE_SIZE_GB: Final[float] = 1.0
-    HIGH_RES_SCALE_FACTOR: Final[float] = 2.0
-    PRELOAD_RANGE: Final[int] = 2
-    PLACEHOLDER_COLOR: Final[str] = "#f0f0f0"
-    LOW_RES_SCALE_FACTOR: Final[float] = 0.2
+    MAX_CACHE_SIZE_GB: float = 1.0
+    HIGH_RES_SCALE_FACTOR: float = 2.0
+    PRELOAD_RANGE: int = 2
+    PLACEHOLDER_COLOR: str = "#f0f0f0"
+    LOW_RES_SCALE_FACTOR: float = 0.2
+    MAX_CACHED_PAGES: int = 50
+    MAX_CACHE_BYTES: int = 256 * 1024 * 1024
+    MAX_CACHE_ENTRIES: int = 500
+    MUPDF_STORE_SHRINK_INTERVAL: int = 8
+    MUPDF_STORE_SHRINK_PERCENT: int = 30
+    MAX_DISK_CACHE_BYTES: int = 1024 * 1024 * 1024
+
+    @property
+    def CACHE_DIRECTORY(self) -> str:
+        return str(_cache_root())
 
 
 # 各設定クラスのインスタンスを作成します。
@@ -207,20 +258,30 @@ DEFAULT_SETTINGS = _default_settings()
 DEFAULT_FILE_SETTINGS = _default_file_settings()
 
 
-@dataclass(frozen=True)
 class LoggingConfig:
-    """ロギングに関連する設定定数です。"""
+    """ロギングに関連する設定定数です。
+
+    Notes
+    -----
+    フィールドを持たない NamedTuple は空のタプルとして偽と評価されるため、通常のクラスとします。
+    """
+
+    __slots__ = ()
+
+    @property
+    def LOG_DIRECTORY(self) -> str:
+        return str(_app_data_root() / "logs")
 
-    LOG_DIRECTORY: Final[str] = str(Path(os.getenv("LOCALAPPDATA", str(Path.home()))) / "PDFCrop" / "logs")
-    LOG_FILE: Final[str] = str(Path(LOG_DIRECTORY) / "app.log")
+    @property
+    def LOG_FILE(self) -> str:
+        return str(_app_data_root() / "logs" / "app.log")
 
 
 # ロギング設定も含めてインスタンスを作成します。
 logging_config = LoggingConfig()
 
 
-@dataclass(frozen=True)
-class AppConfig:
+class AppConfig(NamedTuple):
     """アプリケーション全般の設定定数です。
 
     Parameters
@@ -238,9 +299,9 @@ class AppConfig:
 
     """
 
-    APP_NAME: Final[str] = "PDFCrop"
-    LOAD_DELAY_MS: Final[int] = 100
-    DEBOUNCE_DELAY_MS: Final[int] = 100
+    APP_NAME: str = "PDFCrop"
+    LOAD_DELAY_MS: int = 100
+    DEBOUNCE_DELAY_MS: int = 100
 
 
 # アプリケーション設定のインスタンスを作成します。
@@ -14,8 +14,9 @@ class ServiceContainer:
     """シンプルな依存性注入コンテナです。"""
 
     def __init__(self):
-        self._services: dict[str, Any] = {}
-        self._factories: dict[str, Callable] = {}
+        # インスタンスもファクトリーも、引数なしで呼び出すとサービスを返す関数として保持します。
+        # 同じ名前で登録した場合は、後の登録が優先されます。
+        self._resolvers: dict[str, Callable[[], Any]] = {}
         self._singletons: dict[str, Any] = {}
 
     def register_factory(self, name: str, factory: Callable[[], T]) -> None:
@@ -25,8 +26,8 @@ class ServiceContainer:
             name : サービス名
             factory : サービスを作成するファクトリー関数
         """
-        self._factories[name] = factory
-        logger.debug(f"Registered factory for service: {name}")
+        self._resolvers[name] = factory
+        logger.debug("Registered factory for service: %s", name)
 
     def register_singleton(self, name: str, factory: Callable[[], T]) -> None:
         """シングルトン サービスを登録します。
@@ -39,11 +40,11 @@ class ServiceContainer:
         def singleton_factory():
             if name not in self._singletons:
                 self._singletons[name] = factory()
-                logger.debug(f"Created singleton instance for: {name}")
+                logger.debug("Created singleton instance for: %s", name)
             return self._singletons[name]
 
-        self._factories[name] = singleton_factory
-        logger.debug(f"Registered singleton factory for service: {name}")
+        self._resolvers[name] = singleton_factory
+        logger.debug("Registered singleton factory for service: %s", name)
 
     def register_instance(self, name: str, instance: T) -> None:
         """既存のインスタンスを登録します。
@@ -52,8 +53,8 @@ class ServiceContainer:
             name : サービス名
             instance : サービスのインスタンス
         """
-        self._services[name] = instance
-        logger.debug(f"Registered instance for service: {name}")
+        self._resolvers[name] = lambda: instance
+        logger.debug("Registered instance for service: %s", name)
 
     def get(self, name: str) -> Any:
         """名前でサービスを取得します。
@@ -67,17 +68,13 @@ class ServiceContainer:
         Raises:
             ValueError : サービスが登録されていない場合
         """
-        # インスタンスが既に作成されているかチェックします。
-        if name in self._services:
-            return self._services[name]
+        try:
+            resolver = self._resolvers[name]
+        except KeyError:
+            raise ValueError(f"Service not registered: {name}") from None
 
-        # ファクトリーが登録されているかチェックします。
-        if name in self._factories:
-            instance = self._factories[name]()
-            # ファクトリーで作成されたインスタンスはキャッシュしません（シングルトンを除く）。
-            return instance
-
-        raise ValueError(f"Service not registered: {name}")
+        # ファクトリーで作成されたインスタンスはキャッシュしません（シングルトンを除く）。
+        return resolver()
 
     def has(self, name: str) -> bool:
         """サービスが登録されているかチェックします。
@@ -88,60 +85,61 @@ class ServiceContainer:
         Returns:
             サービスが登録されている場合は True
         """
-        return name in self._services or name in self._factories
+        return name in self._resolvers
 
     def clear(self) -> None:
         """登録されたすべてのサービスをクリアします。"""
-        self._services.clear()
-        self._factories.clear()
+        self._resolvers.clear()
         self._singletons.clear()
         logger.debug("Service container cleared")
 
 
-class ServiceLocator:
-    """サービス ロケーター パターンの実装です。"""
+# サービス ロケーター パターンの実装です。
+# プロセス全体で 1 つのコンテナを共有するため、クラスではなくモジュール グローバルで保持します。
+_container: ServiceContainer | None = None
 
-    _container: ServiceContainer | None = None
 
-    @classmethod
-    def set_container(cls, container: ServiceContainer) -> None:
-        """サービス コンテナを設定します。
+def set_container(container: ServiceContainer) -> None:
+    """サービス コンテナを設定します。
 
-        Args:
-            container : サービス コンテナのインスタンス
-        """
-        cls._container = container
+    Args:
+        container : サービス コンテナのインスタンス
+    """
+    global _container
+    _container = container
 
-    @classmethod
-    def get(cls, name: str) -> Any:
-        """コンテナからサービスを取得します。
 
-        Args:
-            name : サービス名
+def get_service(name: str) -> Any:
+    """コンテナからサービスを取得します。
 
-        Returns:
-            サービスのインスタンス
+    Args:
+        name : サービス名
 
-        Raises:
-            RuntimeError : コンテナが設定されていない場合
-        """
-        if cls._container is None:
-            raise RuntimeError("Service container not set")
-        return cls._container.get(name)
+    Returns:
+        サービスのインスタンス
 
-    @classmethod
-    def has(cls, name: str) -> bool:
-        """サービスが存在するかチェックします。
+    Raises:
+        RuntimeError : コンテナが設定されていない場合
+    """
+    container = _container
+    if container is None:
+        raise RuntimeError("Service container not set")
+    return container.get(name)
 
-        Args:
-            name : サービス名
 
-        Returns:
-            サービスが存在する場合は True
-        """
-        if cls._container is None:
-            return False
-        return cls._container.has(name)
+def has_service(name: str) -> bool:
+    """サービスが存在するかチェックします。
+
+    Args:
+        name : サービス名
+
+    Returns:
+        サービスが存在する場合は True
+    """
+    container = _container
+    if container is None:
+        return False
+    return container.has(name)
 
 
 def setup_container() -> ServiceContainer:
@@ -153,21 +151,37 @@ def setup_container() -> ServiceContainer:
     container = ServiceContainer()
 
     # コア サービスを登録します。
-    from .models.settings import ApplicationSettings
-    from .pyside_ui.services.clipboard_manager import ClipboardManager
-    from .pyside_ui.services.page_cache import PageCache
-    from .pyside_ui.services.pdf_handler import PDFDocumentHandler
+    # 各モジュール (PyMuPDF や Qt を含みます) は最初に get() されたときにだけ読み込まれます。
+    def create_settings():
+        from .models.settings import get_settings
+
+        return get_settings()
+
+    def create_page_cache():
+        from .pyside_ui.services.page_cache import PageCache
+
+        return PageCache()
+
+    def create_clipboard_manager():
+        from .pyside_ui.services.clipboard_manager import ClipboardManager
+
+        return ClipboardManager()
+
+    def create_pdf_handler():
+        from .pyside_ui.services.pdf_handler import PDFDocumentHandler
+
+        return PDFDocumentHandler()
 
     # シングルトンを登録します。
-    container.register_singleton("settings", lambda: ApplicationSettings())
-    container.register_singleton("page_cache", lambda: PageCache())
-    container.register_singleton("clipboard_manager", lambda: ClipboardManager())
+    container.register_singleton("settings", create_settings)
+    container.register_singleton("page_cache", create_page_cache)
+    container.register_singleton("clipboard_manager", create_clipboard_manager)
 
     # ファクトリーを登録します。
-    container.register_factory("pdf_handler", lambda: PDFDocumentHandler())
+    container.register_factory("pdf_handler", create_pdf_handler)
 
     # サービス ロケーターを設定します。
-    ServiceLocator.set_container(container)
+    set_container(container)
 
     logger.info("Dependency injection container configured")
     return container
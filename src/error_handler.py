@@ -1,31 +1,36 @@
 """PDFCrop の一元化されたエラーハンドリングです。"""
 
+from __future__ import annotations
+
 import sys
-import traceback
 from collections.abc import Callable
-from enum import Enum
-from typing import Any
-
-from PySide6.QtWidgets import QMessageBox, QWidget
+from enum import IntEnum
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
-from .i18n import _
 from .logger import get_logger
 
+if TYPE_CHECKING:
+    from PySide6.QtWidgets import QWidget
+
 logger = get_logger(__name__)
 
 
-class ErrorSeverity(Enum):
-    """エラーの深刻度レベルです。"""
+class ErrorSeverity(IntEnum):
+    """エラーの深刻度レベルです。値が大きいほど深刻です。"""
 
-    INFO = "info"
-    WARNING = "warning"
-    ERROR = "error"
-    CRITICAL = "critical"
+    INFO = 0
+    WARNING = 1
+    ERROR = 2
+    CRITICAL = 3
 
 
 class ErrorHandler:
     """アプリケーションの一元化されたエラー ハンドラーです。"""
 
+    # 深刻度の値をインデックスとするログ出力メソッドです。
+    _LOG_METHODS: tuple[Callable, ...] = (logger.info, logger.warning, logger.error, logger.critical)
+
     def __init__(self, parent_widget: QWidget | None = None):
         """エラー ハンドラーを初期化します。
 
@@ -84,26 +89,21 @@ class ErrorHandler:
             full_message = error_msg
 
         # 深刻度に基づいてエラーをログ記録します。
-        if severity == ErrorSeverity.INFO:
-            logger.info(full_message)
-        elif severity == ErrorSeverity.WARNING:
-            logger.warning(full_message)
-        elif severity == ErrorSeverity.ERROR:
-            logger.error(full_message, exc_info=error)
-        elif severity == ErrorSeverity.CRITICAL:
-            logger.critical(full_message, exc_info=error)
+        # ERROR 以上の場合はトレースバックも記録します。
+        is_error = severity >= ErrorSeverity.ERROR
+        self._LOG_METHODS[severity](full_message, exc_info=error if is_error else None)
 
         # 登録されたコールバックをチェックします。
-        error_type = type(error)
-        if error_type in self._error_callbacks:
+        callback = self._error_callbacks.get(type(error))
+        if callback is not None:
             try:
-                self._error_callbacks[error_type](error, context)
+                callback(error, context)
             except Exception as callback_error:
                 logger.error(f"Error in error callback: {callback_error}")
 
         # 有効な場合はダイアログを表示します。
         should_show = show_dialog if show_dialog is not None else self._show_dialogs
-        if should_show and severity in [ErrorSeverity.ERROR, ErrorSeverity.CRITICAL]:
+        if should_show and is_error:
             self._show_error_dialog(full_message, severity)
 
     def handle_exception(self, exc_type: type, exc_value: Exception, exc_traceback: Any, context: str = "") -> None:
@@ -116,6 +116,8 @@ class ErrorHandler:
             context : コンテキストの説明
         """
         # トレースバックをフォーマットします。
+        import traceback
+
         tb_lines = traceback.format_exception(exc_type, exc_value, exc_traceback)
         tb_text = "".join(tb_lines)
 
@@ -135,6 +137,11 @@ class ErrorHandler:
         if not self._parent_widget:
             return
 
+        # Qt と翻訳の読み込みコストはダイアログを表示するときにだけ払います。
+        from PySide6.QtWidgets import QMessageBox
+
+        from .i18n import _
+
         # 深刻度に基づいてダイアログのアイコンとタイトルを決定します。
         if severity == ErrorSeverity.WARNING:
             icon = QMessageBox.Warning
@@ -175,20 +182,20 @@ class ErrorHandler:
         return exception_hook
 
 
-# グローバル エラー ハンドラー インスタンスです。
+# set_global_error_handler() で明示的に設定されたエラー ハンドラーです。
 _global_error_handler: ErrorHandler | None = None
 
 
+@cache
 def get_error_handler() -> ErrorHandler:
     """グローバル エラー ハンドラー インスタンスを取得します。
 
+    結果はキャッシュされるため、2 回目以降の呼び出しでは分岐もインスタンス生成も行いません。
+
     Returns:
         グローバル エラー ハンドラー
     """
-    global _global_error_handler
-    if _global_error_handler is None:
-        _global_error_handler = ErrorHandler()
-    return _global_error_handler
+    return _global_error_handler if _global_error_handler is not None else ErrorHandler()
 
 
 def set_global_error_handler(handler: ErrorHandler) -> None:
@@ -199,6 +206,7 @@ def set_global_error_handler(handler: ErrorHandler) -> None:
     """
     global _global_error_handler
     _global_error_handler = handler
+    get_error_handler.cache_clear()
 
 
 def setup_global_exception_handling(parent_widget: QWidget | None = None) -> None:
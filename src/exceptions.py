@@ -23,13 +23,68 @@ def _get_translator():
             return i18n_module._
 
 
+# 解決済みの翻訳関数です。言語が変更されると invalidate_translator_cache() で破棄されます。
+_cached_translator = None
+
+
+def invalidate_translator_cache() -> None:
+    """解決済みの翻訳関数を破棄し、次回の翻訳時に再取得させます。"""
+    global _cached_translator
+    _cached_translator = None
+
+
 def _(text):
     """翻訳器を遅延ロードする翻訳関数です。"""
-    translator = _get_translator()
-    return translator(text)
+    global _cached_translator
+    if _cached_translator is None:
+        _cached_translator = _get_translator()
+    return _cached_translator(text)
+
+
+def N_(text):
+    """
+    文字列を翻訳対象として抽出されるように印を付けます。翻訳はせず、そのまま返します。
+
+    Notes
+    -----
+    変数を経由して _() に渡す文字列に使用します。
+    抽出時は xgettext --keyword=N_ (pybabel では -k N_) を指定してください。
+    """
+    return text
+
+
+class _FileError(Exception):
+    """
+    ファイル パスを伴うエラーの基底クラスです。
+
+    Parameters
+    ----------
+    message : str
+        エラーメッセージです。翻訳前の文字列を指定します。
+    filepath : str | None
+        エラーに関連するファイル パスです。
+
+    Notes
+    -----
+    args[0] には翻訳前のメッセージを保持し、翻訳とファイル パスの整形は str() で必要になるまで遅延します。
+    ファイル パスを含めた形式は、サブクラスで _FILE_FORMAT を上書きして変更します。
+    """
+
+    # ファイル パスがある場合のメッセージの形式です。翻訳してから message と filepath を埋め込みます。
+    # _() には変数として渡すため、N_() で翻訳対象として抽出されるようにします。
+    _FILE_FORMAT = N_("{message} (file: {filepath})")
+
+    def __init__(self, message: str, filepath: str | None = None) -> None:
+        super().__init__(message)
+        self.filepath = filepath
+
+    def __str__(self) -> str:
+        if not self.filepath:
+            return self.args[0]
+        return _(self._FILE_FORMAT).format(message=self.args[0], filepath=self.filepath)
 
 
-class PDFError(Exception):
+class PDFError(_FileError):
     """
     PDF ファイル操作に関連するエラーの基底クラスです。
 
@@ -44,9 +99,10 @@ class PDFError(Exception):
     具体的なエラーは、このクラスを継承した個別の例外クラスで表現されます。
     """
 
-    def __init__(self, message: str) -> None:
-        self.message = message
-        super().__init__(self.message)
+    @property
+    def message(self) -> str:
+        """翻訳と整形を済ませたエラーメッセージです。"""
+        return str(self)
 
 
 class PDFFileNotFoundError(PDFError):
@@ -63,8 +119,11 @@ class PDFFileNotFoundError(PDFError):
     このエラーは、指定されたパスに PDF ファイルが存在しない場合に発生します。
     """
 
+    _FILE_FORMAT = N_("PDF file not found: {filepath}")
+
     def __init__(self, filepath: str) -> None:
-        super().__init__(_("PDF file not found: {filepath}").format(filepath=filepath))
+        # メッセージ全体をファイル パスから作るため、args[0] には翻訳前のメッセージを設定します。
+        super().__init__(self._FILE_FORMAT.format(filepath=filepath), filepath)
 
 
 class PDFEmptyError(PDFError):
@@ -81,8 +140,11 @@ class PDFEmptyError(PDFError):
     このエラーは、開こうとした PDF ファイルにページが含まれていない場合に発生します。
     """
 
+    _FILE_FORMAT = N_("PDF file has no pages: {filepath}")
+
     def __init__(self, filepath: str) -> None:
-        super().__init__(_("PDF file has no pages: {filepath}").format(filepath=filepath))
+        # メッセージ全体をファイル パスから作るため、args[0] には翻訳前のメッセージを設定します。
+        super().__init__(self._FILE_FORMAT.format(filepath=filepath), filepath)
 
 
 class PDFProcessingError(PDFError):
@@ -101,11 +163,6 @@ class PDFProcessingError(PDFError):
     このエラーは、PDF ファイルの処理中 (ページの抽出など) にエラーが発生した場合に使用されます。
     """
 
-    def __init__(self, message: str, filepath: str | None = None) -> None:
-        if filepath:
-            message = _("{message} (file: {filepath})").format(message=message, filepath=filepath)
-        super().__init__(message)
-
 
 class PDFDisplayError(PDFError):
     """
@@ -123,13 +180,8 @@ class PDFDisplayError(PDFError):
     このエラーは、PDF ファイルの表示処理中にエラーが発生した場合に使用されます。
     """
 
-    def __init__(self, message: str, filepath: str | None = None) -> None:
-        if filepath:
-            message = _("{message} (file: {filepath})").format(message=message, filepath=filepath)
-        super().__init__(message)
-
 
-class ClipboardError(Exception):
+class ClipboardError(_FileError):
     """
     クリップボード操作に関連するエラーです。
 
@@ -146,13 +198,8 @@ class ClipboardError(Exception):
     クリップボード操作に関連するエラーが発生した場合に使用されます。
     """
 
-    def __init__(self, message: str, filepath: str | None = None) -> None:
-        if filepath:
-            message = _("{message} (file: {filepath})").format(message=message, filepath=filepath)
-        super().__init__(message)
-
 
-class SettingsError(Exception):
+class SettingsError(_FileError):
     """
     設定の読み込みや保存に関連するエラーです。
 
@@ -168,13 +215,10 @@ class SettingsError(Exception):
     このエラーは、設定ファイルの読み込みや保存時にエラーが発生した場合に使用されます。
     """
 
-    def __init__(self, message: str, filepath: str | None = None) -> None:
-        if filepath:
-            message = _("{message} (settings file: {filepath})").format(message=message, filepath=filepath)
-        super().__init__(message)
+    _FILE_FORMAT = N_("{message} (settings file: {filepath})")
 
 
-class CacheError(Exception):
+class CacheError(_FileError):
     """
     キャッシュ操作に関連するエラーです。
 
@@ -189,8 +233,3 @@ class CacheError(Exception):
     -----
     このエラーは、PDF ページのキャッシュ操作に関連するエラーが発生した場合に使用されます。
     """
-
-    def __init__(self, message: str, filepath: str | None = None) -> None:
-        if filepath:
-            message = _("{message} (file: {filepath})").format(message=message, filepath=filepath)
-        super().__init__(message)
@@ -1,6 +1,7 @@
 import gettext
 import locale
 import os
+from functools import lru_cache
 from pathlib import Path
 
 try:
@@ -22,6 +23,21 @@ _ = gettext.gettext
 SUPPORTED_LANGUAGES = ["en_US", "ja_JP", "zh_CN", "zh_TW"]
 
 
+@lru_cache(maxsize=len(SUPPORTED_LANGUAGES))
+def _load_translator(lang: str) -> gettext.NullTranslations:
+    """指定された言語の翻訳を読み込みます。
+
+    .mo ファイルの検索と解析は言語ごとに 1 回だけ行い、結果をキャッシュします。
+    翻訳ファイルが見つからない場合は NullTranslations を返します。
+    """
+    translator = gettext.translation("pdfcrop", localedir=LOCALE_DIR, languages=[lang], fallback=True)
+    if isinstance(translator, gettext.GNUTranslations):
+        logger.debug("Translation loaded successfully: %s", type(translator))
+    else:
+        logger.warning("Failed to load translation for %s, using fallback", lang)
+    return translator
+
+
 def set_language(lang: str | None = None) -> None:
     """翻訳を初期化し、グローバルな gettext 関数を設定します。
 
@@ -50,41 +66,23 @@ def set_language(lang: str | None = None) -> None:
         use_lang = "ja_JP"
 
     _current_language = use_lang
-    logger.info("Setting language to: %s", use_lang)
-    logger.info("Locale directory: %s", LOCALE_DIR)
-    mo_path = LOCALE_DIR / use_lang / "LC_MESSAGES" / "pdfcrop.mo"
-    logger.info("Looking for translation files in: %s", mo_path)
-    logger.info("Translation file exists: %s", mo_path.exists())
+    logger.debug("Setting language to: %s", use_lang)
+    logger.debug("Locale directory: %s", LOCALE_DIR)
 
-    try:
-        # まず fallback=False で試します。
-        _translator = gettext.translation(
-            "pdfcrop",
-            localedir=LOCALE_DIR,
-            languages=[use_lang] if use_lang else None,
-            fallback=False,
-        )
-        logger.info("Translation loaded successfully: %s", type(_translator))
-    except Exception as e:
-        logger.warning("Failed to load translation for %s: %s", use_lang, e)
-        # fallback を使用します。
-        _translator = gettext.translation(
-            "pdfcrop",
-            localedir=LOCALE_DIR,
-            languages=[use_lang] if use_lang else None,
-            fallback=True,
-        )
-        logger.info("Fallback translation loaded: %s", type(_translator))
-        logger.info("Is NullTranslations: %s", isinstance(_translator, gettext.NullTranslations))
-
-    _ = _translator.gettext
+    _translator = _load_translator(use_lang)
+    # 同じ文字列の翻訳を何度も引かないように、言語ごとに新しいキャッシュ付きの関数を作成します。
+    # 以前の言語のキャッシュは関数ごと破棄されます。
+    _ = lru_cache(maxsize=512)(_translator.gettext)
 
     # モジュールのグローバル変数も更新します。
     globals()["_"] = _
 
-    # 翻訳のテストを実行します。
-    test_str = _("Open PDF File")
-    logger.info("Translation test - 'Open PDF File' translates to: %s", test_str)
+    # 例外メッセージ用にキャッシュされた翻訳関数を破棄します。
+    try:
+        from .exceptions import invalidate_translator_cache
+    except ImportError:
+        from exceptions import invalidate_translator_cache
+    invalidate_translator_cache()
 
 
 def get_current_language() -> str | None:
@@ -1,4 +1,7 @@
+import atexit
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 from .config import logging_config
@@ -6,12 +9,32 @@ from .config import logging_config
 _log_dir = Path(logging_config.LOG_DIRECTORY)
 _log_dir.mkdir(parents=True, exist_ok=True)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-    filename=str(Path(logging_config.LOG_FILE)),
-    encoding="utf-8",
-)
+
+def _configure_root_logger() -> None:
+    """ルート ロガーを設定します。
+
+    ログ レコードはキューに積むだけにして、ファイルへの書き込みはバックグラウンド スレッドの
+    QueueListener がまとめて行います。呼び出し元のスレッドでディスク I/O が発生しません。
+    """
+    root = logging.getLogger()
+    # logging.basicConfig と同様に、すでに設定済みの場合は何もしません。
+    if root.handlers:
+        return
+
+    file_handler = logging.FileHandler(str(Path(logging_config.LOG_FILE)), encoding="utf-8")
+    file_handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(name)s: %(message)s"))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, file_handler)
+    listener.start()
+    # 終了時にキューに残ったレコードを書き出してからファイルを閉じます。
+    atexit.register(listener.stop)
+
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
+
+
+_configure_root_logger()
 
 
 def get_logger(name: str | None = None) -> logging.Logger:
@@ -1,8 +1,9 @@
 """設定管理モジュールです。"""
 
-from .settings import ApplicationSettings, SettingsRepository
+from .settings import ApplicationSettings, SettingsRepository, get_settings
 
 __all__ = [
     "ApplicationSettings",
     "SettingsRepository",
+    "get_settings",
 ]
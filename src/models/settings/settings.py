@@ -2,13 +2,75 @@
 
 import json
 import os
+import time
+from collections import OrderedDict
+from collections.abc import Container
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional
-
-from PySide6.QtCore import QLocale
+from typing import TYPE_CHECKING, Any, Optional
 
 from ...exceptions import SettingsError
+from ...logger import get_logger
+
+if TYPE_CHECKING:
+    from PySide6.QtCore import QTimer
+
+logger = get_logger(__name__)
+
+try:
+    import orjson
+except ImportError:  # orjson は任意の依存関係です。
+    orjson = None
+
+
+def _dumps_settings(settings_data: dict[str, Any]) -> bytes:
+    """設定データを UTF-8 の JSON バイト列に変換します。"""
+    if orjson is not None:
+        return orjson.dumps(settings_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(settings_data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _loads_settings(data: bytes) -> dict[str, Any]:
+    """UTF-8 の JSON バイト列から設定データを復元します。"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+@lru_cache(maxsize=1)
+def _get_default_file_settings() -> dict[str, Any]:
+    """ファイルごとの既定の設定を返します。"""
+    from ...config import DEFAULT_FILE_SETTINGS
+
+    return DEFAULT_FILE_SETTINGS
+
+
+def _migrate_last_accessed(file_settings: dict[str, Any]) -> bool:
+    """ISO 形式の last_accessed を整数の last_accessed_ns (エポックからのナノ秒) に移行します。
+
+    Returns
+    -------
+    bool
+        移行を行った場合は True です。
+    """
+    if "last_accessed_ns" in file_settings:
+        return False
+    last_accessed = file_settings.pop("last_accessed", "")
+    try:
+        file_settings["last_accessed_ns"] = int(datetime.fromisoformat(last_accessed).timestamp() * 1_000_000_000)
+    except (TypeError, ValueError):
+        file_settings["last_accessed_ns"] = 0
+    return True
+
+
+@lru_cache(maxsize=1024)
+def _resolve_normalized_path(filepath: str) -> str:
+    """ファイル パスを絶対パスに解決し、区切り文字を / に統一します。
+
+    Path.resolve() はファイル システムを参照するため、同じパスに対する結果をキャッシュします。
+    """
+    return str(Path(filepath).resolve()).replace("\\", "/")
 
 
 class SettingsRepository:
@@ -47,13 +109,12 @@ class SettingsRepository:
             設定ファイルが読み込めない場合に発生します。
         """
         try:
-            if self._settings_file_path.exists():
-                with self._settings_file_path.open("r", encoding="utf-8") as f:
-                    return json.load(f)
-            else:
-                from ...config import DEFAULT_SETTINGS
+            # 存在確認の stat を省き、ファイル全体を 1 回で読み込みます。
+            return _loads_settings(self._settings_file_path.read_bytes())
+        except FileNotFoundError:
+            from ...config import DEFAULT_SETTINGS
 
-                return DEFAULT_SETTINGS.copy()
+            return DEFAULT_SETTINGS.copy()
         except Exception as e:
             raise SettingsError(f"設定ファイルの読み込みに失敗しました: {str(e)}", str(self._settings_file_path)) from e
 
@@ -70,9 +131,12 @@ class SettingsRepository:
         SettingsError
             設定ファイルが保存できない場合に発生します。
         """
+        # 書き込み途中で終了しても設定ファイルが壊れないように、一時ファイルに書き込んでから置き換えます。
+        temp_path = self._settings_file_path.with_suffix(self._settings_file_path.suffix + ".tmp")
         try:
-            with self._settings_file_path.open("w", encoding="utf-8") as f:
-                json.dump(settings_data, f, indent=2, ensure_ascii=False)
+            with temp_path.open("wb") as f:
+                f.write(_dumps_settings(settings_data))
+            os.replace(temp_path, self._settings_file_path)
         except Exception as e:
             raise SettingsError(f"設定ファイルの保存に失敗しました: {str(e)}", str(self._settings_file_path)) from e
 
@@ -86,6 +150,12 @@ class ApplicationSettings:
 
     _instance: Optional["ApplicationSettings"] = None
 
+    # 検出済みのシステム言語です。QLocale.system() の呼び出しは 1 回だけにします。
+    _system_language: str | None = None
+
+    # schedule_save() で保存をまとめる待ち時間 (ミリ秒) です。
+    SAVE_DELAY_MS = 500
+
     def __init__(self, settings_file_path: str | None = None) -> None:
         """アプリケーション設定を初期化します。
 
@@ -93,9 +163,33 @@ class ApplicationSettings:
         ----------
         settings_file_path : str | None
             設定ファイルのパスです。None の場合はデフォルトを使用します。
+
+        Notes
+        -----
+        インスタンスはシングルトンのため、2 回目以降の呼び出しでは何もしません。
+        未保存の変更をディスクの内容で上書きしないためです。
         """
+        if getattr(self, "_initialized", False):
+            return
         self._repository = SettingsRepository(settings_file_path) if settings_file_path else SettingsRepository()
         self._settings_data = self._repository.load_settings()
+        # 最近のファイルは最終アクセス日時の新しい順に保持し、以降は更新時に先頭へ移動します。
+        recent_files = self._settings_data.get("recent_files", {})
+        migrated = [_migrate_last_accessed(file_settings) for file_settings in recent_files.values()]
+        self._recent_files: OrderedDict[str, dict[str, Any]] = OrderedDict(
+            sorted(recent_files.items(), key=lambda item: item[1]["last_accessed_ns"], reverse=True)
+        )
+        self._settings_data["recent_files"] = self._recent_files
+        # 拡張子が .pdf のパスの集合です。取得のたびに小文字化して判定しないように、追加時に 1 回だけ判定します。
+        self._valid_pdf_paths: set[str] = {path for path in self._recent_files if path.lower().endswith(".pdf")}
+        # 頻繁に参照される値は属性にも保持し、取得時の辞書参照を省きます。
+        self._window_geometry: str = self._settings_data.get("window_geometry", "")
+        self._language: str = self._settings_data.get("language", "")
+        self._last_file: str = self._settings_data.get("last_file", "")
+        # 前回の保存以降に設定が変更されたかどうかです。古い形式から移行した場合は保存が必要です。
+        self._dirty = any(migrated)
+        self._save_timer: QTimer | None = None
+        self._initialized = True
 
     def __new__(cls, settings_file_path: str | None = None) -> "ApplicationSettings":
         """後方互換性のためにシングルトンインスタンスを作成または返します。"""
@@ -106,36 +200,72 @@ class ApplicationSettings:
     @classmethod
     def get_instance(cls, settings_file_path: str | None = None) -> "ApplicationSettings":
         """シングルトンインスタンスを取得します。"""
-        if cls._instance is None:
-            cls._instance = cls(settings_file_path)
-        return cls._instance
+        return get_settings(settings_file_path)
 
     def save_settings(self) -> None:
-        """現在の設定をファイルに保存します。"""
+        """現在の設定をファイルに保存します。変更がない場合は何もしません。"""
+        if self._save_timer is not None:
+            self._save_timer.stop()
+        if not self._dirty:
+            return
         self._repository.save_settings(self._settings_data)
+        self._dirty = False
+
+    def schedule_save(self) -> None:
+        """設定の保存を予約します。
+
+        SAVE_DELAY_MS 以内に続けて呼び出された場合は、最後の呼び出しから待ち時間を数え直し、
+        保存を 1 回にまとめます。イベント ループがない場合はすぐに保存します。
+        """
+        from PySide6.QtCore import QCoreApplication, QTimer
+
+        if QCoreApplication.instance() is None:
+            self.save_settings()
+            return
+        if self._save_timer is None:
+            self._save_timer = QTimer()
+            self._save_timer.setSingleShot(True)
+            self._save_timer.timeout.connect(self._flush_save)
+        self._save_timer.start(self.SAVE_DELAY_MS)
+
+    def _flush_save(self) -> None:
+        """予約された保存を実行します。"""
+        try:
+            self.save_settings()
+        except SettingsError as e:
+            logger.error(f"設定の保存に失敗しました: {e}")
 
     # ウィンドウ設定メソッドです。
     def get_window_geometry(self) -> str:
         """ウィンドウジオメトリ文字列を取得します。"""
-        return self._settings_data.get("window_geometry", "")
+        return self._window_geometry
 
     def set_window_geometry(self, geometry: str) -> None:
         """ウィンドウジオメトリ文字列を設定します。"""
-        self._settings_data["window_geometry"] = geometry
+        self._window_geometry = self._settings_data["window_geometry"] = geometry
+        self._dirty = True
 
     # 言語設定メソッドです。
     def get_language(self) -> str:
         """現在の言語設定を取得します。"""
-        lang = self._settings_data.get("language", "")
-        if not lang:
-            # システム言語を自動検出します。
+        if self._language:
+            return self._language
+        return self._detect_system_language()
+
+    @classmethod
+    def _detect_system_language(cls) -> str:
+        """システム言語を自動検出します。結果はクラス変数にキャッシュします。"""
+        if cls._system_language is None:
+            from PySide6.QtCore import QLocale
+
             system_locale = QLocale.system().name()
-            return system_locale if system_locale in ["en_US", "ja_JP", "zh_CN", "zh_TW"] else "ja_JP"
-        return lang
+            cls._system_language = system_locale if system_locale in ["en_US", "ja_JP", "zh_CN", "zh_TW"] else "ja_JP"
+        return cls._system_language
 
     def set_language(self, language: str) -> None:
         """言語設定を設定します。"""
-        self._settings_data["language"] = language
+        self._language = self._settings_data["language"] = language
+        self._dirty = True
 
     def ensure_valid_language_setting(self) -> None:
         """言語設定が有効であることを確認します。"""
@@ -149,29 +279,29 @@ class ApplicationSettings:
     # ファイル設定メソッドです。
     def get_last_file(self) -> str:
         """Get last opened file path."""
-        return self._settings_data.get("last_file", "")
+        return self._last_file
 
     def set_last_file(self, filepath: str) -> None:
         """Set last opened file path."""
         normalized_path = self._normalize_path(filepath)
-        self._settings_data["last_file"] = normalized_path
+        self._last_file = self._settings_data["last_file"] = normalized_path
+        self._dirty = True
 
     def get_file_settings(self, filepath: str) -> dict[str, Any]:
         """Get settings for a specific file."""
-        from ...config import DEFAULT_FILE_SETTINGS
-
+        default_file_settings = _get_default_file_settings()
         normalized_path = self._normalize_path(filepath)
-        if "recent_files" not in self._settings_data:
-            self._settings_data["recent_files"] = {}
 
-        if normalized_path not in self._settings_data["recent_files"]:
-            self._settings_data["recent_files"][normalized_path] = DEFAULT_FILE_SETTINGS.copy()
-        else:
-            # すべてのデフォルトキーが存在することを確認します。
-            for key, value in DEFAULT_FILE_SETTINGS.items():
-                self._settings_data["recent_files"][normalized_path].setdefault(key, value)
+        entry = self._recent_files.get(normalized_path)
+        if entry is None:
+            entry = self._recent_files[normalized_path] = default_file_settings.copy()
+            self._add_valid_pdf_path(normalized_path)
+            self._dirty = True
+        elif not entry.keys() >= default_file_settings.keys():
+            # 不足しているデフォルトキーを 1 回の辞書結合で補います。
+            entry = self._recent_files[normalized_path] = {**default_file_settings, **entry}
 
-        return self._settings_data["recent_files"][normalized_path]
+        return entry
 
     def update_file_settings(
         self,
@@ -180,71 +310,116 @@ class ApplicationSettings:
         max_extract_pages: int,
     ) -> None:
         """Update settings for a specific file."""
-        from ...config import DEFAULT_FILE_SETTINGS
-
         normalized_path = self._normalize_path(filepath)
-        if "recent_files" not in self._settings_data:
-            self._settings_data["recent_files"] = {}
 
-        if normalized_path not in self._settings_data["recent_files"]:
-            self._settings_data["recent_files"][normalized_path] = DEFAULT_FILE_SETTINGS.copy()
-
-        file_settings = self._settings_data["recent_files"][normalized_path]
+        file_settings = self._recent_files.get(normalized_path)
+        if file_settings is None:
+            file_settings = self._recent_files[normalized_path] = _get_default_file_settings().copy()
+            self._add_valid_pdf_path(normalized_path)
         file_settings["scroll_position"] = scroll_position
         file_settings["max_extract_pages"] = max_extract_pages
-        file_settings["last_accessed"] = datetime.now().isoformat()
+        file_settings["last_accessed_ns"] = time.time_ns()
+        self._recent_files.move_to_end(normalized_path, last=False)
         self.set_last_file(normalized_path)
+        self.schedule_save()
 
     def get_recent_files(self, limit: int = None) -> list[tuple[str, dict[str, Any]]]:
         """Get list of recent files sorted by last accessed time."""
-        recent_files = []
-        recent_files_data = self._settings_data.get("recent_files", {})
+        # recent_files は最新のものが先頭になるように保持されているため、ソートは不要です。
+        # 簡単な PDF ファイル検証（拡張子チェック）は追加時に済ませています。
+        valid_pdf_paths = self._valid_pdf_paths
+        recent_files = [
+            (filepath, settings) for filepath, settings in self._recent_files.items() if filepath in valid_pdf_paths
+        ]
+        return recent_files if limit is None else recent_files[:limit]
 
-        for filepath, settings in recent_files_data.items():
-            # 簡単な PDF ファイル検証（拡張子チェック）です。
-            if filepath.lower().endswith(".pdf"):
-                recent_files.append((filepath, settings))
+    def recent_pdf_files(self, limit: int | None = None, exclude: Container[str] = ()) -> list[tuple[str, int]]:
+        """最近開いた PDF ファイルを新しい順に返します。
 
-        # last_accessed 時刻でソートします（最新のものが最初）。
-        recent_files.sort(key=lambda x: x[1].get("last_accessed", ""), reverse=True)
+        Parameters
+        ----------
+        limit : int | None
+            返すファイルの最大数です。None の場合はすべて返します。
+        exclude : Container[str]
+            一覧から除くファイル パスです (存在しないことが分かっているファイルなど)。
 
-        if limit is not None:
-            recent_files = recent_files[:limit]
+        Returns
+        -------
+        list[tuple[str, int]]
+            (ファイル パス, 最終アクセス時刻 (エポックからのナノ秒)) のタプルのリストです。
 
+        Notes
+        -----
+        recent_files は最終アクセス日時の新しい順に保持しているため、ソートせずに先頭から
+        limit 件に達した時点で走査を打ち切ります。ファイルの存在確認は行いません。
+        """
+        recent_files: list[tuple[str, int]] = []
+        if limit is not None and limit <= 0:
+            return recent_files
+        valid_pdf_paths = self._valid_pdf_paths
+        for filepath, file_settings in self._recent_files.items():
+            last_accessed = file_settings.get("last_accessed_ns", 0)
+            if not last_accessed or filepath not in valid_pdf_paths or filepath in exclude:
+                continue
+            recent_files.append((filepath, last_accessed))
+            if len(recent_files) == limit:
+                break
         return recent_files
 
     def remove_file_from_recent(self, filepath: str) -> None:
         """Remove a file from recent files list."""
         normalized_path = self._normalize_path(filepath)
-        recent_files_data = self._settings_data.get("recent_files", {})
-
-        if normalized_path in recent_files_data:
-            del recent_files_data[normalized_path]
+        if normalized_path in self._recent_files:
+            del self._recent_files[normalized_path]
+            self._valid_pdf_paths.discard(normalized_path)
+            self._dirty = True
 
         # 削除されたファイルが last_file だった場合はクリアします。
-        if self._settings_data.get("last_file") == normalized_path:
-            self._settings_data["last_file"] = ""
+        if self._last_file == normalized_path:
+            self._last_file = self._settings_data["last_file"] = ""
+            self._dirty = True
 
     def clear_recent_files(self) -> None:
         """Clear all recent files history."""
-        self._settings_data["recent_files"] = {}
-        self._settings_data["last_file"] = ""
+        self._recent_files.clear()
+        self._valid_pdf_paths.clear()
+        self._last_file = self._settings_data["last_file"] = ""
+        self._dirty = True
+        _resolve_normalized_path.cache_clear()
 
     def cleanup_missing_files(self) -> int:
         """Remove files that no longer exist from recent files list."""
 
-        recent_files_data = self._settings_data.get("recent_files", {})
         missing_files = []
 
-        for filepath in recent_files_data:
-            if not os.path.exists(filepath) or not filepath.lower().endswith(".pdf"):
+        # ファイルごとに stat を発行せず、親ディレクトリごとに 1 回だけ列挙します。
+        files_by_directory: dict[str, list[tuple[str, str]]] = {}
+        for filepath in self._recent_files:
+            if filepath not in self._valid_pdf_paths:
                 missing_files.append(filepath)
+                continue
+            directory, name = os.path.split(filepath)
+            files_by_directory.setdefault(directory, []).append((name, filepath))
+
+        for directory, files in files_by_directory.items():
+            try:
+                with os.scandir(directory or ".") as entries:
+                    existing_names = {entry.name for entry in entries if entry.is_file()}
+            except OSError:
+                # ディレクトリ自体が存在しない場合は、配下のファイルをすべて欠落として扱います。
+                existing_names = set()
+            missing_files.extend(filepath for name, filepath in files if name not in existing_names)
 
         for filepath in missing_files:
             self.remove_file_from_recent(filepath)
 
         return len(missing_files)
 
+    def _add_valid_pdf_path(self, filepath: str) -> None:
+        """拡張子が .pdf の場合に、パスを有効な PDF パスの集合へ追加します。"""
+        if filepath.lower().endswith(".pdf"):
+            self._valid_pdf_paths.add(filepath)
+
     @staticmethod
     def _normalize_path(filepath: str | Path) -> str:
         """Normalize file path to avoid circular imports.
@@ -255,4 +430,27 @@ class ApplicationSettings:
         Returns:
             Normalized file path
         """
-        return str(Path(filepath).resolve()).replace("\\", "/")
+        return _resolve_normalized_path(os.fspath(filepath))
+
+
+# アプリケーション全体で共有する設定インスタンスです。
+_settings: ApplicationSettings | None = None
+
+
+def get_settings(settings_file_path: str | None = None) -> ApplicationSettings:
+    """アプリケーション設定のインスタンスを取得します。
+
+    Parameters
+    ----------
+    settings_file_path : str | None
+        設定ファイルのパスです。最初の呼び出しでのみ使用されます。
+
+    Returns
+    -------
+    ApplicationSettings
+        共有された設定インスタンスです。
+    """
+    global _settings
+    if _settings is None:
+        _settings = ApplicationSettings(settings_file_path)
+    return _settings
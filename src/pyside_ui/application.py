@@ -4,11 +4,9 @@
 すべてのコンポーネントを統合して動作を制御します。
 """
 
-import platform
-import subprocess
 import sys
 
-from PySide6.QtCore import QObject
+from PySide6.QtCore import QObject, QTimer
 from PySide6.QtGui import QKeySequence, QShortcut
 from PySide6.QtWidgets import QApplication, QMessageBox
 
@@ -17,7 +15,7 @@ import src.i18n as i18n_module
 
 from ..i18n import set_language
 from ..logger import get_logger
-from ..utils import authors_file_path
+from ..utils import open_authors_file
 from .controllers.pdf_controller import PDFController
 from .controllers.window_controller import WindowController
 from .main_window import MainWindow
@@ -27,6 +25,9 @@ from .viewer import PDFViewer
 
 logger = get_logger(__name__)
 
+# リサイズが止まってから PDF を再表示するまでの待ち時間 (ミリ秒) です。
+RESIZE_REDRAW_DELAY_MS = 120
+
 
 class PDFViewerApplication(QObject):
     """
@@ -65,9 +66,9 @@ class PDFViewerApplication(QObject):
         super().__init__()
 
         # 設定を初期化します。
-        from ..models.settings import ApplicationSettings
+        from ..models.settings import get_settings
 
-        self.settings = ApplicationSettings()
+        self.settings = get_settings()
 
         # Qt アプリケーションのインスタンスを作成します。
         self.app = QApplication.instance() or QApplication(sys.argv)
@@ -91,6 +92,15 @@ class PDFViewerApplication(QObject):
         # ショートカットを保持する属性を初期化します。
         self.copy_shortcut = None
 
+        # コンポーネントの初期化が完了したかどうかです。
+        self._components_ready = False
+
+        # 連続するリサイズ イベントをまとめ、最後のイベントの後に 1 回だけ再表示するタイマーです。
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(RESIZE_REDRAW_DELAY_MS)
+        self._resize_timer.timeout.connect(self._do_resize_redraw)
+
     def _load_translation(self) -> None:
         """
         言語設定が有効であることを確認し、翻訳を読み込みます。
@@ -138,12 +148,19 @@ class PDFViewerApplication(QObject):
     def _initialize_components(self) -> None:
         """
         アプリケーションのコンポーネントを初期化します。
+
+        Notes
+        -----
+        2 回目以降の呼び出しでは、ウィジェットを作り直さずに何もしません。
         """
+        if self._components_ready:
+            return
+
         # メイン ウィンドウを作成します。
         self.main_window = MainWindow()
 
-        # ウィンドウにアプリケーション インスタンスへの参照を設定します。
-        self.main_window.setProperty("app", self)
+        # ウィンドウにアプリケーション インスタンスへの参照を設定します (弱参照で保持されます)。
+        self.main_window.app = self
 
         # コントローラーを初期化します。
         self.pdf_controller = PDFController(self.settings)
@@ -170,6 +187,8 @@ class PDFViewerApplication(QObject):
             )
         )
 
+        self._components_ready = True
+
     def _setup_component_relationships(self) -> None:
         """
         コンポーネント間の関係を設定します。
@@ -186,9 +205,6 @@ class PDFViewerApplication(QObject):
         if self.pdf_viewer:
             self.pdf_viewer.app = self
 
-        # ウィンドウにアプリケーション インスタンスへの参照を設定します。
-        self.main_window.setProperty("app", self)
-
     def _setup_event_handlers(self) -> None:
         """
         イベント ハンドラーを設定します。
@@ -199,8 +215,8 @@ class PDFViewerApplication(QObject):
         # メイン ウィンドウからの PDF ドロップ シグナルを接続します。
         self.main_window.pdf_dropped.connect(self.pdf_controller.load_pdf)
 
-        # ウィンドウ リサイズ イベントを接続します。
-        self.main_window.resizeEvent = self._on_main_window_resize
+        # ウィンドウ リサイズ シグナルを接続します。再表示はタイマーでまとめて行います。
+        self.main_window.resize_signal.connect(self._resize_timer.start)
 
         # ショートカット キーを設定します。
         self.copy_shortcut = QShortcut(QKeySequence("Ctrl+C"), self.main_window)
@@ -210,24 +226,10 @@ class PDFViewerApplication(QObject):
         if self.toolbar is not None and hasattr(self.toolbar, "max_pages_changed"):
             self.toolbar.max_pages_changed.connect(self.pdf_controller.on_max_pages_changed)
 
-    def _on_main_window_resize(self, event) -> None:
+    def _do_resize_redraw(self) -> None:
         """
-        ウィンドウのリサイズ イベントを処理します。
-
-        Parameters
-        ----------
-        event: QResizeEvent
-            リサイズ イベントです。
+        ウィンドウ サイズ変更後に PDF を再表示します。
         """
-        if self.main_window is None:
-            return
-
-        # 元のリサイズ イベントを処理します。
-        from PySide6.QtWidgets import QMainWindow
-
-        QMainWindow.resizeEvent(self.main_window, event)
-
-        # ウィンドウ サイズ変更時に PDF を再表示します。
         if (
             self.pdf_controller
             and self.pdf_viewer
@@ -240,6 +242,7 @@ class PDFViewerApplication(QObject):
                 fit_to_width=True,
                 target_width=target_width,
                 scroll_position=self.pdf_viewer.get_current_state()[0],
+                document=self.pdf_controller.pdf_handler.current_document,
             )
 
     def set_status_message(self, message: str) -> None:
@@ -261,19 +264,26 @@ class PDFViewerApplication(QObject):
         if self.pdf_controller:
             self.pdf_controller.copy_current_pages()
 
+    def copy_image_to_clipboard(self, data: bytes, mime_type: str = "image/png") -> None:
+        """
+        エンコード済みの画像データをクリップボードにコピーします。
+
+        Parameters
+        ----------
+        data: bytes
+            画像のバイト列です。
+        mime_type: str
+            data の MIME タイプです。
+        """
+        if self.pdf_controller:
+            self.pdf_controller.clipboard_manager.copy_image_bytes(data, mime_type)
+
     def _show_authors(self) -> None:
         """
         AUTHORS ファイルをデフォルトのテキスト エディターで開きます。
         """
         try:
-            authors_path = authors_file_path()
-
-            if platform.system() == "Windows":
-                subprocess.run(["notepad.exe", authors_path])
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.run(["open", authors_path])
-            else:  # Linux
-                subprocess.run(["xdg-open", authors_path])
+            open_authors_file()
         except Exception as e:
             if self.main_window is not None:
                 QMessageBox.critical(self.main_window, i18n_module._("Error"), str(e))
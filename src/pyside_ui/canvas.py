@@ -3,44 +3,211 @@
 このモジュールは、PDF ページのレンダリング、スクロール、ズームなどの機能を提供します。
 """
 
+import heapq
+import threading
+from array import array
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Sequence
 from enum import Enum
-from typing import Any
+from functools import lru_cache
 
 import fitz
-from PySide6.QtCore import QObject, QPointF, QRect, QRectF, QRunnable, Qt, QThreadPool, Signal, Slot
-from PySide6.QtGui import QColor, QPainter, QPen
-from PySide6.QtWidgets import QGraphicsScene, QGraphicsView, QMessageBox
+from PySide6.QtCore import QObject, QPointF, QRect, QRectF, QRunnable, Qt, QThread, QThreadPool, QTimer, Signal, Slot
+from PySide6.QtGui import QBrush, QColor, QFontMetricsF, QImage, QPainter, QPen, QPixmap
+from PySide6.QtWidgets import (
+    QGraphicsItem,
+    QGraphicsPixmapItem,
+    QGraphicsRectItem,
+    QGraphicsScene,
+    QGraphicsSimpleTextItem,
+    QGraphicsView,
+    QMessageBox,
+)
 
 from ..config import cache_config, pdf_config, ui_config
 from ..logger import get_logger
-from .services.page_cache import PageCache
+from .services.page_cache import DiskPageCache, PageCache, fitz_pixmap_to_qimage, render_page
 
 logger = get_logger(__name__)
 
+# 表示ページの再計算をまとめる間隔 (ミリ秒) です。スクロール中の連続したイベントを 1 フレーム程度に集約します。
+VISIBLE_PAGES_UPDATE_INTERVAL_MS = 20
+
+# Ctrl + ホイールによるズームが止まってからページを再配置するまでの待ち時間 (ミリ秒) です。
+ZOOM_REBUILD_DELAY_MS = 120
+
+# 先読み範囲の外側で画像をシーンに残しておくページ数です。範囲の境界付近で削除と再追加を繰り返さないようにします。
+CULL_MARGIN_PAGES = 2
+
+# このページ数を超えるドキュメントでは、変更領域の計算を省いてビューポート全体を再描画します。
+FULL_VIEWPORT_UPDATE_PAGE_THRESHOLD = 50
+
+# ページのレンダリングに使うスレッド数の上限と、待機中のスレッドを終了するまでの時間 (ミリ秒) です。
+MAX_RENDER_THREADS = 4
+RENDER_THREAD_EXPIRY_MS = 30000
+
+# QThreadPool の優先度の基準値です。読み込み優先度 (低い値が高優先度) をこの値から引いて渡します。
+RENDER_PRIORITY_BASE = 10
+
+# マウス押下時の処理の振り分けに使う修飾キーです。
+PRESS_DISPATCH_MODIFIERS = Qt.KeyboardModifier.ShiftModifier | Qt.KeyboardModifier.ControlModifier
+
 
 class PageState(Enum):
     """
     PDF ページの状態を表す列挙型です。
     """
 
-    PLACEHOLDER = "placeholder"
-    LOADING = "loading"
-    LOADED = "loaded"
+    # 値はページごとの状態を保持する bytearray にそのまま格納します。
+    PLACEHOLDER = 0
+    LOADING = 1
+    LOADED = 2
+
+
+class PagePlaceholderItem(QGraphicsRectItem):
+    """
+    読み込み前のページを表すプレースホルダーのアイテムです。
+
+    Notes
+    -----
+    再描画が必要な領域 (exposedRect) と重ならない場合は描画を省略します。
+    """
+
+    def __init__(self, rect: QRectF, pen: QPen, brush: QBrush) -> None:
+        """
+        PagePlaceholderItem を初期化します。
+
+        Parameters
+        ----------
+        rect : QRectF
+            ページの矩形です。
+        pen : QPen
+            枠線のペンです。
+        brush : QBrush
+            塗りつぶしのブラシです。
+        """
+        super().__init__(rect)
+        self.setPen(pen)
+        self.setBrush(brush)
+        # exposedRect に実際の再描画領域が設定されるようにします。
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemUsesExtendedStyleOption, True)
+
+    def paint(self, painter, option, widget=None) -> None:
+        """
+        再描画領域と重なる場合だけプレースホルダーを描画します。
+        """
+        if not option.exposedRect.intersects(self.boundingRect()):
+            return
+        super().paint(painter, option, widget)
 
 
 class PageLoadSignal(QObject):
     """ページ読み込みのシグナルを提供するクラスです。"""
 
-    load_page = Signal(int, bool)
+    # (ドキュメントの世代、ページ番号、スケール、QImage または None) です。スケールはデバイス ピクセル比を含みません。
+    page_rendered = Signal(int, int, float, object)
+
+
+def visible_page(tops: Sequence[float], bottoms: Sequence[float], top: float, bottom: float) -> int:
+    """
+    表示領域に表示されているページのうち、最大のページ番号を求めます。
+
+    Parameters
+    ----------
+    tops : Sequence[float]
+        各ページの上端の y 座標です。ページは上から順に並ぶため昇順です。
+    bottoms : Sequence[float]
+        各ページの下端の y 座標です。tops と同様に昇順です。
+    top : float
+        表示領域の上端の y 座標です。
+    bottom : float
+        表示領域の下端の y 座標です。
+
+    Returns
+    -------
+    int
+        表示されているページ番号 (0 ベース) です。ページ間の隙間だけが表示されている場合は、
+        表示領域の中心に最も近いページです。ページがない場合は 0 です。
+
+    Notes
+    -----
+    表示領域の端とページの端が接しているだけの場合は、そのページは表示されていないとみなします。
+    """
+    # 上端が表示領域の下端より上にあるページのうち、最後のページを二分探索で求めます。
+    last = bisect_left(tops, bottom) - 1
+
+    # そのページの下端が表示領域の上端より下にあれば、表示されている最大のページ番号です。
+    if last >= 0 and bottoms[last] > top:
+        return last
+
+    # 見つからない場合は、表示領域を挟む 2 ページのうち中心が最も近いページを返します。
+    # 候補は 2 ページだけなので、リストを作らずに直接比較します。中心は 2 倍した値で比較します。
+    if last < 0:
+        return 0
+    following = last + 1
+    if following >= len(tops):
+        return last
+    center_2 = top + bottom
+    last_distance = abs(center_2 - tops[last] - bottoms[last])
+    following_distance = abs(center_2 - tops[following] - bottoms[following])
+    return following if following_distance < last_distance else last
+
+
+def _shrink_mupdf_store(percent: int) -> None:
+    """
+    MuPDF の内部ストア (デコード済みの画像やフォントのキャッシュ) を縮小します。
+
+    Parameters
+    ----------
+    percent : int
+        解放する割合 (%) です。100 以上の場合はストアを空にします。
+
+    Notes
+    -----
+    MuPDF のストアは自動では縮小しないため、大きなスキャン PDF を閲覧し続けるとメモリ使用量が増え続けます。
+    """
+    try:
+        fitz.TOOLS.store_shrink(percent)
+    except Exception as e:
+        logger.debug(f"MuPDF のストアの縮小に失敗しました: {e}")
+
 
+# ワーカー スレッドごとに開いた PDF ドキュメントです。MuPDF のドキュメントはスレッド間で共有しません。
+_thread_local = threading.local()
 
-# グローバルシグナルオブジェクトです。
-page_load_signal = PageLoadSignal()
+
+def _get_thread_document(doc_path: str, generation: int) -> fitz.Document:
+    """
+    現在のスレッド専用の PDF ドキュメントを取得します。
+
+    Parameters
+    ----------
+    doc_path : str
+        PDF ファイルのパスです。
+    generation : int
+        ドキュメントの世代です。世代が変わった場合は開き直します。
+
+    Returns
+    -------
+    fitz.Document
+        現在のスレッドで開いた PDF ドキュメントです。
+    """
+    key = (doc_path, generation)
+    if getattr(_thread_local, "key", None) != key:
+        document = getattr(_thread_local, "document", None)
+        if document is not None:
+            document.close()
+        _thread_local.document = None
+        _thread_local.key = None
+        _thread_local.document = fitz.open(doc_path)
+        _thread_local.key = key
+    return _thread_local.document
 
 
 class PageLoaderRunnable(QRunnable):
     """
-    PDF ページの読み込みを行うバックグラウンド タスクです。
+    PDF ページのレンダリングを行うバックグラウンド タスクです。
 
     Attributes
     ----------
@@ -50,7 +217,17 @@ class PageLoaderRunnable(QRunnable):
         読み込み優先度です (低い値が高優先度)。
     """
 
-    def __init__(self, page_num: int, priority: int):
+    def __init__(
+        self,
+        page_num: int,
+        priority: int,
+        doc_path: str,
+        generation: int,
+        scale_factor: float,
+        device_pixel_ratio: float,
+        signal: PageLoadSignal,
+        disk_cache: DiskPageCache | None = None,
+    ):
         """
         PageLoaderRunnable を初期化します。
 
@@ -60,21 +237,64 @@ class PageLoaderRunnable(QRunnable):
             読み込むページ番号です。
         priority : int
             読み込み優先度です (低い値が高優先度)。
+        doc_path : str
+            PDF ファイルのパスです。
+        generation : int
+            依頼元のドキュメントの世代です。
+        scale_factor : float
+            レンダリングするスケールです (論理ピクセル)。
+        device_pixel_ratio : float
+            表示先のデバイス ピクセル比です。実際のラスタはスケールにこの値を掛けた解像度になります。
+        signal : PageLoadSignal
+            レンダリング結果を通知するシグナルです。
+        disk_cache : DiskPageCache | None
+            レンダリング済みのページを読み書きするディスク キャッシュです。None の場合は使用しません。
         """
         super().__init__()
         self.page_num = page_num
         self.priority = priority
+        self.doc_path = doc_path
+        self.generation = generation
+        self.scale_factor = scale_factor
+        self.device_pixel_ratio = device_pixel_ratio
+        self.signal = signal
+        self.disk_cache = disk_cache
         self.setAutoDelete(True)
 
     def run(self):
         """
         タスクを実行します。
+
+        Notes
+        -----
+        QPixmap はメインスレッドでしか扱えないため、ここでは QImage まで作成して通知します。
+        レンダリングに失敗した場合は None を通知し、メインスレッドでのレンダリングに任せます。
+        ディスク キャッシュへの書き込みは、ページの表示を待たせないように通知の後に行います。
         """
+        image = None
+        pix = None
+        render_scale = self.scale_factor * self.device_pixel_ratio
+        disk_cache = self.disk_cache
         try:
-            # メインスレッドでレンダリングを実行するためにシグナル経由で呼び出します。
-            page_load_signal.load_page.emit(self.page_num, False)
+            if disk_cache is not None:
+                image = disk_cache.load_image(self.doc_path, self.page_num, render_scale)
+            if image is None:
+                document = _get_thread_document(self.doc_path, self.generation)
+                page = document.load_page(self.page_num)
+                pix = render_page(page, render_scale)
+                image = fitz_pixmap_to_qimage(pix)
+                # ページはすぐに解放します。ピクセル マップはディスク キャッシュに書き込むまで保持します。
+                page = None
+            image.setDevicePixelRatio(self.device_pixel_ratio)
         except Exception as e:
-            logger.exception(f"ページローダーの実行中にエラーが発生しました: {e}")
+            logger.warning(f"ページ {self.page_num} のバックグラウンド レンダリングに失敗しました: {e}")
+        self.signal.page_rendered.emit(self.generation, self.page_num, self.scale_factor, image)
+
+        if pix is not None and image is not None and disk_cache is not None:
+            try:
+                disk_cache.store(self.doc_path, self.page_num, render_scale, pix)
+            except Exception as e:
+                logger.warning(f"ページ {self.page_num} のディスク キャッシュへの保存に失敗しました: {e}")
 
 
 class PDFGraphicsView(QGraphicsView):
@@ -94,12 +314,6 @@ class PDFGraphicsView(QGraphicsView):
     ----------
     scale_factor : float
         現在のズームスケールです。
-    page_items : Dict[int, Dict[str, QGraphicsItem]]
-        各ページの表示アイテムです。
-    page_positions : Dict[int, Tuple[int, int, int, int]]
-        各ページの位置情報です。
-    page_states : Dict[int, PageState]
-        各ページの状態です。
     current_document : Optional[fitz.Document]
         現在開いている PDF ドキュメントです。
     current_visible_page : int
@@ -132,6 +346,8 @@ class PDFGraphicsView(QGraphicsView):
 
         # シーンの余白も削除します。
         scene.setSceneRect(scene.itemsBoundingRect())
+        # ページは縦一列に並び、表示ページは二分探索で求めるため、BSP インデックスは使いません。
+        scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
 
         # 背景を透明にします。
         self.setBackgroundBrush(Qt.GlobalColor.transparent)
@@ -148,26 +364,43 @@ class PDFGraphicsView(QGraphicsView):
         # スケール ファクターを設定します。
         self.scale_factor = pdf_config.DEFAULT_ZOOM_SCALE
 
-        # ページアイテムを管理します。
-        self.page_items: dict[
-            int, dict[str, Any]
-        ] = {}  # {page_num: {"placeholder": QGraphicsRectItem, "text": QGraphicsTextItem,
-        #             "image": QGraphicsPixmapItem}} の形式です。
-        self.page_positions: dict[int, tuple[int, int, int, int]] = {}  # {page_num: (x, y, width, height)} の形式です。
-        self.page_states: dict[int, PageState] = {}  # {page_num: PageState} の形式です。
+        # ページごとの表示アイテム、位置、状態は、ページ番号を添字とする並列配列で管理します。
+        self._reset_page_arrays()
+        # プレースホルダーの描画に使うオブジェクトです。すべてのページで共有し、ページごとに作成しません。
+        self._placeholder_pen = QPen(Qt.GlobalColor.gray)
+        self._placeholder_brush = QBrush(QColor(cache_config.PLACEHOLDER_COLOR))
+        self._placeholder_text_brush = QBrush(Qt.GlobalColor.gray)
+        # ページ番号の文字列はすべて同じフォントのため、配置はフォント メトリクスから計算します。
+        self._placeholder_font_metrics = QFontMetricsF(scene.font())
+        # 画像をシーンに表示しているページです。範囲外の画像を削除するときに全ページを走査しないように保持します。
+        self._loaded_pages: set[int] = set()
 
         # 現在のドキュメントを設定します。
         self.current_document: fitz.Document | None = None
+        # 現在のドキュメントのパスです。fitz.Document.name は参照のたびに文字列を作成するため、1 回だけ取得します。
+        self._doc_path = ""
+        # 各ページの (幅、高さ) です (スケール適用前)。ズームのたびにページを読み込み直さないように保持します。
+        self._page_rects: list[tuple[float, float]] = []
 
         # 現在表示中のページを設定します。
         self.current_visible_page = -1
 
         # ページキャッシュを設定します。
         self.page_cache = PageCache()
+        # 使用したページ画像の LRU です。キーは (ドキュメント パス、ページ番号、レンダリング スケール) です。
+        # 上限を超えたものはキャッシュから削除し、表示範囲外であればシーンからも外してメモリを解放します。
+        self._lru: OrderedDict[tuple[str, int, float], None] = OrderedDict()
+        # 最後に MuPDF のストアを縮小してから LRU が削除したページ画像の数です。
+        self._evictions_since_store_shrink = 0
 
         # 読み込みキューとスレッドプールを設定します。
-        self.loading_queue: list[tuple[int, int]] = []  # [(priority, page_num), ...] の形式です。
-        self.thread_pool = QThreadPool.globalInstance()
+        self.loading_queue: list[tuple[int, int]] = []  # [(priority, page_num), ...] のヒープです。
+        # 読み込みを依頼済みで、まだ render_pdf_page が実行されていないページです。
+        self._in_flight: set[int] = set()
+        # Qt 全体で共有するグローバル プールではなく、レンダリング専用のプールを使用します。
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(min(MAX_RENDER_THREADS, QThread.idealThreadCount()))
+        self.thread_pool.setExpiryTimeout(RENDER_THREAD_EXPIRY_MS)
 
         # レンダリングを設定します。
         self.setRenderHint(QPainter.RenderHint.Antialiasing)
@@ -176,6 +409,18 @@ class PDFGraphicsView(QGraphicsView):
         self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontSavePainterState, True)
         self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.MinimalViewportUpdate)
 
+        # 表示ページの再計算を遅延させるタイマーです。連続した呼び出しは 1 回にまとめられます。
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(VISIBLE_PAGES_UPDATE_INTERVAL_MS)
+        self._update_timer.timeout.connect(self._do_update_visible_pages)
+
+        # ズーム後のページ再配置を遅延させるタイマーです。ズーム中はビューの変換行列だけで拡大縮小します。
+        self._zoom_rebuild_timer = QTimer(self)
+        self._zoom_rebuild_timer.setSingleShot(True)
+        self._zoom_rebuild_timer.setInterval(ZOOM_REBUILD_DELAY_MS)
+        self._zoom_rebuild_timer.timeout.connect(self._rebuild_after_zoom)
+
         # スクロールバーの処理を設定します。
         self.verticalScrollBar().valueChanged.connect(self._on_vertical_scroll)
 
@@ -188,8 +433,31 @@ class PDFGraphicsView(QGraphicsView):
         self._is_selecting = False
         self._drag_start_point = None
 
-        # グローバルページロードシグナルとスロットを接続します。
-        page_load_signal.load_page.connect(self.render_pdf_page)
+        # マウス ボタンと修飾キー (Shift と Ctrl のみ) の組み合わせから、押下時の処理を引く表です。
+        left = Qt.MouseButton.LeftButton
+        right = Qt.MouseButton.RightButton
+        no_modifier = Qt.KeyboardModifier.NoModifier
+        shift = Qt.KeyboardModifier.ShiftModifier
+        control = Qt.KeyboardModifier.ControlModifier
+        self._press_dispatch = {
+            # 左クリック: スクロール、Shift + 左ドラッグ: 領域選択、Ctrl + 左クリック: PDF コピーです。
+            (left, no_modifier): self._press_scroll,
+            (left, shift): self._press_select,
+            (left, shift | control): self._press_select,
+            (left, control): self._press_copy,
+            # 右クリック: PDF コピー、Shift + 右ドラッグ: 領域選択です。
+            (right, no_modifier): self._press_copy,
+            (right, control): self._press_copy,
+            (right, shift): self._press_select,
+            (right, shift | control): self._press_select,
+        }
+
+        # バックグラウンド レンダリングの結果を受け取るシグナルを接続します。
+        # ワーカー スレッドから発行されるため、スロットはメインスレッドで実行されます。
+        self._load_signal = PageLoadSignal()
+        self._load_signal.page_rendered.connect(self._on_page_rendered)
+        # ドキュメントを設定するたびに増える世代番号です。古い依頼の結果を破棄するために使います。
+        self._document_generation = 0
 
     def set_document(self, document: fitz.Document) -> None:
         """
@@ -199,8 +467,30 @@ class PDFGraphicsView(QGraphicsView):
         ----------
         document : fitz.Document
             表示する PDF ドキュメントです。
+
+        Notes
+        -----
+        表示中と同じドキュメントを指定した場合 (ウィンドウのリサイズ後の再表示など) は、世代を進めず、
+        MuPDF のストアやページ サイズも保持したまま、_rebuild_after_zoom と同様に現在のスケールで配置し直します。
+        ワーカー スレッドが開いたドキュメントもそのまま再利用されます。
         """
+        if document is self.current_document:
+            self.clear_scene()
+            self.current_visible_page = -1
+            self._create_all_placeholders()
+            self.update_visible_pages()
+            return
+
         self.current_document = document
+        self._doc_path = document.name
+        self._document_generation += 1
+        # 前のドキュメントのデコード済みデータは不要なため、MuPDF のストアを空にします。
+        _shrink_mupdf_store(100)
+        self._evictions_since_store_shrink = 0
+        # ページ サイズはドキュメントを開いたときに 1 回だけ取得します。
+        self._page_rects = []
+        for page in document:
+            self._page_rects.append((page.rect.width, page.rect.height))
         self.clear_scene()
         # 新規ドキュメントでは表示ページをリセットします。
         self.current_visible_page = -1
@@ -211,6 +501,38 @@ class PDFGraphicsView(QGraphicsView):
         # 表示領域のページを優先的に読み込みます。
         self.update_visible_pages()
 
+    def _reset_page_arrays(self) -> None:
+        """
+        ページごとの表示アイテム、位置、状態の配列を空にします。
+        """
+        self._placeholders: list[PagePlaceholderItem | None] = []
+        self._texts: list[QGraphicsSimpleTextItem | None] = []
+        self._images: list[QGraphicsPixmapItem | None] = []
+        # ページは上から順に配置されるため、上端 (_pos_y) と下端 (_page_y_ends) は昇順になり、二分探索に使えます。
+        self._pos_x = array("i")
+        self._pos_y = array("i")
+        self._pos_w = array("i")
+        self._pos_h = array("i")
+        self._page_y_ends = array("i")
+        # PageState の値です。
+        self._states = bytearray()
+
+    def _has_page(self, page_num: int) -> bool:
+        """
+        ページ番号が配置済みのページを指しているかどうかを返します。
+
+        Parameters
+        ----------
+        page_num : int
+            確認するページ番号です。
+
+        Returns
+        -------
+        bool
+            配置済みのページであれば True です。
+        """
+        return 0 <= page_num < len(self._states)
+
     def clear_scene(self) -> None:
         """
         シーンの内容をクリアします。
@@ -218,10 +540,10 @@ class PDFGraphicsView(QGraphicsView):
         current_scene = self.scene()
         if current_scene:
             current_scene.clear()
-        self.page_items.clear()
-        self.page_states.clear()
-        self.page_positions.clear()
+        self._reset_page_arrays()
+        self._loaded_pages.clear()
         self.loading_queue.clear()
+        self._in_flight.clear()
 
     def _create_all_placeholders(self) -> None:
         """
@@ -229,42 +551,84 @@ class PDFGraphicsView(QGraphicsView):
         """
         if not self.current_document:
             return
+        page_count = len(self._page_rects)
+        self._placeholders = [None] * page_count
+        self._texts = [None] * page_count
+        self._images = [None] * page_count
+        self._states = bytearray([PageState.PLACEHOLDER.value]) * page_count
+
+        # アイテムの追加中はシーンのシグナルを止め、変更通知をページごとに発行しないようにします。
+        current_scene = self.scene()
+        if current_scene:
+            current_scene.blockSignals(True)
         y_offset = 0
-        for page_num in range(self.current_document.page_count):
-            page = self.current_document.load_page(page_num)
-            width, height = self.get_page_dimensions(page)
-            # 左端 (x=0) からページを配置します。
-            x = 0
-            y = y_offset + ui_config.PAGE_PADDING
-            current_scene = self.scene()
+        max_width = 0
+        try:
+            for page_num, (page_width, page_height) in enumerate(self._page_rects):
+                width = int(page_width * self.scale_factor)
+                height = int(page_height * self.scale_factor)
+                # 左端 (x=0) からページを配置します。
+                y = y_offset + ui_config.PAGE_PADDING
+                self._pos_x.append(0)
+                self._pos_y.append(y)
+                self._pos_w.append(width)
+                self._pos_h.append(height)
+                self._page_y_ends.append(y + height)
+                self._add_placeholder_items(page_num)
+                y_offset += height + (ui_config.PAGE_PADDING * 2)
+                max_width = max(max_width, width)
+        finally:
             if current_scene:
-                placeholder = current_scene.addRect(
-                    QRectF(x, y, width, height), QPen(Qt.GlobalColor.gray), QColor(cache_config.PLACEHOLDER_COLOR)
-                )
-                text_item = current_scene.addText(f"Page {page_num + 1}")
-                text_item.setDefaultTextColor(Qt.GlobalColor.gray)
-                text_pos = QPointF(
-                    x + width / 2 - text_item.boundingRect().width() / 2,
-                    y + height / 2 - text_item.boundingRect().height() / 2,
-                )
-                text_item.setPos(text_pos)
-            else:
-                placeholder = None
-                text_item = None
-            self.page_items[page_num] = {"placeholder": placeholder, "text": text_item, "image": None}
-            self.page_positions[page_num] = (x, y, width, height)
-            self.page_states[page_num] = PageState.PLACEHOLDER
-            y_offset += height + (ui_config.PAGE_PADDING * 2)
-
-        # シーンの範囲を設定します（余白なし）。
+                current_scene.blockSignals(False)
+
+        # シーンの範囲は、アイテムを走査せずにページの配置から計算します。
+        if current_scene:
+            current_scene.setSceneRect(QRectF(0, 0, max_width, y_offset))
+
+        # アイテムが多い場合は、アイテムごとの変更領域の計算よりビューポート全体の再描画の方が速くなります。
+        if page_count > FULL_VIEWPORT_UPDATE_PAGE_THRESHOLD:
+            self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.FullViewportUpdate)
+        else:
+            self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.MinimalViewportUpdate)
+
+    def _add_placeholder_items(self, page_num: int) -> None:
+        """
+        ページのプレースホルダーとページ番号の表示アイテムをシーンに追加します。
+
+        Parameters
+        ----------
+        page_num : int
+            プレースホルダーを追加するページ番号です。
+        """
+        x = self._pos_x[page_num]
+        y = self._pos_y[page_num]
+        width = self._pos_w[page_num]
+        height = self._pos_h[page_num]
         current_scene = self.scene()
         if current_scene:
-            current_scene.setSceneRect(current_scene.itemsBoundingRect())
+            placeholder = PagePlaceholderItem(
+                QRectF(x, y, width, height), self._placeholder_pen, self._placeholder_brush
+            )
+            current_scene.addItem(placeholder)
+            # QGraphicsTextItem と異なり、テキスト ドキュメントを持たない軽量なアイテムを使用します。
+            text = f"Page {page_num + 1}"
+            text_item = current_scene.addSimpleText(text)
+            text_item.setBrush(self._placeholder_text_brush)
+            text_pos = QPointF(
+                x + width / 2 - self._placeholder_font_metrics.horizontalAdvance(text) / 2,
+                y + height / 2 - self._placeholder_font_metrics.height() / 2,
+            )
+            text_item.setPos(text_pos)
+        else:
+            placeholder = None
+            text_item = None
+        self._placeholders[page_num] = placeholder
+        self._texts[page_num] = text_item
+        self._images[page_num] = None
 
-    @Slot(int, bool)
     def render_pdf_page(self, page_num: int, force_reload: bool = False) -> None:
         """
-        PDF ページをレンダリングします。
+        PDF ページをメインスレッドでレンダリングします。
 
         Parameters
         ----------
@@ -273,58 +637,198 @@ class PDFGraphicsView(QGraphicsView):
         force_reload : bool
             強制的に再読み込みを行うかどうかです。
         """
-        if not self.current_document or page_num not in self.page_positions:
+        if not self.current_document or not self._has_page(page_num):
             return
 
         # すでに読み込み済みで強制再読み込みでない場合は何もしません。
-        if self.page_states.get(page_num) == PageState.LOADED and not force_reload:
+        if self._states[page_num] == PageState.LOADED.value and not force_reload:
             return
 
         # ページの状態を更新します。
-        self.page_states[page_num] = PageState.LOADING
+        self._states[page_num] = PageState.LOADING.value
 
         try:
-            # ページを取得します。
-            page = self.current_document.load_page(page_num)
-
-            # ページの位置情報を取得します。
-            x, y, width, height = self.page_positions[page_num]
-
             # キャッシュから画像を取得します。
-            doc_path = self.current_document.name
-            pixmap = self.page_cache.get_page_image(doc_path, page_num, self.scale_factor)
+            doc_path = self._doc_path
+            image = self.page_cache.get_page_image(doc_path, page_num, self._render_scale())
 
-            if pixmap is None:
+            if image is None:
                 # キャッシュにない場合は新たにレンダリングを行います。
-                pixmap = self.page_cache.cache_page(doc_path, page_num, page, self.scale_factor)
-
-            # プレースホルダーと既存の画像を削除します
-            current_scene = self.scene()
-            if current_scene and page_num in self.page_items:
-                if self.page_items[page_num]["placeholder"]:
-                    current_scene.removeItem(self.page_items[page_num]["placeholder"])
-                if self.page_items[page_num]["text"]:
-                    current_scene.removeItem(self.page_items[page_num]["text"])
-                if self.page_items[page_num]["image"]:
-                    current_scene.removeItem(self.page_items[page_num]["image"])
-
-            # 新しい画像アイテムを作成します。
-            pixmap_item = None
-            if current_scene:
-                pixmap_item = current_scene.addPixmap(pixmap)
-                pixmap_item.setPos(x, y)
-
-            # アイテム参照を更新します
-            self.page_items[page_num] = {"placeholder": None, "text": None, "image": pixmap_item}
+                page = self.current_document.load_page(page_num)
+                image = self.page_cache.cache_page(
+                    doc_path, page_num, page, self.scale_factor, self.devicePixelRatioF()
+                )
 
-            # ページの状態を更新します。
-            self.page_states[page_num] = PageState.LOADED
+            self._show_page_pixmap(page_num, QPixmap.fromImage(image))
 
         except Exception as e:
             logger.exception(f"ページ {page_num} のレンダリングに失敗しました: {e}")
             QMessageBox.critical(self, "Error", str(e))
             # エラーが発生した場合はプレースホルダーのままにします
-            self.page_states[page_num] = PageState.PLACEHOLDER
+            self._states[page_num] = PageState.PLACEHOLDER.value
+
+    @Slot(int, int, float, object)
+    def _on_page_rendered(self, generation: int, page_num: int, scale_factor: float, image: QImage | None) -> None:
+        """
+        バックグラウンドでレンダリングされたページを表示します。
+
+        Parameters
+        ----------
+        generation : int
+            依頼時のドキュメントの世代です。
+        page_num : int
+            レンダリングされたページ番号です。
+        scale_factor : float
+            レンダリング時のスケールです。
+        image : QImage | None
+            レンダリング結果です。失敗した場合は None です。
+        """
+        if generation != self._document_generation:
+            # 別のドキュメントに切り替わった後に届いた結果は破棄します。
+            return
+
+        # 依頼済みの読み込みが届いたので、再び依頼できるようにします。
+        self._in_flight.discard(page_num)
+
+        if scale_factor != self.scale_factor or not self._has_page(page_num):
+            # ズームが変更された後に届いた結果は破棄します。必要なページは再配置後に依頼し直されます。
+            return
+        if self._states[page_num] == PageState.LOADED.value:
+            return
+
+        if image is None:
+            # バックグラウンドで開けないドキュメント (メモリ上のドキュメントなど) はメインスレッドでレンダリングします。
+            self.render_pdf_page(page_num)
+            return
+
+        render_scale = scale_factor * image.devicePixelRatio()
+        self.page_cache.put_image(self._doc_path, page_num, render_scale, image)
+        self._show_page_pixmap(page_num, QPixmap.fromImage(image))
+
+    def _show_page_pixmap(self, page_num: int, pixmap: QPixmap, preview: bool = False) -> None:
+        """
+        ページのプレースホルダーを画像に置き換えます。
+
+        Parameters
+        ----------
+        page_num : int
+            表示するページ番号です。
+        pixmap : QPixmap
+            表示するページ画像です。
+        preview : bool
+            True の場合、正しいスケールの画像が届くまでの仮の画像として表示します。
+            ページは読み込み中のままとなり、届いた画像で置き換えられます。
+        """
+        self._touch_lru(self._doc_path, page_num)
+
+        # プレースホルダーと既存の画像を削除します
+        current_scene = self.scene()
+        if current_scene:
+            for item in (self._placeholders[page_num], self._texts[page_num], self._images[page_num]):
+                if item:
+                    current_scene.removeItem(item)
+
+        # 新しい画像アイテムを作成します。
+        pixmap_item = None
+        if current_scene:
+            pixmap_item = current_scene.addPixmap(pixmap)
+            pixmap_item.setPos(self._pos_x[page_num], self._pos_y[page_num])
+
+        # アイテム参照を更新します
+        self._placeholders[page_num] = None
+        self._texts[page_num] = None
+        self._images[page_num] = pixmap_item
+
+        # ページの状態を更新します。
+        self._states[page_num] = PageState.LOADING.value if preview else PageState.LOADED.value
+        self._loaded_pages.add(page_num)
+
+    def _touch_lru(self, doc_path: str, page_num: int) -> None:
+        """
+        ページ画像を LRU の最新に移動し、上限を超えた古いページ画像を解放します。
+
+        Parameters
+        ----------
+        doc_path : str
+            ドキュメントのパスです。
+        page_num : int
+            使用したページ番号です。
+        """
+        render_scale = self._render_scale()
+        key = (doc_path, page_num, render_scale)
+        self._lru[key] = None
+        self._lru.move_to_end(key)
+
+        while len(self._lru) > cache_config.MAX_CACHED_PAGES:
+            old_doc_path, old_page_num, old_scale = self._lru.popitem(last=False)[0]
+            self.page_cache.evict(old_doc_path, old_page_num, old_scale)
+            self._evictions_since_store_shrink += 1
+
+            # 現在のシーンに表示中の画像であっても、表示範囲外であればプレースホルダーに戻します。
+            if (
+                old_doc_path == doc_path
+                and old_scale == render_scale
+                and self._has_page(old_page_num)
+                and self._states[old_page_num] == PageState.LOADED.value
+                and abs(old_page_num - self.current_visible_page) > cache_config.PRELOAD_RANGE
+            ):
+                self._release_page_image(old_page_num)
+
+        # 一定数のページ画像を削除するたびに、MuPDF のストアも縮小します。
+        if self._evictions_since_store_shrink >= cache_config.MUPDF_STORE_SHRINK_INTERVAL:
+            _shrink_mupdf_store(cache_config.MUPDF_STORE_SHRINK_PERCENT)
+            self._evictions_since_store_shrink = 0
+
+    def _release_page_image(self, page_num: int) -> None:
+        """
+        ページ画像をシーンから削除し、プレースホルダーに戻します。
+
+        Parameters
+        ----------
+        page_num : int
+            画像を解放するページ番号です。
+        """
+        image_item = self._images[page_num]
+        current_scene = self.scene()
+        if current_scene and image_item:
+            current_scene.removeItem(image_item)
+        self._add_placeholder_items(page_num)
+        self._states[page_num] = PageState.PLACEHOLDER.value
+        self._loaded_pages.discard(page_num)
+
+    def _cull_offscreen_pages(self, visible_page: int) -> None:
+        """
+        表示ページから離れたページの画像をシーンから削除し、プレースホルダーに戻します。
+
+        Parameters
+        ----------
+        visible_page : int
+            現在表示中のページ番号です。
+
+        Notes
+        -----
+        シーンに残る画像を先読み範囲の周辺に限定し、ページ数に関係なく描画とシーン インデックスの
+        コストを一定に保ちます。画像はページ キャッシュに残るため、再び表示するときはレンダリングしません。
+        """
+        keep_range = cache_config.PRELOAD_RANGE + CULL_MARGIN_PAGES
+        for page_num in [p for p in self._loaded_pages if abs(p - visible_page) > keep_range]:
+            self._release_page_image(page_num)
+
+    def _render_scale(self) -> float:
+        """
+        ページをラスタライズするスケールを返します。
+
+        Returns
+        -------
+        float
+            ズームスケールにデバイス ピクセル比を掛けた値です。
+
+        Notes
+        -----
+        ページの配置は論理ピクセル (scale_factor) で行い、画像だけをこのスケールでレンダリングして
+        デバイス ピクセル比を設定します。HiDPI 画面でも Qt による再拡大が発生しません。
+        """
+        return self.scale_factor * self.devicePixelRatioF()
 
     def set_zoom_scale(self, scale_factor: float) -> None:
         """
@@ -376,13 +880,41 @@ class PDFGraphicsView(QGraphicsView):
         float
             計算されたスケールです。
         """
-        if page.rect.width <= 0 or target_width <= 1:
+        if target_width <= 1:
             return pdf_config.DEFAULT_ZOOM_SCALE
 
         # viewport の幅を使用します（すでにスクロールバーは除外されています）。
-        available_width = self.viewport().width()
-        calculated_scale = available_width / page.rect.width
-        return calculated_scale if calculated_scale > 0 else pdf_config.DEFAULT_ZOOM_SCALE
+        return self._scale_for_width(page.rect.width, self.viewport().width(), pdf_config.DEFAULT_ZOOM_SCALE)
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _scale_for_width(page_width: float, viewport_width: int, default_scale: float) -> float:
+        """
+        ページ幅をビューポートの幅に合わせるスケールを計算します。
+
+        Parameters
+        ----------
+        page_width : float
+            ページの幅 (スケール適用前) です。
+        viewport_width : int
+            ビューポートの幅です。
+        default_scale : float
+            スケールを計算できない場合に返すスケールです。
+
+        Returns
+        -------
+        float
+            計算されたスケールです。
+
+        Notes
+        -----
+        ページ サイズの種類は少ないため、(ページ幅、ビューポートの幅) ごとに結果をメモ化します。
+        キーにビューポートの幅を含むため、リサイズ時にキャッシュを消去する必要はありません。
+        """
+        if page_width <= 0:
+            return default_scale
+        calculated_scale = viewport_width / page_width
+        return calculated_scale if calculated_scale > 0 else default_scale
 
     def calculate_visible_page(self) -> int:
         """
@@ -394,92 +926,127 @@ class PDFGraphicsView(QGraphicsView):
         int
             現在表示中のページ番号（0ベース）です。
         """
-        if not self.current_document or not self.page_positions:
+        if not self.current_document or not self._states:
             return 0
 
         # ビューポートの表示領域
         viewport_rect = self.viewport().rect()
         scene_rect = self.mapToScene(viewport_rect).boundingRect()
+        return visible_page(self._pos_y, self._page_y_ends, scene_rect.top(), scene_rect.bottom())
 
-        # 表示領域内に存在するページを探します。
-        visible_pages = []
-
-        for page_num, (x, y, width, height) in self.page_positions.items():
-            page_rect = QRectF(x, y, width, height)
-
-            # ページが表示領域と重なっているかどうかを確認します。
-            if scene_rect.intersects(page_rect):
-                visible_pages.append(page_num)
-
-        if visible_pages:
-            # 表示されているページのうち最大のページ番号を返します。
-            return max(visible_pages)
-
-        # 見つからない場合は最も近いページを返します。
-        closest_page = 0
-        min_distance = float("inf")
-
-        scene_center = scene_rect.center().y()
-
-        for page_num, (_x, y, _width, height) in self.page_positions.items():
-            page_center = y + height / 2
-            distance = abs(scene_center - page_center)
-
-            if distance < min_distance:
-                min_distance = distance
-                closest_page = page_num
+    def update_visible_pages(self) -> None:
+        """
+        表示ページの再計算を予約します。
 
-        return closest_page
+        Notes
+        -----
+        スクロールやリサイズで連続して呼び出されても、再計算は VISIBLE_PAGES_UPDATE_INTERVAL_MS ごとに
+        1 回だけ行われます。予約済みの場合はタイマーを再始動しないため、スクロールが続いている間も
+        一定の間隔でページが読み込まれます。
+        """
+        if not self._update_timer.isActive():
+            self._update_timer.start()
 
-    def update_visible_pages(self) -> None:
+    def _do_update_visible_pages(self) -> None:
         """
         現在表示中のページとその周辺ページを優先的に読み込みます。
+
+        Notes
+        -----
+        ズーム操作中 (ページの再配置を待っている間) は、ページの位置が新しいスケールと一致しないため
+        読み込みを行いません。再配置の完了後に改めて呼び出されます。
         """
-        if not self.current_document:
+        if not self.current_document or self._zoom_rebuild_timer.isActive():
             return
 
         # 現在表示中のページを特定します
         visible_page = self.calculate_visible_page()
 
         # ページが変化した場合やまだ読み込まれていない場合に処理を行います
-        if visible_page != self.current_visible_page or self.page_states.get(visible_page) != PageState.LOADED:
+        if visible_page != self.current_visible_page or self._states[visible_page] != PageState.LOADED.value:
             # 表示ページ変更シグナルを発行します
             if visible_page != self.current_visible_page:
                 self.visible_page_changed.emit(visible_page)
                 self.current_visible_page = visible_page
-
-            # 読み込みキューをクリアします
-            self.loading_queue.clear()
+                self._cull_offscreen_pages(visible_page)
+                # まだ開始していない古い周辺ページの読み込みは破棄し、新しい表示範囲から依頼し直します。
+                # 実行中のタスクの結果は届きますが、読み込み済みのページでは無視されます。
+                self.thread_pool.clear()
+                self._in_flight.clear()
 
             # 優先度付きで読み込みキューに追加します
             # 1. 現在表示中のページ (優先度 0)
-            if self.page_states.get(visible_page) != PageState.LOADED:
-                self.loading_queue.append((0, visible_page))
+            self._enqueue_page(0, visible_page)
 
             # 2. 前後のページ (優先度 1)
             preload_range = cache_config.PRELOAD_RANGE
+            page_count = len(self._states)
             for offset in range(-preload_range, preload_range + 1):
                 if offset == 0:  # 現在のページは既に追加済みです。
                     continue
 
                 page_num = visible_page + offset
-                if 0 <= page_num < self.current_document.page_count:
-                    if self.page_states.get(page_num) != PageState.LOADED:
-                        self.loading_queue.append((1, page_num))
+                if 0 <= page_num < page_count:
+                    self._enqueue_page(1, page_num)
+
+            # 優先度の高い順にページを読み込みます。キャッシュにないページはバックグラウンドでレンダリングします。
+            # ループ内で変わらない値はローカル変数に束縛しておきます。
+            doc_path = self._doc_path
+            generation = self._document_generation
+            scale_factor = self.scale_factor
+            device_pixel_ratio = self.devicePixelRatioF()
+            render_scale = scale_factor * device_pixel_ratio
+            get_page_image = self.page_cache.get_page_image
+            has_page = self.page_cache.has_page
+            disk_cache = self.page_cache.disk_cache
+            loading_queue = self.loading_queue
+            while loading_queue:
+                priority, page_num = heapq.heappop(loading_queue)
+                cached_image = get_page_image(doc_path, page_num, render_scale, quick=True)
+                if cached_image is not None:
+                    if has_page(doc_path, page_num, render_scale):
+                        # キャッシュ済みのページは、キャッシュを引き直さずにそのまま表示します。
+                        self._show_page_pixmap(page_num, QPixmap.fromImage(cached_image))
+                        continue
+                    # 高解像度の画像を高速に縮小した仮の画像を表示し、正しいスケールの画像をレンダリングします。
+                    self._show_page_pixmap(page_num, QPixmap.fromImage(cached_image), preview=True)
+                self._in_flight.add(page_num)
+                loader = PageLoaderRunnable(
+                    page_num,
+                    priority,
+                    doc_path,
+                    generation,
+                    scale_factor,
+                    device_pixel_ratio,
+                    self._load_signal,
+                    disk_cache,
+                )
+                self.thread_pool.start(loader, max(0, RENDER_PRIORITY_BASE - priority))
 
-            # 優先度でソートします。
-            self.loading_queue.sort(key=lambda x: x[0])
+    def _enqueue_page(self, priority: int, page_num: int) -> None:
+        """
+        ページを読み込みキューに追加します。
 
-            # ページ読み込みをバックグラウンドで実行します。
-            for priority, page_num in self.loading_queue:
-                loader = PageLoaderRunnable(page_num, priority)
-                self.thread_pool.start(loader)
+        Parameters
+        ----------
+        priority : int
+            読み込み優先度です (低い値が高優先度)。
+        page_num : int
+            読み込むページ番号です。
+
+        Notes
+        -----
+        読み込み済みのページや、すでに読み込みを依頼済みのページは追加しません。
+        """
+        if page_num in self._in_flight or self._states[page_num] == PageState.LOADED.value:
+            return
+        heapq.heappush(self.loading_queue, (priority, page_num))
 
     def _on_vertical_scroll(self, value) -> None:
         """
         垂直スクロールバーの値が変更されたときの処理です。
         """
-        # スクロール後に表示ページを直接更新します。
+        # スクロール後に表示ページの更新を予約します。
         self.update_visible_pages()
 
     def wheelEvent(self, event) -> None:
@@ -494,29 +1061,36 @@ class PDFGraphicsView(QGraphicsView):
         if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
             # Ctrl キーを押しながらのホイール操作はズームを行います。
             delta = event.angleDelta().y()
-            if delta > 0:
-                self.scale_factor *= pdf_config.ZOOM_IN_FACTOR
-            else:
-                self.scale_factor /= pdf_config.ZOOM_OUT_FACTOR
+            factor = pdf_config.ZOOM_IN_FACTOR if delta > 0 else 1 / pdf_config.ZOOM_OUT_FACTOR
 
-            # 強制的に再描画を行います。
-            for page_num in self.page_items.keys():
-                if self.page_states.get(page_num) == PageState.LOADED:
-                    self.page_states[page_num] = PageState.PLACEHOLDER
+            # まずはビューの変換行列で即座に拡大縮小し、シーンの再構築はホイール操作が止まってから 1 回だけ行います。
+            self.scale(factor, factor)
+            self._zoom_rebuild_timer.start()
 
-            # シーン全体をクリアして再描画を行います。
-            self.clear_scene()
-            self._create_all_placeholders()
-            self.update_visible_pages()
-
-            # ズーム変更シグナルを発行します。
-            self.zoom_changed.emit(self.scale_factor)
+            # スケールを更新してズーム変更シグナルを発行します。
+            self.set_zoom_scale(self.scale_factor * factor)
         else:
             # 通常のスクロールを行います。
             super().wheelEvent(event)
-            # スクロール後に表示ページを直接更新します。
+            # スクロール後に表示ページの更新を予約します。
             self.update_visible_pages()
 
+    def _rebuild_after_zoom(self) -> None:
+        """
+        ズーム操作の完了後に、現在のスケールでページを配置し直して再描画します。
+        """
+        # 変換行列による拡大縮小を scale_factor に置き換えるため、スクロール位置を保持して変換をリセットします。
+        h_value = self.horizontalScrollBar().value()
+        v_value = self.verticalScrollBar().value()
+        self.resetTransform()
+
+        self.clear_scene()
+        self._create_all_placeholders()
+
+        self.horizontalScrollBar().setValue(h_value)
+        self.verticalScrollBar().setValue(v_value)
+        self.update_visible_pages()
+
     def resizeEvent(self, event) -> None:
         """
         リサイズイベントを処理します。
@@ -535,7 +1109,7 @@ class PDFGraphicsView(QGraphicsView):
             total_width = self.viewport().width()
             current_scene.setSceneRect(0, 0, total_width, scene_rect.height())
 
-        # 表示ページを直接更新します。
+        # 表示ページの更新を予約します。
         self.update_visible_pages()
 
     def keyPressEvent(self, event) -> None:
@@ -547,7 +1121,7 @@ class PDFGraphicsView(QGraphicsView):
         event : QKeyEvent
             キーボードイベントです。
         """
-        # キー操作後に表示ページを直接更新します。
+        # キー操作後に表示ページの更新を予約します。
         super().keyPressEvent(event)
         self.update_visible_pages()
 
@@ -560,56 +1134,67 @@ class PDFGraphicsView(QGraphicsView):
         event : QMouseEvent
             マウスイベントです。
         """
-        # 単純な左クリックです（修飾キーなし、シフトなし）。
-        if (
-            event.button() == Qt.MouseButton.LeftButton
-            and not (event.modifiers() & Qt.KeyboardModifier.ControlModifier)
-            and not (event.modifiers() & Qt.KeyboardModifier.ShiftModifier)
-        ):
-            # スクロールドラッグモードに設定します。
-            self.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
-            super().mousePressEvent(event)
-
-        # 右クリックです（シフトなし）: PDFコピー
-        elif event.button() == Qt.MouseButton.RightButton and not (
-            event.modifiers() & Qt.KeyboardModifier.ShiftModifier
-        ):
-            # PDF をコピーします。
-            app = self.window().property("app")
-            if app and hasattr(app, "copy_current_pages"):
-                app.copy_current_pages()
-
-        # 右ドラッグ: 領域選択
-        elif event.button() == Qt.MouseButton.RightButton:
-            # ドラッグ モードをラバー バンドに設定します
-            self.setDragMode(QGraphicsView.DragMode.RubberBandDrag)
-            # ラバー バンド選択の開始点を設定します
-            self._drag_start_point = event.pos()
-            self._is_selecting = True
-            # イベントを処理
-            super().mousePressEvent(event)
-
-        # Shift + 左クリック: 領域選択
-        elif event.button() == Qt.MouseButton.LeftButton and (event.modifiers() & Qt.KeyboardModifier.ShiftModifier):
-            # ドラッグ モードをラバー バンドに設定します
-            self.setDragMode(QGraphicsView.DragMode.RubberBandDrag)
-            # ラバー バンド選択の開始点を設定します
-            self._drag_start_point = event.pos()
-            self._is_selecting = True
-            # イベントを処理します
-            super().mousePressEvent(event)
-
-        # Ctrl + 左クリック: PDF コピー
-        elif event.button() == Qt.MouseButton.LeftButton and (event.modifiers() & Qt.KeyboardModifier.ControlModifier):
-            # PDF をコピーします
-            app = self.window().property("app")
-            if app and hasattr(app, "copy_current_pages"):
-                app.copy_current_pages()
+        # 判定に使う修飾キーは Shift と Ctrl だけです。対応する操作がない組み合わせはスクロール ドラッグにします。
+        modifiers = event.modifiers() & PRESS_DISPATCH_MODIFIERS
+        handler = self._press_dispatch.get((event.button(), modifiers), self._press_scroll)
+        handler(event)
 
-        else:
-            # その他の場合はスクロール ドラッグに設定します
-            self.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
-            super().mousePressEvent(event)
+    def _set_drag_mode(self, mode: QGraphicsView.DragMode) -> None:
+        """
+        ドラッグ モードが変わる場合だけ設定します。
+
+        Parameters
+        ----------
+        mode : QGraphicsView.DragMode
+            設定するドラッグ モードです。
+
+        Notes
+        -----
+        setDragMode はモードが同じでもカーソルを設定し直してビューポートを更新するため、
+        クリックのたびに不要な再描画が発生しないようにします。
+        """
+        if self.dragMode() != mode:
+            self.setDragMode(mode)
+
+    def _press_scroll(self, event) -> None:
+        """
+        スクロール ドラッグを開始します。
+
+        Parameters
+        ----------
+        event : QMouseEvent
+            マウスイベントです。
+        """
+        self._set_drag_mode(QGraphicsView.DragMode.ScrollHandDrag)
+        super().mousePressEvent(event)
+
+    def _press_select(self, event) -> None:
+        """
+        ラバー バンドによる領域選択を開始します。
+
+        Parameters
+        ----------
+        event : QMouseEvent
+            マウスイベントです。
+        """
+        self._set_drag_mode(QGraphicsView.DragMode.RubberBandDrag)
+        # ラバー バンド選択の開始点を設定します
+        self._drag_start_point = event.pos()
+        self._is_selecting = True
+        super().mousePressEvent(event)
+
+    def _press_copy(self, event) -> None:
+        """
+        現在のページとその前のページをコピーします。
+
+        Parameters
+        ----------
+        event : QMouseEvent
+            マウスイベントです。
+        """
+        app = getattr(self.window(), "app", None)
+        if app and hasattr(app, "copy_current_pages"):
+            app.copy_current_pages()
 
     def dragEnterEvent(self, event) -> None:
         """
@@ -661,7 +1246,7 @@ class PDFGraphicsView(QGraphicsView):
                 file_path = url.toLocalFile()
                 if file_path.lower().endswith(".pdf"):
                     # アプリケーション インスタンスから直接 PDF をロードします
-                    app = self.window().property("app")
+                    app = getattr(self.window(), "app", None)
                     if app and hasattr(app, "_load_pdf"):
                         app._load_pdf(file_path)
                     event.accept()
@@ -715,7 +1300,7 @@ class PDFGraphicsView(QGraphicsView):
             self._drag_start_point = None
 
         # ドラッグ モードをスクロールに戻します
-        self.setDragMode(QGraphicsView.DragMode.ScrollHandDrag)
+        self._set_drag_mode(QGraphicsView.DragMode.ScrollHandDrag)
 
         # 親クラスの処理を呼び出します
         super().mouseReleaseEvent(event)
@@ -4,24 +4,31 @@ from PySide6.QtCore import QPoint, Qt
 from PySide6.QtGui import QKeyEvent, QMouseEvent, QWheelEvent
 from PySide6.QtWidgets import QGraphicsView
 
-from ...common.base import BaseComponent
-from ...common.protocols import AppProtocol
+from ...common.base import ComponentBase
 from ...config import pdf_config
 from ...logger import get_logger
 
 logger = get_logger(__name__)
 
 
-class InteractionHandler(BaseComponent):
+class InteractionHandler(ComponentBase):
     """Handles mouse and keyboard interactions for PDF viewer."""
 
     def __init__(self):
         super().__init__("InteractionHandler")
         self._view: QGraphicsView | None = None
-        self._app: AppProtocol | None = None
         self._is_dragging = False
         self._last_pan_point = QPoint()
 
+        # (button, Ctrl state) -> press handler, built once instead of branching on every event.
+        no_modifier = Qt.KeyboardModifier.NoModifier
+        control = Qt.KeyboardModifier.ControlModifier
+        self._press_dispatch = {
+            (Qt.MouseButton.MiddleButton, no_modifier): self._start_pan_mode,
+            (Qt.MouseButton.MiddleButton, control): self._start_pan_mode,
+            (Qt.MouseButton.LeftButton, control): self._start_selection_mode,
+        }
+
     def initialize(self) -> None:
         """Initialize the interaction handler."""
         self._mark_initialized()
@@ -30,10 +37,6 @@ class InteractionHandler(BaseComponent):
         """Set the graphics view for interaction handling."""
         self._view = view
 
-    def set_app(self, app: AppProtocol) -> None:
-        """Set app reference for callbacks."""
-        self._app = app
-
     def handle_mouse_press(self, event: QMouseEvent) -> bool:
         """Handle mouse press events.
 
@@ -43,15 +46,12 @@ class InteractionHandler(BaseComponent):
         if not self._view:
             return False
 
-        if event.button() == Qt.MiddleButton:
-            self._start_pan_mode(event.pos())
-            return True
-        elif event.button() == Qt.LeftButton:
-            if event.modifiers() & Qt.ControlModifier:
-                self._start_selection_mode(event.pos())
-                return True
+        handler = self._press_dispatch.get((event.button(), event.modifiers() & Qt.KeyboardModifier.ControlModifier))
+        if handler is None:
+            return False
 
-        return False
+        handler(event.pos())
+        return True
 
     def handle_mouse_move(self, event: QMouseEvent) -> bool:
         """Handle mouse move events.
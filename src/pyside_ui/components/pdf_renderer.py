@@ -1,20 +1,30 @@
 """PDF レンダリング コンポーネントです。"""
 
+import itertools
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Iterable
 from enum import Enum
 
 import fitz
-from PySide6.QtCore import QObject, QRectF, QRunnable, QThreadPool, Signal
-from PySide6.QtGui import QColor, QPen
+from PySide6.QtCore import QObject, QRectF, QRunnable, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QColor, QPen, QPixmap
 from PySide6.QtWidgets import QGraphicsScene
 
 from ...common.base import BaseComponent
-from ...config import cache_config
-from ...constants import ui_config
+from ...config import cache_config, ui_config
 from ...logger import get_logger
-from ..services.page_cache import PageCache
 
 logger = get_logger(__name__)
 
+# ページ読み込みに使うワーカー スレッド数の上限です。
+MAX_LOADER_WORKERS = 4
+
+# ページ読み込みの優先度です (低い値が高優先度)。表示中のページは先読みのページより先に読み込みます。
+VISIBLE_PAGE_PRIORITY = 0
+PREFETCH_PAGE_PRIORITY = 5
+
 
 class PageState(Enum):
     """PDF ページの状態を表す列挙型です。"""
@@ -31,20 +41,32 @@ class PageLoadSignal(QObject):
 
 
 class PageLoaderRunnable(QRunnable):
-    """PDF ページを読み込むためのバックグラウンドタスクです。"""
-
-    def __init__(self, page_num: int, priority: int = 5):
+    """PDF ページの読み込みシグナルを発行するバックグラウンド タスクです。"""
+
+    def __init__(self, renderer: "PDFRenderer", page_num: int, inflight: set[int]) -> None:
+        """
+        PageLoaderRunnable を初期化します。
+
+        Parameters
+        ----------
+        renderer : PDFRenderer
+            読み込みを依頼したレンダラーです。
+        page_num : int
+            読み込むページ番号です。
+        inflight : set[int]
+            依頼時のドキュメントの依頼済みページの集合です。ドキュメントが切り替わった後の古いタスクを見分けます。
+        """
         super().__init__()
-        self.page_num = page_num
-        self.priority = priority
+        self._renderer = renderer
+        self._page_num = page_num
+        self._inflight = inflight
 
-    def run(self):
+    def run(self) -> None:
         """ページ読み込みを実行します。"""
-        page_load_signal.load_page.emit(self.page_num, True)
-
-
-# グローバルシグナルオブジェクトです。
-page_load_signal = PageLoadSignal()
+        try:
+            self._renderer._run_page_load(self._page_num, self._inflight)
+        except Exception as e:
+            logger.error(f"ページ {self._page_num} の読み込みタスクでエラーが発生しました: {e}")
 
 
 class PDFRenderer(BaseComponent):
@@ -53,15 +75,41 @@ class PDFRenderer(BaseComponent):
     def __init__(self):
         super().__init__("PDFRenderer")
         self._scene: QGraphicsScene | None = None
-        self._page_cache: PageCache | None = None
+        # レンダリング済みのページ画像の LRU です。キーは (ページ番号、ズーム スケール) です。
+        # 合計サイズ (MAX_CACHE_BYTES) と件数 (MAX_CACHE_ENTRIES) の上限を超えると古いものから削除します。
+        self._pixmap_cache: OrderedDict[tuple[int, float], QPixmap] = OrderedDict()
+        self._cache_bytes = 0
         self._document: fitz.Document | None = None
         self._page_states: dict[int, PageState] = {}
-        self._page_rects: dict[int, QRectF] = {}
+        # 読み込みを依頼済みで、まだワーカーが処理していないページです。
+        # ページの状態とあわせて、ワーカー スレッドからも操作するためロックで保護します。
+        self._inflight: set[int] = set()
+        self._state_lock = threading.Lock()
+        # 同じイベント ループの反復で依頼されたページ (優先度、ページ番号) です。次の反復でまとめて投入します。
+        self._pending_loads: list[tuple[int, int]] = []
+        self._flush_scheduled = False
+        # ページの (幅、高さ) です (スケール適用前)。ドキュメントの設定時に 1 回だけ取得します。
+        self._page_widths = array("d")
+        self._page_heights = array("d")
+        # 現在のズームでのページの上端、幅、高さです。矩形 (QRectF) は get_page_rect で必要なときに作成します。
+        self._y_offsets = array("d")
+        self._widths = array("d")
+        self._heights = array("d")
+        # すべてのページが同じ大きさの場合の (幅、高さ) です。位置を配列にせず計算で求めます。
+        self._uniform_page_size: tuple[float, float] | None = None
+        # 位置を計算したときのズーム スケールです。未計算の場合は None です。
+        self._layout_scale: float | None = None
+        # プレースホルダーの色とペンです。ページごとに色の文字列を解析しないように 1 回だけ作成します。
+        self._placeholder_color = QColor(cache_config.PLACEHOLDER_COLOR)
+        self._placeholder_pen = QPen(self._placeholder_color)
+        # ページの読み込み完了を通知するシグナルです。レンダラーごとに持ち、受け取る側はこれに接続します。
+        # ワーカー スレッドから発行されるため、UI スレッドの受信側にはキュー経由で届きます。
+        self.page_load_signal = PageLoadSignal()
         self._thread_pool = QThreadPool()
+        self._thread_pool.setMaxThreadCount(min(MAX_LOADER_WORKERS, QThreadPool.globalInstance().maxThreadCount()))
 
     def initialize(self) -> None:
         """レンダラーを初期化します。"""
-        self._page_cache = PageCache()
         self._mark_initialized()
 
     def set_scene(self, scene: QGraphicsScene) -> None:
@@ -71,81 +119,219 @@ class PDFRenderer(BaseComponent):
     def set_document(self, document: fitz.Document) -> None:
         """レンダリング用の PDF ドキュメントを設定します。"""
         self._document = document
-        self._page_states.clear()
-        self._page_rects.clear()
+        # 前のドキュメントの状態は clear() せずに新しいコンテナに置き換え、古い領域をまとめて解放します。
+        self._pending_loads = []
+        self._thread_pool.clear()
+        with self._state_lock:
+            self._page_states = {}
+            self._inflight = set()
+        self.clear_pixmap_cache()
+        rects = [page.rect for page in document]
+        self._page_widths = array("d", (rect.width for rect in rects))
+        self._page_heights = array("d", (rect.height for rect in rects))
+        self._reset_layout_arrays()
+        self._layout_scale = None
+        sizes = set(zip(self._page_widths, self._page_heights, strict=True))
+        self._uniform_page_size = sizes.pop() if len(sizes) == 1 else None
 
     def get_page_count(self) -> int:
         """ドキュメントのページ数を取得します。"""
         return len(self._document) if self._document else 0
 
     def get_page_rect(self, page_num: int) -> QRectF:
-        """指定されたページの矩形領域を取得します。"""
-        return self._page_rects.get(page_num, QRectF())
+        """指定されたページの矩形領域を取得します。位置が計算されていない場合は空の矩形を返します。"""
+        if self._layout_scale is None or not 0 <= page_num < len(self._page_widths):
+            return QRectF()
+        if self._uniform_page_size is not None:
+            # すべてのページが同じ大きさの場合は、ページ番号から直接位置を計算します。
+            width, height = self._uniform_page_size
+            width *= self._layout_scale
+            height *= self._layout_scale
+            return QRectF(0, page_num * (height + ui_config.PAGE_PADDING), width, height)
+        return QRectF(0, self._y_offsets[page_num], self._widths[page_num], self._heights[page_num])
+
+    def get_page_layout(self) -> tuple[array, array]:
+        """各ページの上端の y 座標と高さを返します。SelectionManager.get_pages_in_selection に渡せます。"""
+        if self._layout_scale is not None and len(self._y_offsets) != len(self._page_widths):
+            # 大きさが揃ったドキュメントでは配列を作成していないため、必要になった時点で作成します。
+            self._build_layout_arrays(self._layout_scale)
+        return self._y_offsets, self._heights
 
     def get_page_state(self, page_num: int) -> PageState:
         """指定されたページの状態を取得します。"""
-        return self._page_states.get(page_num, PageState.PLACEHOLDER)
+        with self._state_lock:
+            return self._page_states.get(page_num, PageState.PLACEHOLDER)
 
     def set_page_state(self, page_num: int, state: PageState) -> None:
         """指定されたページの状態を設定します。"""
-        self._page_states[page_num] = state
+        with self._state_lock:
+            self._page_states[page_num] = state
+
+    @staticmethod
+    def _pixmap_bytes(pixmap: QPixmap) -> int:
+        """ページ画像のおおよそのサイズ (バイト) を返します。"""
+        return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+    def get_cached_pixmap(self, page_num: int, zoom_scale: float) -> QPixmap | None:
+        """キャッシュからページ画像を取得します。見つかった場合は LRU の最新に移動します。"""
+        key = (page_num, zoom_scale)
+        pixmap = self._pixmap_cache.get(key)
+        if pixmap is not None:
+            self._pixmap_cache.move_to_end(key)
+        return pixmap
+
+    def cache_pixmap(self, page_num: int, zoom_scale: float, pixmap: QPixmap) -> None:
+        """ページ画像をキャッシュに追加し、上限を超えた古いページ画像を削除します。
+
+        削除したページは PLACEHOLDER に戻し、load_page_async で読み込み直せるようにします。
+        """
+        key = (page_num, zoom_scale)
+        old_pixmap = self._pixmap_cache.pop(key, None)
+        if old_pixmap is not None:
+            self._cache_bytes -= self._pixmap_bytes(old_pixmap)
+        self._pixmap_cache[key] = pixmap
+        self._cache_bytes += self._pixmap_bytes(pixmap)
+
+        while len(self._pixmap_cache) > 1 and (
+            self._cache_bytes > cache_config.MAX_CACHE_BYTES or len(self._pixmap_cache) > cache_config.MAX_CACHE_ENTRIES
+        ):
+            (old_page_num, _old_scale), old_pixmap = self._pixmap_cache.popitem(last=False)
+            self._cache_bytes -= self._pixmap_bytes(old_pixmap)
+            if self.get_page_state(old_page_num) == PageState.LOADED:
+                self.set_page_state(old_page_num, PageState.PLACEHOLDER)
+
+    def clear_pixmap_cache(self) -> None:
+        """ページ画像のキャッシュを空にします。"""
+        self._pixmap_cache = OrderedDict()
+        self._cache_bytes = 0
 
     def calculate_page_positions(self, zoom_scale: float) -> None:
-        """すべてのページの位置を計算します。"""
+        """すべてのページの位置を計算します。
+
+        ページはパディングを挟んで上から順に並ぶため、各ページの上端は
+        それより前のページの高さとパディングの累積和になります。
+        """
         if not self._document:
             return
 
-        y_offset = 0
-        page_padding = ui_config.PAGE_PADDING
-
-        for page_num in range(len(self._document)):
-            page = self._document[page_num]
-            page_rect = page.rect
-
-            # ページの大きさをスケールします。
-            width = page_rect.width * zoom_scale
-            height = page_rect.height * zoom_scale
+        self._layout_scale = zoom_scale
+        if self._uniform_page_size is not None:
+            # すべてのページが同じ大きさの場合は、get_page_rect でページ番号から位置を計算します。
+            self._reset_layout_arrays()
+            return
+        self._build_layout_arrays(zoom_scale)
 
-            # 水平方向に中央揃えします。
-            x_offset = 0  # シーン内で中央揃えされます。
+    def _reset_layout_arrays(self) -> None:
+        """各ページの上端、幅、高さの配列を空にします。"""
+        self._y_offsets = array("d")
+        self._widths = array("d")
+        self._heights = array("d")
 
-            page_rect_f = QRectF(x_offset, y_offset, width, height)
-            self._page_rects[page_num] = page_rect_f
+    def _build_layout_arrays(self, zoom_scale: float) -> None:
+        """各ページの上端、幅、高さの配列を作成します。"""
+        page_padding = ui_config.PAGE_PADDING
 
-            y_offset += height + page_padding
+        # ページの大きさをスケールします。
+        self._widths = array("d", (width * zoom_scale for width in self._page_widths))
+        self._heights = array("d", (height * zoom_scale for height in self._page_heights))
+        self._y_offsets = array(
+            "d", itertools.accumulate((height + page_padding for height in self._heights[:-1]), initial=0.0)
+        )
 
     def create_placeholder(self, page_num: int, zoom_scale: float) -> None:
         """ページのプレースホルダーを作成します。"""
         if not self._scene or not self._document:
             return
 
-        page_rect = self._page_rects.get(page_num)
-        if not page_rect:
+        page_rect = self.get_page_rect(page_num)
+        if page_rect.isEmpty():
             return
 
         # プレースホルダー矩形を作成します。
-        placeholder_color = QColor(cache_config.PLACEHOLDER_COLOR)
-        pen = QPen(placeholder_color)
-
-        placeholder_item = self._scene.addRect(page_rect, pen, placeholder_color)
+        placeholder_item = self._scene.addRect(page_rect, self._placeholder_pen, self._placeholder_color)
         placeholder_item.setData(0, f"placeholder_{page_num}")
 
         self.set_page_state(page_num, PageState.PLACEHOLDER)
 
-    def load_page_async(self, page_num: int, high_priority: bool = False) -> None:
-        """ページを非同期で読み込みます。"""
-        if self.get_page_state(page_num) == PageState.LOADING:
+    def bulk_create_placeholders(self, page_nums: Iterable[int], zoom_scale: float) -> None:
+        """複数ページのプレースホルダーをまとめて作成します。
+
+        追加のたびにシーンのインデックスを更新しないように、追加中はインデックスを無効にし、
+        最後に元のインデックス方式に戻して 1 回で作り直します。
+        """
+        if not self._scene or not self._document:
             return
 
-        self.set_page_state(page_num, PageState.LOADING)
+        scene = self._scene
+        previous_index_method = scene.itemIndexMethod()
+        scene.setItemIndexMethod(QGraphicsScene.ItemIndexMethod.NoIndex)
+        try:
+            for page_num in page_nums:
+                self.create_placeholder(page_num, zoom_scale)
+        finally:
+            scene.setItemIndexMethod(previous_index_method)
 
-        priority = 1 if high_priority else 5
-        loader = PageLoaderRunnable(page_num, priority)
-        self._thread_pool.start(loader)
+    def load_page_async(self, page_num: int, high_priority: bool = False) -> None:
+        """ページを非同期で読み込みます。
+
+        依頼済みでまだ処理されていないページと、読み込み済みのページの先読みは依頼しません。
+        """
+        with self._state_lock:
+            if page_num in self._inflight:
+                return
+            if self._page_states.get(page_num) == PageState.LOADED and not high_priority:
+                return
+            self._inflight.add(page_num)
+            self._page_states[page_num] = PageState.LOADING
+
+        # スクロール中は 1 回のイベントで複数のページが依頼されるため、投入は次の反復でまとめて行います。
+        self._pending_loads.append((VISIBLE_PAGE_PRIORITY if high_priority else PREFETCH_PAGE_PRIORITY, page_num))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self._flush_loads)
+
+    def _flush_loads(self) -> None:
+        """
+        保留中の読み込み依頼を、優先度の高い順にまとめてスレッド プールに投入します。
+
+        Notes
+        -----
+        QThreadPool は値が大きいタスクほど先に実行するため、読み込み優先度 (低い値が高優先度) を反転して渡します。
+        """
+        self._flush_scheduled = False
+        pending_loads = sorted(self._pending_loads)
+        self._pending_loads.clear()
+        with self._state_lock:
+            inflight = self._inflight
+        for priority, page_num in pending_loads:
+            loader = PageLoaderRunnable(self, page_num, inflight)
+            self._thread_pool.start(loader, PREFETCH_PAGE_PRIORITY - priority)
+
+    def _run_page_load(self, page_num: int, inflight: set[int]) -> None:
+        """
+        ワーカー スレッドでページ読み込みシグナルを発行します。
+
+        Parameters
+        ----------
+        page_num : int
+            読み込むページ番号です。
+        inflight : set[int]
+            依頼時のドキュメントの依頼済みページの集合です。
+
+        Notes
+        -----
+        依頼後にドキュメントが切り替わった場合は、新しいドキュメントの依頼済みページを変更せずに破棄します。
+        """
+        with self._state_lock:
+            if inflight is not self._inflight:
+                return
+            # シグナルの発行前に依頼済みの集合から外し、受け取った側が再び依頼できるようにします。
+            inflight.discard(page_num)
+        self.page_load_signal.load_page.emit(page_num, True)
 
     def cleanup(self) -> None:
         """レンダラーのリソースをクリーンアップします。"""
-        if self._page_cache:
-            self._page_cache.clear_cache()
+        self.clear_pixmap_cache()
         self._thread_pool.clear()
+        self._thread_pool.waitForDone(1000)
         super().cleanup()
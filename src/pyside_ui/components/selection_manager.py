@@ -1,7 +1,10 @@
 """エリア選択とラバーバンド管理コンポーネントです。"""
 
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+
 from PySide6.QtCore import QPoint, QRectF
-from PySide6.QtGui import QColor, QPen
+from PySide6.QtGui import QBrush, QColor, QPen
 from PySide6.QtWidgets import QGraphicsRectItem, QGraphicsView, QRubberBand
 
 from ...common.base import BaseComponent
@@ -21,6 +24,16 @@ class SelectionManager(BaseComponent):
         self._selection_start: QPoint | None = None
         self._selection_rect: QGraphicsRectItem | None = None
         self._is_selecting = False
+        # 選択開始位置の座標と、最後にラバーバンドに設定したジオメトリ (x, y, 幅, 高さ) です。
+        # マウス移動のたびに QPoint から座標を取り出したり、同じジオメトリを設定し直したりしないように保持します。
+        self._start_x = 0
+        self._start_y = 0
+        self._band_geometry: tuple[int, int, int, int] | None = None
+        # シーンに追加した選択ハイライトです。クリア時にシーン全体を走査しないように保持します。
+        self._selection_items: list[QGraphicsRectItem] = []
+        # 選択ハイライトのペンとブラシです。ハイライトごとに作成しないように保持します。
+        self._highlight_pen = QPen(QColor(0, 120, 215), 2)  # 青色の選択色です。
+        self._highlight_brush = QBrush(QColor(0, 120, 215, 50))  # 半透明の青色です。
 
     def initialize(self) -> None:
         """選択マネージャーを初期化します。"""
@@ -39,9 +52,12 @@ class SelectionManager(BaseComponent):
 
         self._is_selecting = True
         self._selection_start = pos
+        self._start_x = pos.x()
+        self._start_y = pos.y()
 
         # ラバーバンドを初期化します。
-        self._rubber_band.setGeometry(pos.x(), pos.y(), 0, 0)
+        self._band_geometry = (self._start_x, self._start_y, 0, 0)
+        self._rubber_band.setGeometry(*self._band_geometry)
         self._rubber_band.show()
 
         logger.debug(f"Selection started at {pos}")
@@ -51,13 +67,27 @@ class SelectionManager(BaseComponent):
         if not self._is_selecting or not self._selection_start or not self._rubber_band:
             return
 
-        # 選択矩形を計算します。
-        start_x = min(self._selection_start.x(), pos.x())
-        start_y = min(self._selection_start.y(), pos.y())
-        width = abs(pos.x() - self._selection_start.x())
-        height = abs(pos.y() - self._selection_start.y())
+        # 選択矩形を計算します。マウス移動のたびに呼ばれるため、min や abs を使わずに比較だけで求めます。
+        sx = self._start_x
+        sy = self._start_y
+        px = pos.x()
+        py = pos.y()
+        if px < sx:
+            start_x, width = px, sx - px
+        else:
+            start_x, width = sx, px - sx
+        if py < sy:
+            start_y, height = py, sy - py
+        else:
+            start_y, height = sy, py - sy
+
+        # 前回と同じジオメトリの場合は更新しません。
+        geometry = (start_x, start_y, width, height)
+        if geometry == self._band_geometry:
+            return
 
         # ラバーバンドのジオメトリを更新します。
+        self._band_geometry = geometry
         self._rubber_band.setGeometry(start_x, start_y, width, height)
 
     def end_selection(self, pos: QPoint) -> QRectF | None:
@@ -126,11 +156,9 @@ class SelectionManager(BaseComponent):
             return None
 
         # 選択ハイライトを作成します。
-        pen = QPen(QColor(0, 120, 215), 2)  # 青色の選択色です。
-        brush = QColor(0, 120, 215, 50)  # 半透明の青色です。
-
-        selection_item = self._view.scene().addRect(rect, pen, brush)
+        selection_item = self._view.scene().addRect(rect, self._highlight_pen, self._highlight_brush)
         selection_item.setData(0, "selection_highlight")
+        self._selection_items.append(selection_item)
 
         return selection_item
 
@@ -140,30 +168,52 @@ class SelectionManager(BaseComponent):
             return
 
         scene = self._view.scene()
-        items_to_remove = []
-
-        for item in scene.items():
-            if item.data(0) == "selection_highlight":
-                items_to_remove.append(item)
-
-        for item in items_to_remove:
-            scene.removeItem(item)
+        for item in self._selection_items:
+            try:
+                if item.scene() is scene:
+                    scene.removeItem(item)
+            except RuntimeError:
+                # scene.clear() などで C++ 側のアイテムがすでに削除されている場合です。
+                continue
+        self._selection_items.clear()
 
         logger.debug("All selections cleared")
 
-    def get_pages_in_selection(self, selection_rect: QRectF, page_rects: dict) -> list[int]:
+    def get_pages_in_selection(
+        self,
+        selection_rect: QRectF,
+        page_rects: dict | None = None,
+        *,
+        y_offsets: Sequence[float] | None = None,
+        heights: Sequence[float] | None = None,
+    ) -> list[int]:
         """選択範囲と交差するページ番号を取得します。
 
+        ページの上端 (y_offsets) と高さ (heights) が渡された場合は、ページが縦に重ならずに
+        並んでいることを利用して、二分探索で O(log N) で範囲を求めます。この場合は縦方向だけで判定します。
+
         Args:
             selection_rect : シーン座標での選択矩形
-            page_rects : ページ番号とその矩形をマッピングする辞書
+            page_rects : ページ番号とその矩形をマッピングする辞書 (y_offsets と heights がない場合に使用します)
+            y_offsets : 各ページの上端の y 座標 (昇順)
+            heights : 各ページの高さ
 
         Returns:
             選択範囲と交差するページ番号のリスト
         """
+        if y_offsets is not None and heights is not None:
+            top = selection_rect.top()
+            bottom = selection_rect.bottom()
+            # 下端が選択範囲の上端より下にある最初のページから、上端が選択範囲の下端より上にある最後のページまでです。
+            first = bisect_right(
+                range(len(y_offsets)), top, key=lambda page_num: y_offsets[page_num] + heights[page_num]
+            )
+            last = bisect_left(y_offsets, bottom)
+            return list(range(first, last))
+
         intersecting_pages = []
 
-        for page_num, page_rect in page_rects.items():
+        for page_num, page_rect in (page_rects or {}).items():
             if selection_rect.intersects(page_rect):
                 intersecting_pages.append(page_num)
 
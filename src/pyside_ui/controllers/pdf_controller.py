@@ -4,9 +4,10 @@
 """
 
 import os
+from collections.abc import Callable
 from pathlib import Path
 
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal, Slot
 from PySide6.QtWidgets import QFileDialog, QMessageBox
 
 import src.i18n as i18n_module
@@ -25,6 +26,96 @@ from ..services.pdf_handler import PDFDocumentHandler
 
 logger = get_logger(__name__)
 
+# 終了時に実行中の抽出を待つ最大時間 (ミリ秒) です。
+# 時間内に終わらなかった抽出の一時ファイルは、次回の起動時に削除します。
+CLEANUP_EXTRACTION_TIMEOUT_MS = 2000
+
+
+class ExtractionSignals(QObject):
+    """ページ抽出タスクの結果を UI スレッドに通知するシグナルを提供するクラスです。"""
+
+    # (保存先のパス、開始ページ、終了ページ、世代) です。ページは calculate_page_range の戻り値と同じ形式です。
+    # 世代は依頼したときの PDFController._extraction_generation で、古いドキュメントの結果を見分けます。
+    extraction_done = Signal(str, int, int, int)
+    extraction_failed = Signal(Exception, int)
+
+
+class ExtractRangeRunnable(QRunnable):
+    """
+    ページ範囲の抽出とクリップボードへのコピーをバックグラウンドで実行するタスクです。
+
+    Attributes
+    ----------
+    start_page : int
+        開始ページ番号 (0 ベース) です。
+    end_page : int
+        終了ページ番号 (0 ベース、含まない) です。
+    """
+
+    def __init__(
+        self,
+        pdf_handler: PDFDocumentHandler,
+        clipboard_manager: ClipboardManager,
+        start_page: int,
+        end_page: int,
+        signals: ExtractionSignals,
+        generation: int,
+        is_current: Callable[[int], bool],
+    ) -> None:
+        """
+        ExtractRangeRunnable を初期化します。
+
+        Parameters
+        ----------
+        pdf_handler : PDFDocumentHandler
+            ページを抽出する PDF ハンドラーです。
+        clipboard_manager : ClipboardManager
+            抽出したファイルをコピーするクリップボード マネージャーです。
+        start_page : int
+            開始ページ番号 (0 ベース) です。
+        end_page : int
+            終了ページ番号 (0 ベース、含まない) です。
+        signals : ExtractionSignals
+            結果を通知するシグナルです。
+        generation : int
+            依頼したときのドキュメントの世代です。
+        is_current : Callable[[int], bool]
+            世代が現在のドキュメントのものかどうかを返す関数です。
+        """
+        super().__init__()
+        self.pdf_handler = pdf_handler
+        self.clipboard_manager = clipboard_manager
+        self.start_page = start_page
+        self.end_page = end_page
+        self.signals = signals
+        self.generation = generation
+        self.is_current = is_current
+
+    @Slot()
+    def run(self) -> None:
+        """
+        タスクを実行します。
+
+        Notes
+        -----
+        結果はシグナル経由で UI スレッドに届くため、このメソッドからウィジェットには触れません。
+        開始する前に別のドキュメントが開かれた場合は、新しいドキュメントのページをコピーしないように何もしません。
+        """
+        if not self.is_current(self.generation):
+            return
+        try:
+            save_path = self.pdf_handler.extract_page_range(self.start_page, self.end_page)
+            self.clipboard_manager.copy_file_to_clipboard(save_path)
+        except (PDFFileNotFoundError, PDFProcessingError, ClipboardError) as e:
+            self.signals.extraction_failed.emit(e, self.generation)
+            return
+        except Exception as e:
+            # 想定外のエラーもワーカー スレッド内で失われないように、ログに残して UI スレッドに通知します。
+            logger.exception(f"Unexpected error while copying pages: {e}")
+            self.signals.extraction_failed.emit(e, self.generation)
+            return
+        self.signals.extraction_done.emit(save_path, self.start_page, self.end_page, self.generation)
+
 
 class PDFController:
     """
@@ -62,6 +153,27 @@ class PDFController:
         self.window_controller = None
         self.menu_manager = None
 
+        # ページ抽出用のスレッド プールです。同じドキュメントを同時に操作しないように 1 スレッドで順に実行します。
+        self._extraction_pool = QThreadPool()
+        self._extraction_pool.setMaxThreadCount(1)
+        self._extraction_signals = ExtractionSignals()
+        self._extraction_signals.extraction_done.connect(self._on_extraction_done)
+        self._extraction_signals.extraction_failed.connect(self._on_extraction_failed)
+        # 前回の終了時に残った一時ファイルを削除します。抽出と同じプールで実行し、最初の抽出より前に終わらせます。
+        self._extraction_pool.start(self.pdf_handler.cleanup_temp_files)
+        # PDF を開くたびに増える番号です。抽出の完了を待たずに PDF を開き直し、古い抽出の結果は無視します。
+        self._extraction_generation = 0
+
+        # スピン ボックスの連続した変更をまとめて、最後の値だけを設定に反映するタイマーです。
+        self._pending_max_pages: int | None = None
+        self._max_pages_timer = QTimer()
+        self._max_pages_timer.setSingleShot(True)
+        self._max_pages_timer.setInterval(settings.SAVE_DELAY_MS)
+        self._max_pages_timer.timeout.connect(self._apply_max_pages_change)
+
+        # 指定されたパスから絶対パスへの変換結果です。同じファイルを開き直すときに変換を省きます。
+        self._resolved_cache: dict[str, str] = {}
+
     def set_components(self, main_window, pdf_viewer, toolbar, window_controller, menu_manager):
         """
         依存するコンポーネントを設定します。
@@ -136,11 +248,13 @@ class PDFController:
         if not filepath or not self.pdf_viewer or not self.toolbar:
             return
 
-        # 文字列型に変換します（型チェックのためです）。
-        filepath_str = str(filepath)
+        # 絶対パスの文字列に正規化します。設定のキーと PDFDocumentHandler のパスが一致するようにします。
+        filepath_str = self._resolve_path(str(filepath))
 
         try:
-            # 現在の PDF の設定を保存します。
+            # 現在の PDF の設定を保存します。保留中の最大ページ数もツール バーの値として一緒に保存されます。
+            self._max_pages_timer.stop()
+            self._pending_max_pages = None
             if self.pdf_handler.current_document_path:
                 current_state = self.pdf_viewer.get_current_state()
                 max_pages = self.toolbar.get_max_pages_value()
@@ -150,6 +264,10 @@ class PDFController:
                     max_pages,
                 )
 
+            # 実行中の抽出は待たずに、まだ開始していない抽出だけを破棄します。実行中の抽出の結果は世代で無視します。
+            self._extraction_pool.clear()
+            self._extraction_generation += 1
+
             # PDF ファイルを開きます。
             self.pdf_handler.open_document(filepath_str)
 
@@ -162,21 +280,22 @@ class PDFController:
             )
             self.toolbar.set_max_pages_value(max_pages_setting)
 
-            # PDF を表示します。
+            # PDF を表示します。開いたドキュメントをビューアと共有し、同じファイルを 2 回解析しないようにします。
             target_width = self.pdf_viewer.width()
             self.pdf_viewer.display_pdf_document(
                 filepath_str,
                 fit_to_width=True,
                 target_width=target_width,
                 scroll_position=scroll_position,
+                document=self.pdf_handler.current_document,
             )
 
             # タイトルをファイル パスで更新します。
             if self.window_controller:
                 self.window_controller.set_title_with_file(filepath_str)
 
-            # 最後に開いたファイルとして設定を更新します。
-            self.settings.save_settings()
+            # 最後に開いたファイルとして設定を更新します。書き込みは schedule_save でまとめて行います。
+            self.settings.schedule_save()
 
             # メニューの最近開いたファイルリストを更新します
             if self.menu_manager and hasattr(self.menu_manager, "update_recent_files_menu"):
@@ -188,51 +307,129 @@ class PDFController:
             else:
                 logger.error(f"PDF loading error: {e}")
 
+    def _resolve_path(self, filepath: str) -> str:
+        """
+        ファイル パスを絶対パスの文字列に変換します。
+
+        Parameters
+        ----------
+        filepath: str
+            変換するファイル パスです。
+
+        Returns
+        -------
+        str
+            絶対パスです。PDFDocumentHandler.open_document と同じ形式です。
+        """
+        resolved = self._resolved_cache.get(filepath)
+        if resolved is None:
+            resolved = str(Path(filepath).absolute())
+            self._resolved_cache[filepath] = resolved
+        return resolved
+
     def copy_current_pages(self) -> None:
         """
         現在のページとその周辺をクリップボードにコピーします。
+
+        Notes
+        -----
+        ページ範囲は UI スレッドで計算し、抽出とコピーはバックグラウンドで実行します。
+        完了すると _on_extraction_done が呼び出されます。
         """
         if not all([self.toolbar, self.pdf_viewer, self.pdf_handler, self.clipboard_manager]):
             return
 
-        try:
-            # 最大ページ数を取得します。
-            max_pages = self.toolbar.get_max_pages_value()
+        # 最大ページ数を取得します。
+        max_pages = self.toolbar.get_max_pages_value()
 
-            # 現在のページを取得します。
-            current_page = self.pdf_viewer.calculate_visible_page()
+        # 現在のページを取得します。
+        current_page = self.pdf_viewer.calculate_visible_page()
 
-            # ページ範囲を計算します。
-            page_range = self.pdf_handler.calculate_page_range(current_page, max_pages)
+        # ページ範囲を計算します。
+        start_page, end_page = self.pdf_handler.calculate_page_range(current_page, max_pages)
 
-            # ページを抽出します。
-            save_path = self.pdf_handler.extract_page_range(*page_range)
+        # ページの抽出とクリップボードへのコピーをバックグラウンドで実行します。
+        task = ExtractRangeRunnable(
+            self.pdf_handler,
+            self.clipboard_manager,
+            start_page,
+            end_page,
+            self._extraction_signals,
+            self._extraction_generation,
+            self._is_current_extraction,
+        )
+        self._extraction_pool.start(task)
 
-            # クリップボードにコピーします。
-            self.clipboard_manager.copy_file_to_clipboard(save_path)
+    def _is_current_extraction(self, generation: int) -> bool:
+        """
+        抽出を依頼した世代が、現在開いている PDF のものかどうかを返します。
 
-            # ステータス メッセージを更新します。
-            start_page, end_page = page_range
-            if self.main_window:
-                self.main_window.statusBar().showMessage(
-                    i18n_module._("Copied pages {start} to {end}").format(start=start_page + 1, end=end_page)
-                )
+        Parameters
+        ----------
+        generation: int
+            抽出を依頼したときの世代です。
 
-            # 設定を保存します。
-            if self.pdf_handler.current_document_path:
-                current_state = self.pdf_viewer.get_current_state()
-                self.settings.update_file_settings(
-                    self.pdf_handler.current_document_path,
-                    current_state[0],
-                    max_pages,
-                )
-                self.settings.save_settings()
+        Returns
+        -------
+        bool
+            現在の PDF の世代の場合は True です。
+        """
+        return generation == self._extraction_generation
 
-        except (PDFFileNotFoundError, PDFProcessingError, ClipboardError) as e:
-            if self.main_window:
-                QMessageBox.critical(self.main_window, i18n_module._("PDF Copy Error"), str(e))
-            else:
-                logger.error(f"PDF copy error: {e}")
+    def _on_extraction_done(self, save_path: str, start_page: int, end_page: int, generation: int) -> None:
+        """
+        ページの抽出とコピーが完了した時の処理を行います。
+
+        Parameters
+        ----------
+        save_path: str
+            抽出した PDF ファイルのパスです。
+        start_page: int
+            開始ページ番号 (0 ベース) です。
+        end_page: int
+            終了ページ番号 (0 ベース、含まない) です。
+        generation: int
+            抽出を依頼したときの世代です。
+        """
+        logger.debug(f"Extracted pages to {save_path}")
+        if not self._is_current_extraction(generation):
+            # 抽出中に別の PDF が開かれたため、現在の PDF の状態は更新しません。
+            return
+
+        # ステータス メッセージを更新します。
+        if self.main_window:
+            self.main_window.statusBar().showMessage(
+                i18n_module._("Copied pages {start} to {end}").format(start=start_page + 1, end=end_page)
+            )
+
+        # 設定を保存します。
+        if self.pdf_handler.current_document_path and self.pdf_viewer and self.toolbar:
+            current_state = self.pdf_viewer.get_current_state()
+            self.settings.update_file_settings(
+                self.pdf_handler.current_document_path,
+                current_state[0],
+                self.toolbar.get_max_pages_value(),
+            )
+
+    def _on_extraction_failed(self, error: Exception, generation: int) -> None:
+        """
+        ページの抽出またはコピーに失敗した時の処理を行います。
+
+        Parameters
+        ----------
+        error: Exception
+            発生したエラーです。
+        generation: int
+            抽出を依頼したときの世代です。
+        """
+        if not self._is_current_extraction(generation):
+            # 閉じた PDF の抽出のエラーは、現在の PDF の操作とは関係がないため表示しません。
+            logger.warning(f"Ignored copy error for a previous PDF: {error}")
+            return
+        if self.main_window:
+            QMessageBox.critical(self.main_window, i18n_module._("PDF Copy Error"), str(error))
+        else:
+            logger.error(f"PDF copy error: {error}")
 
     def on_max_pages_changed(self, value: int) -> None:
         """
@@ -242,29 +439,55 @@ class PDFController:
         ----------
         value: int
             新しい最大ページ数です。
+
+        Notes
+        -----
+        スピン ボックスの操作では値が 1 ずつ連続して変わるため、設定への反映は
+        変更が止まってから 1 回だけ行います。
         """
+        self._pending_max_pages = value
+        self._max_pages_timer.start()
+
+    def _apply_max_pages_change(self) -> None:
+        """
+        保留中の最大ページ数を現在の PDF の設定に反映します。
+        """
+        value = self._pending_max_pages
+        self._pending_max_pages = None
+        if value is None:
+            return
+
         # 現在の PDF 設定を更新します。
         if self.pdf_handler and self.pdf_handler.current_document_path:
             if self.pdf_viewer:
                 current_state = self.pdf_viewer.get_current_state()
                 self.settings.update_file_settings(self.pdf_handler.current_document_path, current_state[0], value)
-                self.settings.save_settings()
 
     def cleanup(self) -> None:
         """
         PDF関連のリソースをクリーンアップします。
         """
-        # 一時ファイルを削除します。
-        if self.pdf_handler:
+        # まだ開始していない抽出を破棄し、実行中の抽出が終わるのを一定時間だけ待ちます。
+        self._extraction_pool.clear()
+        extractions_done = self._extraction_pool.waitForDone(CLEANUP_EXTRACTION_TIMEOUT_MS)
+        self.clipboard_manager.close()
+
+        # 一時ファイルを削除します。抽出が実行中の場合は書き込み中のファイルを削除しないように、次回の起動時に任せます。
+        if not extractions_done:
+            logger.warning("実行中の抽出が終わらないため、一時ファイルの削除を次回の起動時に延期します")
+        elif self.pdf_handler:
             self.pdf_handler.cleanup_temp_files()
 
-        # キャプチャした画像ファイルを削除します。
+        # キャプチャした画像ファイルを削除します。ARCHIVE_CAPTURES が有効な場合は、保存した画像を残します。
         try:
-            temp_dir = Path(pdf_config.TEMP_IMAGE_DIRECTORY)
-            if temp_dir.exists():
-                for image_file in temp_dir.glob("capture-*.png"):
-                    if image_file.is_file():
-                        image_file.unlink()
+            temp_dir = pdf_config.TEMP_IMAGE_DIRECTORY
+            if not pdf_config.ARCHIVE_CAPTURES and os.path.isdir(temp_dir):
+                # os.scandir はエントリごとに Path を作らず、種類の判定にディレクトリの読み取り結果を使います。
+                with os.scandir(temp_dir) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if name.startswith("capture-") and name.endswith(".png") and entry.is_file():
+                            os.unlink(entry.path)
         except Exception as e:
             logger.exception("画像一時ファイルのクリーンアップ中にエラーが発生しました: %s", e)
             if self.main_window:
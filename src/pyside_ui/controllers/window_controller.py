@@ -4,6 +4,8 @@
 """
 
 import json
+import re
+from functools import lru_cache
 
 from PySide6.QtWidgets import QMainWindow
 
@@ -12,6 +14,49 @@ from ...logger import get_logger
 
 logger = get_logger(__name__)
 
+# tkinter 形式のジオメトリ ("700x780+100+100") です。位置は負の値になることがあります。
+_GEOM_RE = re.compile(r"^(\d+)x(\d+)\+(-?\d+)\+(-?\d+)$")
+
+
+@lru_cache(maxsize=8)
+def _parse_geometry(geometry_str: str) -> tuple[bool, int, int, int, int]:
+    """
+    保存されたジオメトリの文字列を解析します。
+
+    Parameters
+    ----------
+    geometry_str: str
+        tkinter 形式または JSON 形式のジオメトリです。
+
+    Returns
+    -------
+    tuple[bool, int, int, int, int]
+        (tkinter 形式かどうか、x、y、幅、高さ) のタプルです。
+
+    Raises
+    ------
+    ValueError
+        どちらの形式としても解析できない場合に発生します。
+
+    Notes
+    -----
+    同じ文字列は何度も解析しないように、結果をキャッシュします。
+    """
+    match = _GEOM_RE.match(geometry_str)
+    if match:
+        width, height, x, y = map(int, match.groups())
+        return True, x, y, width, height
+
+    # JSON 形式として保存されている場合の処理です。
+    geometry = json.loads(geometry_str)
+    return (
+        False,
+        int(geometry.get("x", 0)),
+        int(geometry.get("y", 0)),
+        int(geometry.get("width", window_config.WIDTH)),
+        int(geometry.get("height", window_config.HEIGHT)),
+    )
+
 
 class WindowController:
     """
@@ -70,30 +115,18 @@ class WindowController:
         geometry_str = self.settings.get_window_geometry()
         if geometry_str:
             try:
-                # tkinter と PySide6 でのジオメトリ形式の違いを処理します。
-                if "x" in geometry_str and "+" in geometry_str:
-                    # tkinter 形式 ("700x780+100+100") から PySide6 形式に変換します。
-                    size, position = geometry_str.split("+", 1)
-                    width, height = map(int, size.split("x"))
-                    x, y = map(int, ("+" + position).split("+")[1:3])
-                    self.main_window.setGeometry(x, y, width, height)
-                else:
-                    # JSON 形式として保存されている場合の処理です。
-                    geometry = json.loads(geometry_str)
-
-                    # 保存されたジオメトリの情報を取得します。
-                    x = geometry.get("x", 0)
-                    y = geometry.get("y", 0)
-                    width = geometry.get("width", window_config.WIDTH)
-                    height = geometry.get("height", window_config.HEIGHT)
-
-                    # ウィンドウ位置を設定します (タイトル バーを含む全体ウィンドウ位置)。
-                    self.main_window.move(x, y)
-                    self.main_window.resize(width, height)
-
-            except (ValueError, json.JSONDecodeError, AttributeError) as e:
+                is_tk_format, x, y, width, height = _parse_geometry(geometry_str)
+            except (ValueError, TypeError, json.JSONDecodeError, AttributeError) as e:
                 logger.warning(f"Invalid window geometry: {e}")
                 self.main_window.resize(window_config.WIDTH, window_config.HEIGHT)
+                return
+
+            if is_tk_format:
+                self.main_window.setGeometry(x, y, width, height)
+            else:
+                # ウィンドウ位置を設定します (タイトル バーを含む全体ウィンドウ位置)。
+                self.main_window.move(x, y)
+                self.main_window.resize(width, height)
         else:
             # 設定がない場合はデフォルト値を使用します。
             self.main_window.resize(window_config.WIDTH, window_config.HEIGHT)
@@ -5,6 +5,8 @@
 """
 
 import os
+import weakref
+from functools import lru_cache
 
 from PySide6.QtCore import Signal
 from PySide6.QtGui import QDragEnterEvent, QDropEvent, QIcon
@@ -17,6 +19,53 @@ from ..utils import resource_path
 logger = get_logger(__name__)
 
 
+def _first_pdf_path(urls) -> str | None:
+    """
+    URL のリストから最初の PDF ファイルのパスを返します。
+
+    Parameters
+    ----------
+    urls : list[QUrl]
+        ドラッグされた URL のリストです。
+
+    Returns
+    -------
+    str | None
+        最初に見つかった PDF ファイルのパスです。見つからない場合は None です。
+
+    Notes
+    -----
+    拡張子の末尾 4 文字だけを小文字にして比較し、PDF が見つかった時点で走査を終えます。
+    """
+    for url in urls:
+        file_path = url.toLocalFile()
+        if file_path[-4:].lower() == ".pdf":
+            return file_path
+    return None
+
+
+@lru_cache(maxsize=1)
+def _get_window_icon() -> QIcon | None:
+    """
+    ウィンドウ アイコンを取得します。
+
+    Returns
+    -------
+    QIcon | None
+        ウィンドウ アイコンです。アイコン ファイルが見つからない場合は None です。
+
+    Notes
+    -----
+    QIcon は QApplication の作成後にしか作れないため、最初の呼び出しで作成してキャッシュします。
+    """
+    icon_path = resource_path("resources", "icons", "PDFCrop_icon.ico")
+    if not os.path.exists(icon_path):
+        logger.warning(f"Icon file not found at: {icon_path}")
+        return None
+    logger.debug(f"Icon path: {icon_path}")
+    return QIcon(icon_path)
+
+
 class MainWindow(QMainWindow):
     """
     アプリケーションのメインウィンドウです。
@@ -28,10 +77,14 @@ class MainWindow(QMainWindow):
     ----------
     pdf_dropped : Signal(str)
         PDF ファイルがドロップされた時に発行されるシグナルです。
+    resize_signal : Signal()
+        ウィンドウのサイズが変更された時に発行されるシグナルです。
     """
 
     # PDF ドロップシグナルです。
     pdf_dropped = Signal(str)
+    # リサイズシグナルです。
+    resize_signal = Signal()
 
     def __init__(self):
         """
@@ -39,19 +92,17 @@ class MainWindow(QMainWindow):
         """
         super().__init__()
 
+        # アプリケーション インスタンスへの弱参照です。循環参照でアプリが解放されなくなるのを防ぎます。
+        self._app_ref: weakref.ReferenceType | None = None
+
         # ウィンドウのデフォルト設定を行います。
         self.setWindowTitle("PDFCrop")
         self.resize(window_config.WIDTH, window_config.HEIGHT)
 
         # ウィンドウアイコンの設定を行います。
-        icon_path = resource_path("resources", "icons", "PDFCrop_icon.ico")
-        logger.info(f"Icon path: {icon_path}")
-        logger.info(f"Icon exists: {os.path.exists(icon_path)}")
-        if os.path.exists(icon_path):
-            self.setWindowIcon(QIcon(icon_path))
-            logger.info("Window icon set successfully")
-        else:
-            logger.warning(f"Icon file not found at: {icon_path}")
+        icon = _get_window_icon()
+        if icon is not None:
+            self.setWindowIcon(icon)
 
         # セントラルウィジェットを設定します。
         self.central_widget = QWidget()
@@ -68,6 +119,15 @@ class MainWindow(QMainWindow):
         # ドラッグ & ドロップの有効化を行います。
         self.setAcceptDrops(True)
 
+    @property
+    def app(self):
+        """ウィンドウに関連付けられたアプリケーション インスタンスです。未設定または解放済みの場合は None です。"""
+        return self._app_ref() if self._app_ref is not None else None
+
+    @app.setter
+    def app(self, app) -> None:
+        self._app_ref = weakref.ref(app) if app is not None else None
+
     def dragEnterEvent(self, event: QDragEnterEvent) -> None:
         """
         ドラッグイベントの処理を行います。
@@ -77,11 +137,11 @@ class MainWindow(QMainWindow):
         event : QDragEnterEvent
             ドラッグイベントです。
         """
-        if event.mimeData().hasUrls():
-            for url in event.mimeData().urls():
-                if url.toLocalFile().lower().endswith(".pdf"):
-                    event.acceptProposedAction()
-                    return
+        # ドラッグ中は頻繁に呼ばれるため、mimeData は 1 回だけ取得します。
+        mime_data = event.mimeData()
+        if mime_data.hasUrls() and _first_pdf_path(mime_data.urls()) is not None:
+            event.acceptProposedAction()
+            return
         event.ignore()
 
     def dropEvent(self, event: QDropEvent) -> None:
@@ -93,14 +153,24 @@ class MainWindow(QMainWindow):
         event : QDropEvent
             ドロップイベントです。
         """
-        for url in event.mimeData().urls():
-            file_path = url.toLocalFile()
-            if file_path.lower().endswith(".pdf"):
-                # PDF ドロップシグナルを発行します。
-                self.pdf_dropped.emit(file_path)
-                break
+        file_path = _first_pdf_path(event.mimeData().urls())
+        if file_path is not None:
+            # PDF ドロップシグナルを発行します。
+            self.pdf_dropped.emit(file_path)
         event.acceptProposedAction()
 
+    def resizeEvent(self, event) -> None:
+        """
+        リサイズイベントの処理を行います。
+
+        Parameters
+        ----------
+        event : QResizeEvent
+            リサイズイベントです。
+        """
+        super().resizeEvent(event)
+        self.resize_signal.emit()
+
     def closeEvent(self, event):
         """
         ウィンドウを閉じる際のイベント処理を行います。
@@ -111,7 +181,7 @@ class MainWindow(QMainWindow):
             クローズイベントです。
         """
         # アプリケーションのインスタンスへの参照を確認します。
-        app = self.property("app")
+        app = self.app
         if app and hasattr(app, "_on_closing"):
             logger.info("closeEvent: calling app._on_closing from MainWindow")
             app._on_closing(event)
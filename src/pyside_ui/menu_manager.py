@@ -4,22 +4,42 @@
 """
 
 import os
-import platform
-import subprocess
+from functools import lru_cache, partial
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
 from PySide6.QtGui import QAction, QActionGroup
-from PySide6.QtWidgets import QMainWindow, QMenu, QMessageBox, QToolBar, QToolButton
+from PySide6.QtWidgets import QApplication, QMainWindow, QMenu, QMessageBox, QToolBar, QToolButton
 
 import src.i18n as i18n_module
 
 from ..config import file_config, ui_config
 from ..logger import get_logger
-from ..utils import authors_file_path
+from ..utils import open_authors_file
 
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=256)
+def _truncate_path(path: str, max_length: int) -> str:
+    """
+    ファイルパスが max_length を超える場合に中央を省略します。
+
+    最近開いたファイルのメニューは更新のたびに同じパスを短縮するため、結果をキャッシュします。
+    最大長さもキーに含まれるため、設定値が変わっても古い結果は使われません。
+    """
+    if len(path) <= max_length:
+        return path
+
+    # パスが長すぎる場合は中央を省略します
+    if max_length <= 3:
+        return "..."
+
+    # 先頭と末尾を残して中央を省略します
+    start_len = (max_length - 3) // 2
+    end_len = max_length - 3 - start_len
+    return path[:start_len] + "..." + path[-end_len:] if end_len > 0 else path[:start_len] + "..."
+
+
 class MenuManager(QObject):
     """
     アプリケーションのメニュー管理クラスです。
@@ -58,7 +78,7 @@ class MenuManager(QObject):
         super().__init__()
         self.main_window = main_window
         # アプリケーションのインスタンスから設定を取得します。
-        self.settings = main_window.property("app").settings
+        self.settings = main_window.app.settings
 
         # 標準メニューバーを隠します。
         main_window.menuBar().hide()
@@ -71,6 +91,15 @@ class MenuManager(QObject):
         # PDFコントローラーの参照です。
         self.pdf_controller = None
 
+        # ファイル メニューの「開く」と「終了」で呼び出すコールバックです (connect_file_actions で設定します)。
+        self._show_file_dialog = None
+        self._on_closing = None
+
+        # 最近開いたファイルのうち、存在しないことが分かったファイルのパスです。
+        # 存在確認はメニューの作成時ではなく、イベント ループが空いたときに行います。
+        self._missing_recent_files: set[str] = set()
+        self._missing_check_scheduled = False
+
         # 各メニューを作成します。
         self._create_file_menu_button()
         self._create_settings_menu_button()
@@ -102,6 +131,8 @@ class MenuManager(QObject):
         # ファイルメニューを作成します。
         self.file_menu = QMenu()
         self.file_button.setMenu(self.file_menu)
+        # メニュー内のすべてのアクションを 1 つのスロットで処理します。
+        self.file_menu.triggered.connect(self._on_file_menu_triggered)
 
         # 開くアクションを作成します
         self.open_action = QAction(i18n_module._("Open"), self.main_window)
@@ -113,18 +144,13 @@ class MenuManager(QObject):
 
         # 最近開いたファイルのリストを追加します
         self.recent_file_actions = []
-        recent_files = self._get_recent_files()
+        for filepath, _ in self._get_recent_files():
+            action = self._create_recent_file_action(filepath)
+            self.file_menu.addAction(action)
+            self.recent_file_actions.append(action)
 
-        if recent_files:
-            for filepath, _ in recent_files:
-                truncated_path = self._truncate_path(filepath)
-                action = QAction(truncated_path, self.main_window)
-                action.setData(filepath)  # 元のパスをデータとして保存します
-                self.file_menu.addAction(action)
-                self.recent_file_actions.append(action)
-
-        # 終了前のセパレータを追加します
-        self.file_menu.addSeparator()
+        # 終了前のセパレータを追加します。最近開いたファイルはこのセパレータの前に追加します。
+        self._recent_files_separator = self.file_menu.addSeparator()
 
         # 終了アクションを作成します
         self.exit_action = QAction(i18n_module._("Exit"), self.main_window)
@@ -249,20 +275,15 @@ class MenuManager(QObject):
         現在の言語設定をメニューに反映します。
         """
         current_lang = self.settings.get_language()
-        logger.info(f"Setting current language in menu: {current_lang}")
+        actions_by_code = {action.data(): action for action in self.language_group.actions()}
 
-        # すべてのアクションのチェック状態をリセットします。
-        for action in self.language_group.actions():
+        # すべてのアクションのチェック状態をリセットしてから、現在の言語のアクションをチェックします。
+        for action in actions_by_code.values():
             action.setChecked(False)
-            logger.info(f"Language menu item: {action.data()} (unchecked)")
+        if current_lang in actions_by_code:
+            actions_by_code[current_lang].setChecked(True)
 
-        # 現在の言語のアクションをチェックします。
-        if current_lang:
-            for action in self.language_group.actions():
-                if action.data() == current_lang:
-                    action.setChecked(True)
-                    logger.info(f"Checked language menu item: {current_lang}")
-                    break
+        logger.info(f"Language menu set to {current_lang} (options={list(actions_by_code)})")
 
     def _get_recent_files(self, max_files: int = None) -> list:
         """
@@ -276,28 +297,65 @@ class MenuManager(QObject):
         Returns
         -------
         list
-            (ファイルパス, 最終アクセス日時) のタプルのリストです。
+            (ファイルパス, 最終アクセス時刻 (エポックからのナノ秒)) のタプルのリストです。
         """
-        recent_files = []
+        if max_files is None:
+            max_files = file_config.DEFAULT_RECENT_FILES_LIMIT
+        recent_files = self.settings.recent_pdf_files(max_files, exclude=self._missing_recent_files)
 
-        # 設定から最近のファイルを取得します
-        files_dict = self.settings._settings_data.get("recent_files", {})
+        # 存在しないファイルは、次にメニューを更新するときに一覧から外します。
+        if not self._missing_check_scheduled:
+            self._missing_check_scheduled = True
+            QTimer.singleShot(0, self._check_missing_recent_files)
+        return recent_files
 
-        # 最終アクセス日時でソートします
-        for filepath, settings in files_dict.items():
-            last_accessed = settings.get("last_accessed", "")
-            import os
+    def _check_missing_recent_files(self) -> None:
+        """
+        最近開いたファイルの存在を確認し、存在しないファイルがあればメニューを更新します。
+        """
+        self._missing_check_scheduled = False
+        # 表示対象になりうるファイルだけを確認します。以前に存在しなかったファイルも確認し直します。
+        limit = file_config.DEFAULT_RECENT_FILES_LIMIT + len(self._missing_recent_files)
+        missing = {filepath for filepath, _ in self.settings.recent_pdf_files(limit) if not os.path.exists(filepath)}
+        if missing != self._missing_recent_files:
+            self._missing_recent_files = missing
+            self.update_recent_files_menu()
+
+    def _create_recent_file_action(self, filepath: str) -> QAction:
+        """
+        最近開いたファイルのアクションを作成します。
 
-            if last_accessed and os.path.exists(filepath) and filepath.lower().endswith(".pdf"):
-                recent_files.append((filepath, last_accessed))
+        Parameters
+        ----------
+        filepath: str
+            アクションが開くファイルのパスです。
 
-        # 最終アクセス日時の新しい順にソートします
-        recent_files.sort(key=lambda x: x[1], reverse=True)
+        Returns
+        -------
+        QAction
+            作成したアクションです。開くファイルはトリガー時に data() から取得します。
+        """
+        action = QAction(self._truncate_path(filepath), self.main_window)
+        action.setData(filepath)  # 元のパスをデータとして保存します
+        return action
 
-        # 最大表示数に制限します
-        if max_files is None:
-            max_files = file_config.DEFAULT_RECENT_FILES_LIMIT
-        return recent_files[:max_files]
+    def _on_file_menu_triggered(self, action: QAction) -> None:
+        """
+        ファイル メニューのアクションがトリガーされた時の処理です。
+
+        Parameters
+        ----------
+        action : QAction
+            トリガーされたアクションです。
+        """
+        if action is self.open_action:
+            if self._show_file_dialog is not None:
+                self._show_file_dialog()
+        elif action is self.exit_action:
+            if self._on_closing is not None:
+                self._on_closing()
+        elif action.data():
+            self._open_recent_file(action)
 
     def _truncate_path(self, path: str, max_length: int = None) -> str:
         """
@@ -317,17 +375,7 @@ class MenuManager(QObject):
         """
         if max_length is None:
             max_length = ui_config.MAX_MENU_PATH_LENGTH
-        if len(path) <= max_length:
-            return path
-
-        # パスが長すぎる場合は中央を省略します
-        if max_length <= 3:
-            return "..."
-
-        # 先頭と末尾を残して中央を省略します
-        start_len = (max_length - 3) // 2
-        end_len = max_length - 3 - start_len
-        return path[:start_len] + "..." + path[-end_len:] if end_len > 0 else path[:start_len] + "..."
+        return _truncate_path(path, max_length)
 
     def _open_recent_file(self, action) -> None:
         """
@@ -342,48 +390,67 @@ class MenuManager(QObject):
         if filepath and os.path.exists(filepath):
             # PDFコントローラーを使用してファイルを開きます
             if hasattr(self, "pdf_controller") and self.pdf_controller:
-                self.pdf_controller.load_pdf(filepath)
+                # メニューが閉じて再描画されてから読み込みます。読み込み中は待機カーソルを表示し、
+                # ファイル メニューを無効にして同じ操作が重ならないようにします。
+                self.file_button.setEnabled(False)
+                QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+                QTimer.singleShot(0, partial(self._load_recent_file, filepath))
+
+    def _load_recent_file(self, filepath: str) -> None:
+        """
+        最近開いたファイルを読み込み、ファイル メニューとカーソルを元に戻します。
+
+        Parameters
+        ----------
+        filepath : str
+            読み込むファイルのパスです。
+        """
+        try:
+            self.pdf_controller.load_pdf(filepath)
+        finally:
+            QApplication.restoreOverrideCursor()
+            self.file_button.setEnabled(True)
 
     def _show_authors(self) -> None:
         """
         AUTHORS ファイルをデフォルトのテキスト エディターで開きます。
         """
         try:
-            authors_path = authors_file_path()
-
-            if platform.system() == "Windows":
-                subprocess.run(["notepad.exe", authors_path])
-            elif platform.system() == "Darwin":  # macOS
-                subprocess.run(["open", authors_path])
-            else:  # Linux
-                subprocess.run(["xdg-open", authors_path])
+            open_authors_file()
         except Exception as e:
             QMessageBox.critical(self.main_window, i18n_module._("Error"), str(e))
 
     def update_recent_files_menu(self) -> None:
         """
         最近開いたファイルのメニューを更新します。
-        """
-        # 既存の最近開いたファイルのアクションを削除します
-        for action in self.recent_file_actions:
-            self.file_menu.removeAction(action)
 
-        # 最近開いたファイルのリストを再構築します
-        self.recent_file_actions = []
-        recent_files = self._get_recent_files()
-
-        if recent_files:
-            # 最近開いたファイルのアクションを追加します
-            for filepath, _ in recent_files:
-                truncated_path = self._truncate_path(filepath)
-                action = QAction(truncated_path, self.main_window)
+        Notes
+        -----
+        一覧が変わっていない場合は何もしません。変わった場合も既存のアクションは
+        テキストとデータを書き換えて再利用し、不足分だけを追加、余った分だけを削除します。
+        """
+        filepaths = [filepath for filepath, _ in self._get_recent_files()]
+        actions = self.recent_file_actions
+        if filepaths == [action.data() for action in actions]:
+            return
+
+        # 既存のアクションを再利用します。
+        for action, filepath in zip(actions, filepaths, strict=False):
+            if action.data() != filepath:
+                action.setText(self._truncate_path(filepath))
                 action.setData(filepath)
-                self.file_menu.insertAction(self.exit_action, action)
-                self.recent_file_actions.append(action)
-                action.triggered.connect(lambda checked=False, action=action: self._open_recent_file(action))
 
-            # 最近開いたファイルとExitの間にセパレータを追加します
-            self.file_menu.insertSeparator(self.exit_action)
+        # 不足しているアクションを追加します。
+        for filepath in filepaths[len(actions) :]:
+            action = self._create_recent_file_action(filepath)
+            self.file_menu.insertAction(self._recent_files_separator, action)
+            actions.append(action)
+
+        # 余ったアクションを削除します。
+        for action in actions[len(filepaths) :]:
+            self.file_menu.removeAction(action)
+            action.deleteLater()
+        del actions[len(filepaths) :]
 
     def connect_file_actions(self, show_file_dialog, on_closing) -> None:
         """
@@ -396,9 +463,5 @@ class MenuManager(QObject):
         on_closing: callable
             アプリケーションを終了するコールバック関数です。
         """
-        self.open_action.triggered.connect(show_file_dialog)
-        self.exit_action.triggered.connect(on_closing)
-
-        # 最近開いたファイルのアクションを接続します
-        for action in self.recent_file_actions:
-            action.triggered.connect(lambda checked=False, action=action: self._open_recent_file(action))
+        self._show_file_dialog = show_file_dialog
+        self._on_closing = on_closing
@@ -4,13 +4,15 @@
 クリップボード関連の操作を提供します。
 """
 
+import sys
 from pathlib import Path
 
-from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+from PySide6.QtCore import QMimeData, QObject, QRunnable, QThreadPool, Signal, Slot
+from PySide6.QtGui import QGuiApplication, QImage
 
 from ...exceptions import ClipboardError
 from ...logger import get_logger
-from ...utils.powershell_executor import PowerShellExecutor
+from ...utils.powershell_executor import PowerShellSession
 
 logger = get_logger(__name__)
 
@@ -27,9 +29,11 @@ class ClipboardTask(QRunnable):
         処理完了時に呼び出すコールバック関数です。
     error_callback : function
         エラー発生時に呼び出すコールバック関数です。
+    session : PowerShellSession
+        スクリプトを実行する PowerShell のセッションです。
     """
 
-    def __init__(self, filepath: str, callback, error_callback):
+    def __init__(self, filepath: str, callback, error_callback, session: PowerShellSession):
         """
         ClipboardTask を初期化します。
 
@@ -41,11 +45,14 @@ class ClipboardTask(QRunnable):
             処理完了時に呼び出すコールバック関数です。
         error_callback : function
             エラー発生時に呼び出すコールバック関数です。
+        session : PowerShellSession
+            スクリプトを実行する PowerShell のセッションです。
         """
         super().__init__()
         self.filepath = filepath
         self.callback = callback
         self.error_callback = error_callback
+        self.session = session
 
     @Slot()
     def run(self) -> None:
@@ -56,18 +63,19 @@ class ClipboardTask(QRunnable):
         -----
         このメソッドは QRunnable の run() をオーバーライドし、
         バックグラウンドスレッドで PowerShell を使用してクリップボード操作を実行します。
+        PowerShell のプロセスは ClipboardManager が起動したものを再利用します。
         """
         try:
             # PowerShell スクリプトを作成します。
             commands = [
                 "Add-Type -AssemblyName System.Windows.Forms",
                 "$files = New-Object System.Collections.Specialized.StringCollection",
-                f'$files.Add("{self.filepath}")',
+                "$files.Add($path)",
                 "[System.Windows.Forms.Clipboard]::SetFileDropList($files)",
             ]
 
-            # PowerShell を実行します。
-            result = PowerShellExecutor.execute_script_block(commands)
+            # PowerShell を実行します。パスはスクリプトに埋め込まず、変数として渡します。
+            result = self.session.execute_script_block(commands, variables={"path": self.filepath}, stop_on_error=True)
 
             if result is None:
                 raise ClipboardError("クリップボードへのコピー中にエラーが発生しました", self.filepath)
@@ -95,9 +103,11 @@ class ImageClipboardTask(QRunnable):
         処理完了時に呼び出すコールバック関数です。
     error_callback : function
         エラー発生時に呼び出すコールバック関数です。
+    session : PowerShellSession
+        スクリプトを実行する PowerShell のセッションです。
     """
 
-    def __init__(self, filepath: str, callback, error_callback):
+    def __init__(self, filepath: str, callback, error_callback, session: PowerShellSession):
         """
         ImageClipboardTask を初期化します。
 
@@ -109,11 +119,14 @@ class ImageClipboardTask(QRunnable):
             処理完了時に呼び出すコールバック関数です。
         error_callback: function
             エラー発生時に呼び出すコールバック関数です。
+        session: PowerShellSession
+            スクリプトを実行する PowerShell のセッションです。
         """
         super().__init__()
         self.filepath = filepath
         self.callback = callback
         self.error_callback = error_callback
+        self.session = session
 
     @Slot()
     def run(self) -> None:
@@ -130,12 +143,12 @@ class ImageClipboardTask(QRunnable):
             commands = [
                 "Add-Type -AssemblyName System.Windows.Forms",
                 "Add-Type -AssemblyName System.Drawing",
-                f'$img = [System.Drawing.Image]::FromFile("{self.filepath}")',
+                "$img = [System.Drawing.Image]::FromFile($path)",
                 "[System.Windows.Forms.Clipboard]::SetImage($img)",
             ]
 
-            # PowerShell を実行します。
-            result = PowerShellExecutor.execute_script_block(commands)
+            # PowerShell を実行します。パスはスクリプトに埋め込まず、変数として渡します。
+            result = self.session.execute_script_block(commands, variables={"path": self.filepath}, stop_on_error=True)
 
             if result is None:
                 raise ClipboardError("画像のクリップボードへのコピー中にエラーが発生しました", self.filepath)
@@ -168,6 +181,7 @@ class ClipboardManager(QObject):
     -----
     現在の実装は Windows の PowerShell を使用しています。
     他のプラットフォームへの対応が必要な場合は、プラットフォーム固有の実装を追加する必要があります。
+    PowerShell のプロセスは起動したまま保持し、操作のたびにプロセスを起動しないようにしています。
     """
 
     # シグナルの定義です。
@@ -180,6 +194,16 @@ class ClipboardManager(QObject):
         """
         super().__init__()
         self.thread_pool = QThreadPool.globalInstance()
+        self._powershell = PowerShellSession()
+        if sys.platform == "win32":
+            # 最初のコピー操作で起動を待たないように、あらかじめプロセスを起動しておきます。
+            self._powershell.start()
+
+    def close(self) -> None:
+        """
+        クリップボード操作に使用している PowerShell のプロセスを終了します。
+        """
+        self._powershell.close()
 
     def copy_file_to_clipboard(self, filepath: str | Path) -> None:
         """
@@ -208,7 +232,7 @@ class ClipboardManager(QObject):
         logger.debug(f"ファイル パスをクリップボードにコピーします: {filepath_str}")
 
         # タスクを作成して実行します。
-        task = ClipboardTask(filepath_str, self._on_completion, self._on_error)
+        task = ClipboardTask(filepath_str, self._on_completion, self._on_error, self._powershell)
         self.thread_pool.start(task)
 
     def copy_image_to_clipboard(self, filepath: str | Path) -> None:
@@ -237,9 +261,42 @@ class ClipboardManager(QObject):
         logger.debug(f"画像ファイルをクリップボードにコピーします: {filepath_str}")
 
         # タスクを作成して実行します。
-        task = ImageClipboardTask(filepath_str, self._on_completion, self._on_error)
+        task = ImageClipboardTask(filepath_str, self._on_completion, self._on_error, self._powershell)
         self.thread_pool.start(task)
 
+    def copy_image_bytes(self, data: bytes, mime_type: str = "image/png") -> None:
+        """
+        エンコード済みの画像データをクリップボードにコピーします。
+
+        Parameters
+        ----------
+        data: bytes
+            画像のバイト列です。
+        mime_type: str
+            data の MIME タイプです。
+
+        Raises
+        ------
+        ClipboardError
+            画像データを読み込めない場合に発生します。
+
+        Notes
+        -----
+        ファイルを経由せず、Qt のクリップボードに直接設定します。画像を貼り付けられるように、
+        指定した MIME タイプのデータとデコードした画像の両方を設定します。
+        QClipboard を使用するため、GUI スレッドから呼び出してください。
+        """
+        image = QImage.fromData(data)
+        if image.isNull():
+            raise ClipboardError("画像データを読み込めませんでした")
+
+        mime_data = QMimeData()
+        mime_data.setData(mime_type, data)
+        mime_data.setImageData(image)
+        QGuiApplication.clipboard().setMimeData(mime_data)
+        logger.debug(f"画像データをクリップボードにコピーしました: {mime_type}、{len(data)} バイト")
+        self._on_completion()
+
     @staticmethod
     def _validate_filepath(filepath: str | Path) -> None:
         """
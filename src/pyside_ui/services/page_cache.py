@@ -4,18 +4,323 @@
 アプリケーションのパフォーマンスを向上させます。
 """
 
+import hashlib
+import mmap
+import os
+import struct
 import threading
-import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
 
 import fitz
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QImage, QPixmap
+from PySide6.QtGui import QImage
 
 from ...config import cache_config
 from ...logger import get_logger
 
 logger = get_logger(__name__)
 
+# ページ キャッシュのキー (ドキュメント ID、ページ番号、スケールファクター) です。
+# ドキュメント ID はドキュメントのパスごとに割り当てる整数で、キーの比較でパスの文字列を比較しないようにします。
+CacheKey = tuple[int, int, float]
+
+# グレースケールのページかどうかを調べるために描画する縮小画像のスケールです。
+GRAYSCALE_PROBE_SCALE = 0.2
+
+# ピクセルあたりの成分数に対応する QImage の形式です。
+_QIMAGE_FORMATS = {
+    1: QImage.Format.Format_Grayscale8,
+    3: QImage.Format.Format_RGB888,
+    4: QImage.Format.Format_RGBA8888,
+}
+
+
+@lru_cache(maxsize=16)
+def _scale_matrix(scale: float) -> fitz.Matrix:
+    """
+    拡大縮小の変換行列を返します。同じスケールでは同じ行列を再利用します。
+
+    返した行列は共有されるため、呼び出し元で変更しないでください。
+    """
+    return fitz.Matrix(scale, scale)
+
+
+def _is_grayscale(dlist: fitz.DisplayList, render_scale: float) -> bool:
+    """
+    ページの内容がグレースケールだけで描かれているかどうかを調べます。
+
+    Parameters
+    ----------
+    dlist: fitz.DisplayList
+        調べるページの表示リストです。
+    render_scale: float
+        実際に描画するスケールです。縮小画像はこれより大きくしません。
+
+    Returns
+    -------
+    bool
+        縮小画像のすべてのピクセルで R、G、B が等しい場合は True です。判定できない場合は False です。
+    """
+    probe_scale = min(render_scale, GRAYSCALE_PROBE_SCALE)
+    try:
+        probe = dlist.get_pixmap(matrix=_scale_matrix(probe_scale), colorspace=fitz.csRGB, alpha=False)
+        samples = probe.samples
+    except Exception:
+        return False
+    # 1 行の末尾に余白はないため、バイト列を成分ごとに間引いて比較できます。
+    return samples[0::3] == samples[1::3] == samples[2::3]
+
+
+def render_page(page: fitz.Page, render_scale: float) -> fitz.Pixmap:
+    """
+    ページをピクセル マップにラスタライズします。
+
+    Parameters
+    ----------
+    page: fitz.Page
+        描画するページです。
+    render_scale: float
+        描画するスケールです。
+
+    Returns
+    -------
+    fitz.Pixmap
+        描画したピクセル マップです。
+
+    Notes
+    -----
+    スキャンした白黒の文書など、画像を含むグレースケールのページは 1 ピクセル 1 バイトの
+    グレースケールで描画し、RGB の 1/3 のメモリで済ませます。判定の縮小画像と本番の描画で
+    ページを 2 回解析しないように、この場合だけ表示リストを作成して両方に使います。
+    画像を含まないページは判定を省き、表示リストを作らずにページから直接 RGB で描画します。
+    """
+    matrix = _scale_matrix(render_scale)
+    try:
+        has_images = bool(page.get_images())
+    except Exception:
+        has_images = False
+    if not has_images:
+        return page.get_pixmap(matrix=matrix, colorspace=fitz.csRGB, alpha=False)
+
+    dlist = page.get_displaylist()
+    colorspace = fitz.csGRAY if _is_grayscale(dlist, render_scale) else fitz.csRGB
+    return dlist.get_pixmap(matrix=matrix, colorspace=colorspace, alpha=False)
+
+
+def fitz_pixmap_to_qimage(pix: fitz.Pixmap) -> QImage:
+    """
+    PyMuPDF のピクセルマップを QImage に変換します。
+
+    Parameters
+    ----------
+    pix: fitz.Pixmap
+        変換するピクセルマップです。
+
+    Returns
+    -------
+    QImage
+        ピクセル データを所有する QImage です。
+
+    Notes
+    -----
+    ピクセル データは memoryview 経由で直接 QImage に渡し、copy() で 1 回だけ複製します。
+    PPM などの中間バイト列は作成しません。
+    """
+    image_format = _QIMAGE_FORMATS[pix.n]
+    # samples_mv は fitz のバッファを参照するだけなので、copy() で QImage にデータを所有させます。
+    return QImage(pix.samples_mv, pix.width, pix.height, pix.stride, image_format).copy()
+
+
+# ディスク キャッシュのファイル ヘッダー (識別子、幅、高さ、1 行のバイト数、ピクセルあたりの成分数) です。
+_DISK_HEADER = struct.Struct("<4sIIII")
+_DISK_MAGIC = b"PCR2"
+
+
+class DiskPageCache:
+    """
+    レンダリングされたページのピクセル データをディスクに保存するキャッシュです。
+
+    アプリケーションを再起動しても、一度レンダリングしたページは MuPDF でレンダリングし直さずに
+    ファイルから読み込めます。キーにはファイルの更新日時を含めるため、PDF が更新されると
+    古いキャッシュは使われなくなります。
+
+    Attributes
+    ----------
+    directory : Path
+        キャッシュ ファイルを保存するディレクトリです。
+    max_bytes : int
+        キャッシュ ファイルの合計サイズの上限 (バイト) です。
+
+    Notes
+    -----
+    読み込みと保存はワーカー スレッドから呼び出されることを想定しています。
+    ファイルごとに独立して読み書きし、合計サイズの管理だけをロックで保護します。
+    """
+
+    def __init__(self, directory: str | None = None, max_bytes: int | None = None) -> None:
+        """
+        DiskPageCache を初期化します。
+
+        Parameters
+        ----------
+        directory : str | None
+            キャッシュ ディレクトリです。None の場合は設定の既定値を使用します。
+        max_bytes : int | None
+            合計サイズの上限 (バイト) です。None の場合は設定の既定値を使用します。
+        """
+        self.directory = Path(directory if directory is not None else cache_config.CACHE_DIRECTORY)
+        self.max_bytes = max_bytes if max_bytes is not None else cache_config.MAX_DISK_CACHE_BYTES
+        self._lock = threading.Lock()
+        # キャッシュ ファイルの合計サイズです。最初に保存するときにディレクトリを走査して求めます。
+        self._total_bytes: int | None = None
+        self._enabled = True
+
+    def _file_path(self, doc_path: str, page_num: int, scale_factor: float) -> Path | None:
+        """
+        キャッシュ ファイルのパスを求めます。
+
+        Parameters
+        ----------
+        doc_path : str
+            ドキュメントのパスです。
+        page_num : int
+            ページ番号です。
+        scale_factor : float
+            レンダリング時のスケールです。
+
+        Returns
+        -------
+        Path | None
+            キャッシュ ファイルのパスです。ドキュメントがファイルとして存在しない場合は None です。
+        """
+        try:
+            mtime_ns = os.stat(doc_path).st_mtime_ns
+        except OSError:
+            return None
+        digest = hashlib.sha1(f"{doc_path}|{mtime_ns}|{page_num}|{scale_factor}".encode()).hexdigest()
+        return self.directory / f"{digest}.raw"
+
+    def load_image(self, doc_path: str, page_num: int, scale_factor: float) -> QImage | None:
+        """
+        キャッシュ ファイルからページ画像を読み込みます。
+
+        Parameters
+        ----------
+        doc_path : str
+            ドキュメントのパスです。
+        page_num : int
+            ページ番号です。
+        scale_factor : float
+            レンダリング時のスケールです。
+
+        Returns
+        -------
+        QImage | None
+            読み込んだ画像です。キャッシュにない場合や読み込めない場合は None です。
+
+        Notes
+        -----
+        ファイルはメモリ マップで開き、マップした領域から QImage に 1 回だけ複製します。
+        """
+        if not self._enabled:
+            return None
+        path = self._file_path(doc_path, page_num, scale_factor)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                magic, width, height, stride, components = _DISK_HEADER.unpack_from(mapped)
+                end = _DISK_HEADER.size + stride * height
+                image_format = _QIMAGE_FORMATS.get(components)
+                if magic != _DISK_MAGIC or image_format is None or len(mapped) < end:
+                    return None
+                with memoryview(mapped)[_DISK_HEADER.size : end] as samples:
+                    image = QImage(samples, width, height, stride, image_format).copy()
+            # 最近使ったファイルが削除されにくいように、更新日時を LRU の順序として使います。
+            os.utime(path)
+            return image
+        except (OSError, ValueError, struct.error) as e:
+            if not isinstance(e, FileNotFoundError):
+                logger.debug(f"ディスク キャッシュの読み込みに失敗しました: {path}、エラー: {e}")
+            return None
+
+    def store(self, doc_path: str, page_num: int, scale_factor: float, pix: fitz.Pixmap) -> None:
+        """
+        ピクセル マップをキャッシュ ファイルに保存します。
+
+        Parameters
+        ----------
+        doc_path : str
+            ドキュメントのパスです。
+        page_num : int
+            ページ番号です。
+        scale_factor : float
+            レンダリング時のスケールです。
+        pix : fitz.Pixmap
+            保存するピクセル マップです。
+        """
+        if not self._enabled:
+            return
+        path = self._file_path(doc_path, page_num, scale_factor)
+        if path is None:
+            return
+        header = _DISK_HEADER.pack(_DISK_MAGIC, pix.width, pix.height, pix.stride, pix.n)
+        # 書き込み途中のファイルを読み込まないように、一時ファイルに書き込んでから置き換えます。
+        temp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(temp_path, "wb") as f:
+                f.write(header)
+                f.write(pix.samples_mv)
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.warning(f"ディスク キャッシュを無効にします: {e}")
+            self._enabled = False
+            return
+        self._add_size(_DISK_HEADER.size + len(pix.samples_mv))
+
+    def _add_size(self, size: int) -> None:
+        """
+        合計サイズを更新し、上限を超えた場合は古いファイルから削除します。
+
+        Parameters
+        ----------
+        size : int
+            追加したファイルのサイズ (バイト) です。
+        """
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(entry.stat().st_size for entry in self._entries())
+            else:
+                self._total_bytes += size
+            if self._total_bytes > self.max_bytes:
+                self._remove_oldest_files()
+
+    def _entries(self) -> list[os.DirEntry]:
+        """
+        キャッシュ ファイルの一覧を返します。
+        """
+        with os.scandir(self.directory) as entries:
+            return [entry for entry in entries if entry.name.endswith(".raw") and entry.is_file()]
+
+    def _remove_oldest_files(self) -> None:
+        """
+        合計サイズが上限に収まるまで、更新日時の古いキャッシュ ファイルから削除します。
+        """
+        stats = sorted(((entry.stat(), entry.path) for entry in self._entries()), key=lambda item: item[0].st_mtime_ns)
+        for stat, path in stats:
+            if self._total_bytes <= self.max_bytes:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            self._total_bytes -= stat.st_size
+            logger.debug(f"Removed disk cache entry: {path}")
+
 
 class PageCache:
     """
@@ -26,29 +331,38 @@ class PageCache:
 
     Attributes
     ----------
-    cache : Dict[str, QPixmap]
-        キャッシュされたページの辞書です。キーはドキュメントパス、ページ番号、
-        スケールファクターの組み合わせです。
+    cache : OrderedDict[tuple[int, int, float], tuple[QImage, float]]
+        キャッシュされたページと推定サイズ (MB) の辞書です。キーは (ドキュメント ID、ページ番号、
+        スケールファクター) のタプルです。アクセスされたエントリを末尾に移動し、先頭が最も古いエントリです。
     cache_lock : threading.Lock
         キャッシュの同時アクセスを防ぐためのロックです。
 
     Notes
     -----
-    このクラスは、QPixmap オブジェクトをキャッシュし、
-    メモリ使用量を管理します。
+    このクラスは、QImage オブジェクトをキャッシュし、
+    メモリ使用量を管理します。QImage はどのスレッドからでも扱えるため、
+    表示に使う QPixmap への変換は呼び出し元で描画する直前に行います。
     """
 
     def __init__(self) -> None:
         """
         PageCache を初期化します。
         """
-        self.cache: dict[str, QPixmap] = {}
+        self.cache: OrderedDict[CacheKey, tuple[QImage, float]] = OrderedDict()
         self.cache_lock = threading.Lock()
-        self.max_cache_size = cache_config.MAX_CACHE_SIZE_GB
+        # 上限はエントリの推定サイズと同じ MB 単位で保持します。
+        self.max_cache_size = cache_config.MAX_CACHE_SIZE_GB * 1024
         self.current_cache_size = 0
-        self.last_accessed: dict[str, float] = {}
-
-    def get_cache_key(self, doc_path: str, page_num: int, scale_factor: float) -> str:
+        # ドキュメントのパスとドキュメント ID の対応です。ID は割り当てた順の連番で、再利用しません。
+        self._doc_ids: dict[str, int] = {}
+        self._doc_ids_lock = threading.Lock()
+        # (ドキュメント ID、ページ番号) ごとにキャッシュ済みのスケールを昇順で保持します。
+        # 別のスケールの画像を探すときに、キャッシュ全体を走査せずに二分探索で見つけられます。
+        self._scales_by_page: dict[tuple[int, int], list[float]] = {}
+        # メモリにないページを読み込むためのディスク キャッシュです。
+        self.disk_cache = DiskPageCache()
+
+    def get_cache_key(self, doc_path: str, page_num: int, scale_factor: float) -> CacheKey:
         """
         キャッシュ キーを生成します。
 
@@ -63,12 +377,48 @@ class PageCache:
 
         Returns
         -------
-        str
+        CacheKey
             生成されたキャッシュ キーです。
         """
-        return f"{doc_path}_{page_num}_{scale_factor}"
+        return (self._doc_id(doc_path), page_num, scale_factor)
+
+    def _doc_id(self, doc_path: str) -> int:
+        """
+        ドキュメントのパスに対応するドキュメント ID を返します。初めてのパスには新しい ID を割り当てます。
+        """
+        doc_id = self._doc_ids.get(doc_path)
+        if doc_id is None:
+            # 別のスレッドが同時に割り当てても同じ ID にならないように、割り当てだけをロックで保護します。
+            with self._doc_ids_lock:
+                doc_id = self._doc_ids.setdefault(doc_path, len(self._doc_ids))
+        return doc_id
+
+    def _index_key(self, cache_key: CacheKey) -> None:
+        """
+        キャッシュ キーのスケールをページごとの索引に追加します。呼び出し元でロックを取得してください。
+        """
+        doc_id, page_num, scale_factor = cache_key
+        scales = self._scales_by_page.setdefault((doc_id, page_num), [])
+        index = bisect_left(scales, scale_factor)
+        if index == len(scales) or scales[index] != scale_factor:
+            scales.insert(index, scale_factor)
 
-    def get_page_image(self, doc_path: str, page_num: int, scale_factor: float) -> QPixmap | None:
+    def _unindex_key(self, cache_key: CacheKey) -> None:
+        """
+        キャッシュ キーのスケールをページごとの索引から削除します。呼び出し元でロックを取得してください。
+        """
+        doc_id, page_num, scale_factor = cache_key
+        page_key = (doc_id, page_num)
+        scales = self._scales_by_page.get(page_key)
+        if scales is None:
+            return
+        index = bisect_left(scales, scale_factor)
+        if index < len(scales) and scales[index] == scale_factor:
+            del scales[index]
+        if not scales:
+            del self._scales_by_page[page_key]
+
+    def get_page_image(self, doc_path: str, page_num: int, scale_factor: float, quick: bool = False) -> QImage | None:
         """
         キャッシュからページ画像を取得します。
 
@@ -80,53 +430,86 @@ class PageCache:
             ページ番号です。
         scale_factor: float
             スケール ファクターです。
+        quick: bool
+            True の場合、高解像度の画像を縮小するときに高速な変換を使用し、縮小した画像はキャッシュしません。
 
         Returns
         -------
-        Optional[QPixmap]
+        Optional[QImage]
             キャッシュされたページ画像です。キャッシュにない場合は None です。
+
+        Notes
+        -----
+        quick=True で返した縮小画像は画質が低いため、呼び出し元で正しいスケールの画像を
+        レンダリングし直してください。要求したスケールの画像があるかどうかは has_page() で確認できます。
         """
         cache_key = self.get_cache_key(doc_path, page_num, scale_factor)
 
         with self.cache_lock:
-            if cache_key in self.cache:
-                # アクセス時間を更新します。
-                self.last_accessed[cache_key] = time.time()
-                return self.cache[cache_key]
+            entry = self.cache.get(cache_key)
+            if entry is not None:
+                # 最近使ったエントリとして末尾に移動します。
+                self.cache.move_to_end(cache_key)
+                return entry[0]
 
             # スケールが異なる同じページが存在するか確認します。
             # より高解像度のキャッシュがあれば、それをリサイズして返します。
-            for existing_key in self.cache.keys():
-                if existing_key.startswith(f"{doc_path}_{page_num}_"):
-                    # キャッシュ キーからスケールを抽出します。
-                    try:
-                        existing_scale = float(existing_key.split("_")[2])
-                        if existing_scale > scale_factor:
-                            # 高解像度のキャッシュを取得してリサイズします。
-                            high_res_pixmap = self.cache[existing_key]
-                            scaled_pixmap = high_res_pixmap.scaled(
-                                int(high_res_pixmap.width() * (scale_factor / existing_scale)),
-                                int(high_res_pixmap.height() * (scale_factor / existing_scale)),
-                                Qt.AspectRatioMode.KeepAspectRatio,
-                                Qt.TransformationMode.SmoothTransformation,
-                            )
-
-                            # 新しく生成したスケール バージョンをキャッシュします。
-                            self.cache[cache_key] = scaled_pixmap
-                            self.last_accessed[cache_key] = time.time()
-
-                            # 推定サイズを計算します。
-                            estimated_size = (scaled_pixmap.width() * scaled_pixmap.height() * 4) / (1024 * 1024)
-                            self.current_cache_size += estimated_size
-
-                            return scaled_pixmap
-                    except (ValueError, IndexError):
-                        # キー形式が期待通りでない場合は無視します。
-                        continue
+            doc_id = cache_key[0]
+            scales = self._scales_by_page.get((doc_id, page_num))
+            if scales:
+                # 要求より大きいスケールのうち、最も小さいものを使います。
+                index = bisect_right(scales, scale_factor)
+                if index < len(scales):
+                    existing_scale = scales[index]
+                    high_res_image = self.cache[(doc_id, page_num, existing_scale)][0]
+                    scaled_image = high_res_image.scaled(
+                        int(high_res_image.width() * (scale_factor / existing_scale)),
+                        int(high_res_image.height() * (scale_factor / existing_scale)),
+                        Qt.AspectRatioMode.KeepAspectRatio,
+                        Qt.TransformationMode.FastTransformation
+                        if quick
+                        else Qt.TransformationMode.SmoothTransformation,
+                    )
+                    if quick:
+                        # 画質の低い縮小画像でキャッシュを汚さないように、キャッシュには追加しません。
+                        return scaled_image
+
+                    # 新しく生成したスケール バージョンも、通常の追加と同じく上限を守ってキャッシュします。
+                    self._insert_entry(cache_key, scaled_image)
+
+                    return scaled_image
 
         return None
 
-    def cache_page(self, doc_path: str, page_num: int, page: fitz.Page, scale_factor: float | None = None) -> QPixmap:
+    def has_page(self, doc_path: str, page_num: int, scale_factor: float) -> bool:
+        """
+        指定したスケールのページ画像がキャッシュにあるかどうかを返します。
+
+        Parameters
+        ----------
+        doc_path: str
+            ドキュメントのパスです。
+        page_num: int
+            ページ番号です。
+        scale_factor: float
+            スケール ファクターです。
+
+        Returns
+        -------
+        bool
+            キャッシュにある場合は True です。
+        """
+        with self.cache_lock:
+            return self.get_cache_key(doc_path, page_num, scale_factor) in self.cache
+
+    def cache_page(
+        self,
+        doc_path: str,
+        page_num: int,
+        page: fitz.Page,
+        scale_factor: float | None = None,
+        device_pixel_ratio: float = 1.0,
+    ) -> QImage:
         """
         ページをキャッシュに追加します。
 
@@ -140,65 +523,142 @@ class PageCache:
             キャッシュする PDF ページです。
         scale_factor: float | None
             スケール ファクターです。指定しない場合は 1.0 が使用されます。
+        device_pixel_ratio: float
+            表示先のデバイス ピクセル比です。
 
         Returns
         -------
-        QPixmap
+        QImage
             キャッシュされたページ画像です。
+
+        Notes
+        -----
+        ディスク キャッシュに同じページがあれば、レンダリングせずにそれを使用します。
+        ページは scale_factor * device_pixel_ratio の解像度でレンダリングし、画像にデバイス ピクセル比を
+        設定します。論理サイズは scale_factor のままで、HiDPI 画面で Qt が再度拡大することはありません。
+        キャッシュ キーにはレンダリング時のスケール (scale_factor * device_pixel_ratio) を使用します。
         """
         # None の場合はデフォルト値を使用します。
         scale_factor = 1.0 if scale_factor is None else scale_factor
+        render_scale = scale_factor * device_pixel_ratio
 
-        # ページをレンダリングします。
-        transform_matrix = fitz.Matrix(scale_factor, scale_factor)
-        pix = page.get_displaylist().get_pixmap(matrix=transform_matrix, alpha=False)
+        # ディスク キャッシュにない場合だけページをレンダリングします。
+        image = self.disk_cache.load_image(doc_path, page_num, render_scale)
+        if image is None:
+            pix = render_page(page, render_scale)
+            self.disk_cache.store(doc_path, page_num, render_scale, pix)
 
-        # QPixmap に変換します。
-        img_data = pix.tobytes("ppm")
-        qimage = QImage.fromData(img_data)
-        pixmap = QPixmap.fromImage(qimage)
+            # QImage に変換します。
+            image = fitz_pixmap_to_qimage(pix)
+            pix = None  # MuPDF のバッファをすぐに解放します。
+        image.setDevicePixelRatio(device_pixel_ratio)
 
         # キャッシュに追加します。
+        self.put_image(doc_path, page_num, render_scale, image)
+        return image
+
+    def put_image(self, doc_path: str, page_num: int, scale_factor: float, image: QImage) -> None:
+        """
+        レンダリング済みのページ画像をキャッシュに追加します。
+
+        Parameters
+        ----------
+        doc_path: str
+            ドキュメントのパスです。
+        page_num: int
+            ページ番号です。
+        scale_factor: float
+            スケール ファクターです。
+        image: QImage
+            キャッシュするページ画像です。
+        """
         cache_key = self.get_cache_key(doc_path, page_num, scale_factor)
 
         with self.cache_lock:
-            # キャッシュ サイズを管理します。
-            estimated_size = (pix.width * pix.height * 4) / (1024 * 1024)  # MB で推定します。
+            self._insert_entry(cache_key, image)
+
+    def _insert_entry(self, cache_key: CacheKey, image: QImage) -> None:
+        """
+        エントリをキャッシュに追加し、合計サイズが上限を超えないように古いエントリを削除します。
+        呼び出し元でロックを取得してください。
+
+        Parameters
+        ----------
+        cache_key: CacheKey
+            追加するエントリのキーです。
+        image: QImage
+            キャッシュするページ画像です。
+        """
+        # キャッシュ サイズを管理します。
+        estimated_size = self._estimate_size(image)
 
-            # キャッシュ サイズが上限に近い場合、最も古いエントリを削除します。
-            while self.current_cache_size + estimated_size > self.max_cache_size and self.cache:
-                self._remove_oldest_entry()
+        # 同じキーの画像を置き換える場合は、古い画像の分を差し引きます。
+        old_entry = self.cache.pop(cache_key, None)
+        if old_entry is not None:
+            self.current_cache_size -= old_entry[1]
 
-            # 新しいエントリをキャッシュに追加します。
-            self.cache[cache_key] = pixmap
-            self.last_accessed[cache_key] = time.time()
-            self.current_cache_size += estimated_size
+        # キャッシュ サイズが上限に近い場合、最も古いエントリを削除します。
+        while self.current_cache_size + estimated_size > self.max_cache_size and self.cache:
+            self._remove_oldest_entry()
 
-        return pixmap
+        # 新しいエントリを最も新しいエントリとしてキャッシュに追加します。
+        self.cache[cache_key] = (image, estimated_size)
+        self._index_key(cache_key)
+        self.current_cache_size += estimated_size
+
+    @staticmethod
+    def _estimate_size(image: QImage) -> float:
+        """
+        ページ画像の推定サイズ (MB) を計算します。
+
+        Parameters
+        ----------
+        image: QImage
+            サイズを推定するページ画像です。
+
+        Returns
+        -------
+        float
+            画像のピクセル データのサイズ (MB) です。
+        """
+        return image.sizeInBytes() / (1024 * 1024)
 
     def _remove_oldest_entry(self) -> None:
         """
-        最も古くアクセスされたキャッシュ エントリを削除します。
+        最も古くアクセスされたキャッシュ エントリを削除します。呼び出し元でロックを取得してください。
         """
-        if not self.last_accessed:
+        if not self.cache:
             return
 
-        oldest_key = min(self.last_accessed.items(), key=lambda x: x[1])[0]
+        # 先頭が最も古くアクセスされたエントリです。サイズは追加時に求めたものを使います。
+        oldest_key, (_image, estimated_size) = self.cache.popitem(last=False)
+        self._unindex_key(oldest_key)
+
+        # 現在のキャッシュ サイズを更新します。
+        self.current_cache_size -= estimated_size
 
-        # エントリの推定サイズを計算します。
-        # ここでは単純な推定を行います。
-        if oldest_key in self.cache:
-            pixmap = self.cache[oldest_key]
-            estimated_size = (pixmap.width() * pixmap.height() * 4) / (1024 * 1024)  # MB で推定します。
+        logger.debug(f"Removed cache entry: {oldest_key}, estimated size: {estimated_size:.2f}MB")
 
-            # キャッシュとアクセス時間から削除します。
-            del self.cache[oldest_key]
-            del self.last_accessed[oldest_key]
+    def evict(self, doc_path: str, page_num: int, scale_factor: float) -> None:
+        """
+        指定されたページ画像をキャッシュから削除します。
 
-            # 現在のキャッシュ サイズを更新します。
-            self.current_cache_size -= estimated_size
+        Parameters
+        ----------
+        doc_path: str
+            ドキュメントのパスです。
+        page_num: int
+            ページ番号です。
+        scale_factor: float
+            スケール ファクターです。
+        """
+        cache_key = self.get_cache_key(doc_path, page_num, scale_factor)
 
-            logger.debug(f"Removed cache entry: {oldest_key}, estimated size: {estimated_size:.2f}MB")
+        with self.cache_lock:
+            entry = self.cache.pop(cache_key, None)
+            if entry is not None:
+                self._unindex_key(cache_key)
+                self.current_cache_size -= entry[1]
 
     def clear_cache(self) -> None:
         """
@@ -206,7 +666,7 @@ class PageCache:
         """
         with self.cache_lock:
             self.cache.clear()
-            self.last_accessed.clear()
+            self._scales_by_page.clear()
             self.current_cache_size = 0
 
     def clear_document_cache(self, doc_path: str) -> None:
@@ -218,22 +678,13 @@ class PageCache:
         doc_path: str
             クリアするドキュメントのパスです。
         """
-        keys_to_remove = []
-
+        doc_id = self._doc_ids.get(doc_path)
         with self.cache_lock:
-            # 削除対象のキーを特定します。
-            for key in list(self.cache.keys()):
-                if key.startswith(f"{doc_path}_"):
-                    keys_to_remove.append(key)
-
-            # 特定したキーを削除します。
-            for key in keys_to_remove:
-                if key in self.cache:
-                    pixmap = self.cache[key]
-                    estimated_size = (pixmap.width() * pixmap.height() * 4) / (1024 * 1024)
-
-                    del self.cache[key]
-                    if key in self.last_accessed:
-                        del self.last_accessed[key]
-
-                    self.current_cache_size -= estimated_size
+            # 索引からドキュメントのページを特定し、キャッシュ全体のキーは走査しません。
+            page_keys = [page_key for page_key in self._scales_by_page if page_key[0] == doc_id]
+            for page_key in page_keys:
+                for scale_factor in self._scales_by_page.pop(page_key):
+                    key = (*page_key, scale_factor)
+                    entry = self.cache.pop(key, None)
+                    if entry is not None:
+                        self.current_cache_size -= entry[1]
@@ -3,6 +3,9 @@
 このモジュールは、PDF ファイルの読み込み、ページの抽出などの PDF 関連の操作を提供します。
 """
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import fitz
@@ -13,6 +16,40 @@ from ...logger import get_logger
 
 logger = get_logger(__name__)
 
+# 一時ファイルを並列に削除するスレッド数の上限です。削除は I/O 待ちが主なため、CPU 数より多くします。
+_UNLINK_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _safe_unlink(file: Path) -> None:
+    """
+    ファイルを削除します。失敗しても例外は発生させず、警告をログに記録します。
+
+    Parameters
+    ----------
+    file: Path
+        削除するファイルのパスです。
+    """
+    try:
+        file.unlink(missing_ok=True)
+        logger.debug(f"一時ファイルを削除しました: {file}")
+    except Exception as e:
+        logger.warning(f"一時ファイルの削除に失敗しました: {file}、エラー: {e}")
+
+
+def _write_file(path: str, data: bytes) -> None:
+    """
+    バイト列をファイルに書き込みます。
+
+    Parameters
+    ----------
+    path: str
+        書き込むファイルのパスです。
+    data: bytes
+        書き込むデータです。
+    """
+    with open(path, "wb") as f:
+        f.write(data)
+
 
 class PDFDocumentHandler:
     """
@@ -28,6 +65,15 @@ class PDFDocumentHandler:
         現在開いている PDF ドキュメントのパスです。
     temp_directory: Path
         一時ファイルを保存するディレクトリのパスです。
+    _extracted_files: dict[tuple[int, int, str | None], str]
+        現在のドキュメントから抽出済みのファイルです。キーは (開始ページ、終了ページ、ベース名) です。
+        同じ範囲を続けてコピーする場合に、抽出と保存をやり直さずに再利用します。
+    _extraction_document: Optional[fitz.Document]
+        ページの抽出に使用する、current_document とは別に開いた同じファイルのドキュメントです。
+        current_document はビューアと共有して GUI スレッドで使用するため、バックグラウンドの抽出では
+        このドキュメントだけを使用し、1 つのドキュメントを複数のスレッドから操作しないようにします。
+    _document_generation: int
+        ドキュメントを開くか閉じるたびに増える番号です。抽出中にドキュメントが切り替わったことを検出します。
 
     Notes
     -----
@@ -36,24 +82,44 @@ class PDFDocumentHandler:
     削除する必要があります。
     """
 
-    def __init__(self, temp_directory: str = pdf_config.TEMP_DIRECTORY) -> None:
+    def __init__(self, temp_directory: str | None = None) -> None:
         """
         PDFDocumentHandler を初期化します。
 
         Parameters
         ----------
-        temp_directory: str
-            一時ファイルを保存するディレクトリです。
+        temp_directory: str | None
+            一時ファイルを保存するディレクトリです。None の場合は設定の既定値を使用します。
         """
         self.current_document: fitz.Document | None = None
         self.current_document_path: str | None = None
-        self.temp_directory = Path(temp_directory)
-
-        # 一時ディレクトリを作成します。
+        self.temp_directory = Path(temp_directory if temp_directory is not None else pdf_config.TEMP_DIRECTORY)
+        self._extracted_files: dict[tuple[int, int, str | None], str] = {}
+        # 抽出したファイルの保存先ディレクトリの絶対パスです。抽出のたびに絶対パスに変換しないように保持します。
+        self._temp_dir_path = os.path.abspath(self.temp_directory)
+        # 現在のドキュメントのページ数です。page_count は参照のたびに MuPDF を呼び出すため、開いたときに保持します。
+        self._page_count = 0
+        # 抽出用のドキュメントです。最初の抽出で、抽出を実行するスレッドで開きます。
+        self._extraction_document: fitz.Document | None = None
+        self._extraction_lock = threading.Lock()
+        # 抽出用のドキュメントを開いたときの _document_generation です。
+        self._extraction_generation: int | None = None
+        self._document_generation = 0
+
+        # 一時ディレクトリを作成します。作成できた場合は、抽出のたびに mkdir を呼び出さないようにします。
         try:
             self.temp_directory.mkdir(parents=True, exist_ok=True)
         except Exception as e:
             logger.error(f"一時ディレクトリの作成に失敗しました: {e}")
+        self._temp_dir_ready = self.temp_directory.is_dir()
+
+    def _ensure_temp_dir(self) -> None:
+        """
+        一時ディレクトリがまだ作成されていない場合に作成します。
+        """
+        if not self._temp_dir_ready:
+            self.temp_directory.mkdir(parents=True, exist_ok=True)
+            self._temp_dir_ready = True
 
     def open_document(self, filepath: str | Path) -> None:
         """
@@ -75,26 +141,33 @@ class PDFDocumentHandler:
 
         Notes
         -----
-        既に開いているドキュメントがある場合は、新しいドキュメントを開く前に
-        閉じられます。
+        既に開いているドキュメントがある場合は、新しいドキュメントを開けた後に
+        閉じられます。開けなかった場合は、既存のドキュメントをそのまま残します。
         """
-        filepath_str = str(Path(filepath).absolute())
+        filepath_str = os.fspath(filepath)
+        if not os.path.isabs(filepath_str):
+            filepath_str = os.path.abspath(filepath_str)
 
         try:
-            # 既存のドキュメントを閉じます。
-            self.close_document()
-
             # 新しいドキュメントを開きます。
-            self.current_document = fitz.open(filepath_str)
-            if not self.current_document.page_count:
+            document = fitz.open(filepath_str)
+            page_count = document.page_count
+            if not page_count:
+                document.close()
                 raise PDFEmptyError(filepath_str)
 
+            # 既存のドキュメントを閉じます。ビューアと共有しているため、新しいドキュメントを開けた後に閉じます。
+            self.close_document()
+
+            self.current_document = document
+            self._page_count = page_count
             self.current_document_path = filepath_str
+            self._document_generation += 1
             logger.info(f"PDF ドキュメントを開きました: {filepath_str}")
 
         except PDFEmptyError:
             raise
-        except FileNotFoundError as e:
+        except (FileNotFoundError, fitz.FileNotFoundError) as e:
             raise PDFFileNotFoundError(filepath_str) from e
         except Exception as e:
             raise PDFProcessingError(f"PDF ファイルの読み込みに失敗しました: {str(e)}", filepath_str) from e
@@ -107,6 +180,17 @@ class PDFDocumentHandler:
         -----
         このメソッドは、ドキュメントが開いていない場合は何も行いません。
         """
+        # 抽出済みのファイルは閉じるドキュメントのものなので、再利用しないようにします。
+        self._extracted_files.clear()
+        self._page_count = 0
+        self._document_generation += 1
+        # 抽出用のドキュメントを閉じます。抽出の実行中は UI スレッドを止めないように待たず、
+        # 抽出を実行しているスレッドが世代の違いを検出して閉じます。
+        if self._extraction_lock.acquire(blocking=False):
+            try:
+                self._close_extraction_document()
+            finally:
+                self._extraction_lock.release()
         if self.current_document:
             path = self.current_document_path
             self.current_document.close()
@@ -114,7 +198,9 @@ class PDFDocumentHandler:
             self.current_document_path = None
             logger.debug(f"PDF ドキュメントを閉じました: {path}")
 
-    def extract_page_range(self, start_page: int, end_page: int, base_name: str | None = None) -> str:
+    def extract_page_range(
+        self, start_page: int, end_page: int, base_name: str | None = None, in_memory: bool = False
+    ) -> str | bytes:
         """
         指定されたページ範囲の PDF を抽出して新しいファイルとして保存します。
 
@@ -126,11 +212,13 @@ class PDFDocumentHandler:
             終了ページ番号 (0 ベース) です。
         base_name: str | None
             出力ファイルのベース名です。指定しない場合は元のファイル名を使用します。
+        in_memory: bool
+            True の場合はファイルに保存せず、PDF のバイト列を返します。
 
         Returns
         -------
-        str
-            保存されたファイルのパスです。
+        str | bytes
+            保存されたファイルのパスです。in_memory が True の場合は PDF のバイト列です。
 
         Raises
         ------
@@ -143,31 +231,164 @@ class PDFDocumentHandler:
         -----
         抽出された PDF は一時ディレクトリに保存されます。
         ファイル名は (元のファイル名-from-開始ページ-to-終了ページ.pdf) の
-        形式になります。
+        形式になります。同じドキュメントの同じ範囲をすでに抽出しており、そのファイルが
+        残っている場合は、抽出し直さずにそのファイルのパスを返します。
         """
-        if not self.current_document or not self.current_document_path:
+        # 抽出中に UI スレッドで別のドキュメントが開かれても混ざらないように、開始時の状態を使います。
+        document_path = self.current_document_path
+        generation = self._document_generation
+        if not self.current_document or not document_path:
             raise PDFFileNotFoundError("PDF ファイルが開かれていません")
 
+        if in_memory:
+            # 一時ファイルの書き込みと後の削除を省き、バイト列を直接渡します。
+            return self._extract_ranges([(start_page, end_page)], document_path, generation)[0]
+
+        extracted_key = (start_page, end_page, base_name)
+        extracted_path = self._extracted_files.get(extracted_key)
+        if extracted_path is not None and os.path.isfile(extracted_path):
+            logger.debug(f"抽出済みのファイルを再利用します: {extracted_path}")
+            return extracted_path
+
+        # ページを抽出して新しい PDF のバイト列を作成します。
+        pdf_bytes = self._extract_ranges([(start_page, end_page)], document_path, generation)[0]
+
         try:
-            # 一時ディレクトリを作成します。
-            self.temp_directory.mkdir(exist_ok=True, parents=True)
+            self._ensure_temp_dir()
 
             # 出力ファイル名を生成します。
             if base_name is None:
-                base_name = Path(self.current_document_path).stem
+                base_name = Path(document_path).stem
             save_name = f"{base_name}-from-{start_page + 1:04d}-to-{end_page:04d}.pdf"
-            save_path = self.temp_directory / save_name
+            save_path = os.path.join(self._temp_dir_path, save_name)
 
-            # ページを抽出して新しい PDF を作成します。
-            with fitz.open() as new_pdf:
-                new_pdf.insert_pdf(self.current_document, from_page=start_page, to_page=end_page - 1)
-                new_pdf.save(str(save_path.absolute()))
+            # 作成済みのバイト列を 1 回で書き込みます。
+            try:
+                _write_file(save_path, pdf_bytes)
+            except FileNotFoundError:
+                # 実行中に一時ディレクトリが削除された場合は、作成し直してから書き込みます。
+                self._temp_dir_ready = False
+                self._ensure_temp_dir()
+                _write_file(save_path, pdf_bytes)
 
             logger.debug(f"ページを抽出しました: {start_page + 1}〜{end_page}、保存先: {save_path}")
-            return str(save_path.absolute())
+            # 抽出中にドキュメントが切り替わった場合は、新しいドキュメントの抽出結果として登録しません。
+            if generation == self._document_generation:
+                self._extracted_files[extracted_key] = save_path
+            return save_path
+
+        except Exception as e:
+            raise PDFProcessingError(f"ページの抽出に失敗しました: {str(e)}", document_path) from e
+
+    def extract_page_ranges(self, ranges: list[tuple[int, int]]) -> list[bytes]:
+        """
+        複数のページ範囲をそれぞれ PDF のバイト列として抽出します。
+
+        Parameters
+        ----------
+        ranges: list[tuple[int, int]]
+            (開始ページ (0 ベース)、終了ページ (0 ベース、この番号のページは含みません)) のタプルのリストです。
+
+        Returns
+        -------
+        list[bytes]
+            範囲ごとの PDF のバイト列です。順序は ranges と同じです。
+
+        Raises
+        ------
+        PDFFileNotFoundError
+            PDF ファイルが開かれていない場合の処理です。
+        PDFProcessingError
+            ページの抽出中にエラーが発生した場合の処理です。
+
+        Notes
+        -----
+        ファイルには保存せず、メモリ上で PDF を作成します。
+        ページは current_document ではなく抽出用のドキュメントから複製するため、
+        GUI スレッドがビューアで current_document を使用している間もバックグラウンドで実行できます。
+        """
+        document_path = self.current_document_path
+        if not self.current_document or not document_path:
+            raise PDFFileNotFoundError("PDF ファイルが開かれていません")
 
+        return self._extract_ranges(ranges, document_path, self._document_generation)
+
+    def _extract_ranges(self, ranges: list[tuple[int, int]], document_path: str, generation: int) -> list[bytes]:
+        """
+        抽出用のドキュメントからページ範囲を抽出します。
+
+        Parameters
+        ----------
+        ranges: list[tuple[int, int]]
+            (開始ページ (0 ベース)、終了ページ (0 ベース、この番号のページは含みません)) のタプルのリストです。
+        document_path: str
+            抽出元の PDF ファイルのパスです。
+        generation: int
+            抽出を開始したときの _document_generation です。
+
+        Returns
+        -------
+        list[bytes]
+            範囲ごとの PDF のバイト列です。
+
+        Raises
+        ------
+        PDFProcessingError
+            ページの抽出中にエラーが発生した場合の処理です。
+        """
+        try:
+            with self._extraction_lock:
+                try:
+                    return self._extract_ranges_locked(ranges, document_path, generation)
+                finally:
+                    # 抽出中にドキュメントが閉じられた場合は、close_document の代わりにここで閉じます。
+                    if self._extraction_generation != self._document_generation:
+                        self._close_extraction_document()
         except Exception as e:
-            raise PDFProcessingError(f"ページの抽出に失敗しました: {str(e)}", self.current_document_path) from e
+            raise PDFProcessingError(f"ページの抽出に失敗しました: {str(e)}", document_path) from e
+
+    def _extract_ranges_locked(self, ranges: list[tuple[int, int]], document_path: str, generation: int) -> list[bytes]:
+        """
+        抽出用のドキュメントからページ範囲を抽出します。呼び出し元で _extraction_lock を取得してください。
+
+        Parameters
+        ----------
+        ranges: list[tuple[int, int]]
+            (開始ページ (0 ベース)、終了ページ (0 ベース、この番号のページは含みません)) のタプルのリストです。
+        document_path: str
+            抽出元の PDF ファイルのパスです。
+        generation: int
+            抽出を開始したときの _document_generation です。
+
+        Returns
+        -------
+        list[bytes]
+            範囲ごとの PDF のバイト列です。
+        """
+        if self._extraction_generation != generation:
+            # 別のドキュメントのものが残っている場合は閉じてから開き直します。
+            self._close_extraction_document()
+            self._extraction_document = fitz.open(document_path)
+            self._extraction_generation = generation
+        source = self._extraction_document
+
+        results = []
+        for start_page, end_page in ranges:
+            # insert_pdf は範囲のページから参照されるオブジェクトだけを複製します。ドキュメント全体を
+            # 複製してから select で絞り込む方法は、元のドキュメントのページ数に比例して遅くなるため使用しません。
+            with fitz.open() as new_pdf:
+                new_pdf.insert_pdf(source, from_page=start_page, to_page=end_page - 1)
+                results.append(new_pdf.tobytes())
+        return results
+
+    def _close_extraction_document(self) -> None:
+        """
+        抽出用のドキュメントを閉じます。呼び出し元で _extraction_lock を取得してください。
+        """
+        if self._extraction_document is not None:
+            self._extraction_document.close()
+            self._extraction_document = None
+        self._extraction_generation = None
 
     def calculate_page_range(self, current_page: int, max_pages: int) -> tuple[int, int]:
         """
@@ -199,7 +420,7 @@ class PDFDocumentHandler:
         start_page = max(0, end_page - max_pages)  # 最大 max_pages 分前のページからとします。
 
         # 実際に抽出可能な範囲に調整します。
-        end_page = min(end_page, self.current_document.page_count)
+        end_page = min(end_page, self._page_count)
 
         return (start_page, end_page)
 
@@ -217,7 +438,7 @@ class PDFDocumentHandler:
         このメソッドは、ドキュメントが開かれていない場合でもエラーを
         発生させず、0 を返します。
         """
-        return self.current_document.page_count if self.current_document else 0
+        return self._page_count if self.current_document else 0
 
     def cleanup_temp_files(self) -> None:
         """
@@ -228,16 +449,19 @@ class PDFDocumentHandler:
         このメソッドは、アプリケーション終了時に呼び出されることを想定しています。
         一時ファイルの削除に失敗してもエラーは発生させません。
         """
+        self._extracted_files.clear()
         if self.temp_directory.exists():
-            for file in self.temp_directory.glob("*.pdf"):
-                try:
-                    file.unlink()
-                    logger.debug(f"一時ファイルを削除しました: {file}")
-                except Exception as e:
-                    logger.warning(f"一時ファイルの削除に失敗しました: {file}、エラー: {e}")
+            files = list(self.temp_directory.glob("*.pdf"))
+            if len(files) > 1:
+                # ファイルが多い場合でも終了が遅くならないように、削除を並列に実行します。
+                with ThreadPoolExecutor(max_workers=min(_UNLINK_WORKERS, len(files))) as executor:
+                    list(executor.map(_safe_unlink, files))
+            elif files:
+                _safe_unlink(files[0])
             try:
                 if not any(self.temp_directory.glob("*")):
                     self.temp_directory.rmdir()
+                    self._temp_dir_ready = False
                     logger.debug(f"一時ディレクトリを削除しました: {self.temp_directory}")
             except Exception as e:
                 logger.warning(f"一時ディレクトリの削除に失敗しました: {self.temp_directory}、エラー: {e}")
@@ -3,6 +3,9 @@
 このモジュールは、アプリケーションのツールバーとそのコントロールを提供します。
 """
 
+from collections.abc import Callable
+from functools import lru_cache
+
 from PySide6.QtCore import Signal, Slot
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QHBoxLayout, QLabel, QSpinBox, QToolBar, QWidget
@@ -12,6 +15,29 @@ import src.i18n as i18n_module
 from ..config import pdf_config, ui_config
 
 
+@lru_cache(maxsize=4)
+def _toolbar_labels(_: Callable[[str], str]) -> dict[str, str]:
+    """
+    ツールバーに表示する翻訳済みのラベルを返します。
+
+    Parameters
+    ----------
+    _ : Callable[[str], str]
+        翻訳関数 (i18n_module._) です。言語を変更すると別の関数になるため、言語ごとにキャッシュされます。
+        メッセージ抽出ツールが文字列を見つけられるように、_ という名前で受け取ります。
+
+    Returns
+    -------
+    dict[str, str]
+        ラベルの名前と翻訳済みの文字列の辞書です。
+    """
+    return {
+        "copy": _("Copy (Ctrl + C)"),
+        "pages": _("Pages to Copy:"),
+        "capture": _("Capture"),
+    }
+
+
 class ApplicationToolbar(QToolBar):
     """
     アプリケーションのツールバーです。
@@ -62,7 +88,7 @@ class ApplicationToolbar(QToolBar):
         -----
         このアクションは、現在表示中のページとその周辺をクリップボードにコピーするために使用します。
         """
-        action = QAction(i18n_module._("Copy (Ctrl + C)"), self)
+        action = QAction(_toolbar_labels(i18n_module._)["copy"], self)
         action.setShortcut("Ctrl+C")
         self.addAction(action)
         return action
@@ -83,7 +109,7 @@ class ApplicationToolbar(QToolBar):
         )
 
         # ラベルを作成します。
-        label = QLabel(i18n_module._("Pages to Copy:"), container)
+        label = QLabel(_toolbar_labels(i18n_module._)["pages"], container)
         layout.addWidget(label)
 
         # スピンボックスを作成します。
@@ -106,7 +132,7 @@ class ApplicationToolbar(QToolBar):
         QAction
             作成されたアクションです。
         """
-        action = QAction(i18n_module._("Capture"), self)
+        action = QAction(_toolbar_labels(i18n_module._)["capture"], self)
         self.addAction(action)
         return action
 
@@ -8,8 +8,8 @@ import time
 from pathlib import Path
 
 import fitz
-from PySide6.QtCore import QRect, Qt, Signal
-from PySide6.QtWidgets import QApplication, QMessageBox, QScrollBar, QVBoxLayout, QWidget
+from PySide6.QtCore import QBuffer, QIODevice, QObject, QRect, QRunnable, Qt, QThreadPool, QTimer, Signal, Slot
+from PySide6.QtWidgets import QMessageBox, QScrollBar, QVBoxLayout, QWidget
 
 import src.i18n as i18n_module
 
@@ -17,11 +17,68 @@ from ..config import pdf_config
 from ..exceptions import PDFDisplayError, PDFEmptyError, PDFFileNotFoundError
 from ..logger import get_logger
 from .canvas import PDFGraphicsView
-from .services.clipboard_manager import ClipboardManager
 
 logger = get_logger(__name__)
 
 
+class DocumentOpenSignal(QObject):
+    """ドキュメントを開く処理の結果を通知するシグナルを提供するクラスです。"""
+
+    # (要求 ID、fitz.Document、ファイル パス) です。
+    document_opened = Signal(int, object, str)
+    # (要求 ID、ファイル パス、発生した例外) です。
+    document_failed = Signal(int, str, object)
+
+
+class OpenDocumentTask(QRunnable):
+    """
+    PDF ドキュメントをバックグラウンドで開くためのタスククラスです。
+
+    Attributes
+    ----------
+    request_id : int
+        表示要求を識別する ID です。
+    document_path : str
+        開く PDF ファイルのパスです。
+    signals : DocumentOpenSignal
+        結果を通知するシグナルです。
+    """
+
+    def __init__(self, request_id: int, document_path: str, signals: DocumentOpenSignal):
+        """
+        OpenDocumentTask を初期化します。
+
+        Parameters
+        ----------
+        request_id : int
+            表示要求を識別する ID です。
+        document_path : str
+            開く PDF ファイルのパスです。
+        signals : DocumentOpenSignal
+            結果を通知するシグナルです。
+        """
+        super().__init__()
+        self.request_id = request_id
+        self.document_path = document_path
+        self.signals = signals
+
+    @Slot()
+    def run(self) -> None:
+        """
+        ドキュメントを開き、ページ数を確認して結果をシグナルで通知します。
+        """
+        try:
+            document = fitz.open(self.document_path)
+            if not document.page_count:
+                document.close()
+                raise PDFEmptyError(self.document_path)
+        except Exception as e:
+            self.signals.document_failed.emit(self.request_id, self.document_path, e)
+            return
+
+        self.signals.document_opened.emit(self.request_id, document, self.document_path)
+
+
 class PDFViewer(QWidget):
     """
     PDF ビューアコンポーネントです。
@@ -69,7 +126,7 @@ class PDFViewer(QWidget):
         # スクロール バーを設定します。
         self.scrollbar = QScrollBar(Qt.Orientation.Vertical, self)
         self.view.setVerticalScrollBar(self.scrollbar)
-        # スクロールバーのシグナルを直接接続します。
+        # スクロールバーのシグナルを直接接続します。連続したスクロールはビュー側のタイマーでまとめられます。
         self.scrollbar.valueChanged.connect(self.view.update_visible_pages)
 
         # レイアウトに追加します。
@@ -78,6 +135,19 @@ class PDFViewer(QWidget):
         # 現在のドキュメントを初期化します。
         self.current_document = None
 
+        # ドキュメントを開く要求の ID です。完了した要求が最新でない場合は結果を破棄します。
+        self._open_request_id = 0
+        # 最新の要求の表示パラメーター (幅に合わせるか、目標幅、スクロール位置) です。
+        self._pending_display: tuple[bool, int | None, float] = (False, None, 0.0)
+        # current_document をビューアが開いた (閉じる責任がある) かどうかです。
+        self._owns_document = False
+        self._open_signals = DocumentOpenSignal()
+        self._open_signals.document_opened.connect(self._on_document_opened)
+        self._open_signals.document_failed.connect(self._on_document_failed)
+
+        # キャプチャを待っている (領域、元のドラッグ モード) です。
+        self._pending_capture: tuple[QRect, PDFGraphicsView.DragMode] | None = None
+
         # アプリケーションへの参照です。
         # 循環参照を避けるために Any 型で定義します。
         from typing import Any
@@ -94,6 +164,7 @@ class PDFViewer(QWidget):
         fit_to_width: bool = False,
         target_width: int | None = None,
         scroll_position: float = 0.0,
+        document: fitz.Document | None = None,
     ) -> None:
         """
         PDF ドキュメントを表示します。
@@ -108,25 +179,126 @@ class PDFViewer(QWidget):
             ズーム時の目標幅です。
         scroll_position : float
             スクロール位置 (0.0-1.0) です。
+        document : fitz.Document, optional
+            開いている PDF ドキュメントです。指定した場合はファイルを開き直さずに表示します。
+            このドキュメントは呼び出し元が閉じてください。
+
+        Raises
+        ------
+        PDFDisplayError
+            document を指定し、表示中にエラーが発生した場合の処理です。
+
+        Notes
+        -----
+        document を指定しない場合、ドキュメントはバックグラウンド スレッドで開くため、
+        このメソッドはすぐに戻ります。開き終わると _on_document_opened でビューに設定します。
+        続けて呼び出した場合は最後の要求の結果だけを表示します。エラーはメッセージ ボックスで表示します。
+        """
+        self._open_request_id += 1
+        if document is not None:
+            # 開いているドキュメントをそのまま表示します。実行中の要求の結果は破棄されます。
+            self._show_document(
+                document, document_path, fit_to_width, target_width, scroll_position, owns_document=False
+            )
+            return
+
+        request_id = self._open_request_id
+        self._pending_display = (fit_to_width, target_width, scroll_position)
+
+        task = OpenDocumentTask(request_id, document_path, self._open_signals)
+        QThreadPool.globalInstance().start(task)
+
+    @Slot(int, object, str)
+    def _on_document_opened(self, request_id: int, document: fitz.Document, document_path: str) -> None:
+        """
+        バックグラウンドで開いたドキュメントをビューに設定します。
+
+        Parameters
+        ----------
+        request_id : int
+            表示要求の ID です。
+        document : fitz.Document
+            開いたドキュメントです。
+        document_path : str
+            PDF ファイルのパスです。
+        """
+        if request_id != self._open_request_id:
+            # 後から別の要求が出ているため、このドキュメントは使用しません。
+            document.close()
+            return
+
+        fit_to_width, target_width, scroll_position = self._pending_display
+        try:
+            self._show_document(
+                document, document_path, fit_to_width, target_width, scroll_position, owns_document=True
+            )
+        except PDFDisplayError as e:
+            QMessageBox.critical(self, i18n_module._("Error"), str(e))
+
+    @Slot(int, str, object)
+    def _on_document_failed(self, request_id: int, document_path: str, error: Exception) -> None:
+        """
+        ドキュメントを開けなかった場合にエラーを表示します。
+
+        Parameters
+        ----------
+        request_id : int
+            表示要求の ID です。
+        document_path : str
+            PDF ファイルのパスです。
+        error : Exception
+            発生した例外です。
+        """
+        if request_id != self._open_request_id:
+            return
+
+        if isinstance(error, PDFEmptyError):
+            display_error = error
+        elif isinstance(error, (FileNotFoundError, fitz.FileNotFoundError)):
+            display_error = PDFFileNotFoundError(document_path)
+        else:
+            display_error = PDFDisplayError(f"PDF 表示中にエラーが発生しました: {str(error)}", document_path)
+        logger.error(f"PDF の表示に失敗しました: {display_error}")
+        QMessageBox.critical(self, i18n_module._("Error"), str(display_error))
+
+    def _show_document(
+        self,
+        document: fitz.Document,
+        document_path: str,
+        fit_to_width: bool,
+        target_width: int | None,
+        scroll_position: float,
+        owns_document: bool,
+    ) -> None:
+        """
+        開いたドキュメントを現在のドキュメントとしてビューに設定します。
+
+        Parameters
+        ----------
+        document : fitz.Document
+            表示するドキュメントです。
+        document_path : str
+            PDF ファイルのパスです。
+        fit_to_width : bool
+            幅に合わせてズームするかどうかです。
+        target_width : int
+            ズーム時の目標幅です。
+        scroll_position : float
+            スクロール位置 (0.0-1.0) です。
+        owns_document : bool
+            ビューアがドキュメントを閉じる責任を持つかどうかです。
 
         Raises
         ------
-        PDFFileNotFoundError
-            PDF ファイルが見つからない場合の処理です。
-        PDFEmptyError
-            PDF にページがない場合の処理です。
         PDFDisplayError
             PDF 表示中にエラーが発生した場合の処理です。
         """
         try:
-            # 既存のドキュメントを閉じます。
-            if self.current_document:
+            # ビューアが開いた既存のドキュメントを閉じます。共有されたドキュメントは呼び出し元が閉じます。
+            if self.current_document is not None and self._owns_document and self.current_document is not document:
                 self.current_document.close()
-
-            # 新しいドキュメントを開きます。
-            self.current_document = fitz.open(document_path)
-            if not self.current_document.page_count:
-                raise PDFEmptyError(document_path)
+            self.current_document = document
+            self._owns_document = owns_document
 
             # スケールファクターを設定します。
             if fit_to_width and target_width:
@@ -142,8 +314,6 @@ class PDFViewer(QWidget):
                 max_val = self.view.verticalScrollBar().maximum()
                 self.view.verticalScrollBar().setValue(int(scroll_position * max_val))
 
-        except (PDFEmptyError, PDFFileNotFoundError):
-            raise
         except Exception as e:
             raise PDFDisplayError(f"PDF 表示中にエラーが発生しました: {str(e)}", document_path) from e
 
@@ -204,16 +374,32 @@ class PDFViewer(QWidget):
         ----------
         rect : QRect
             キャプチャする領域です。
+
+        Notes
+        -----
+        選択矩形を非表示にした後、イベント ループに 1 回戻って再描画させてから
+        _finish_capture でキャプチャします。
         """
-        try:
-            # 現在のドラッグモードを保存します。
-            original_drag_mode = self.view.dragMode()
+        # 現在のドラッグモードを保存します。
+        original_drag_mode = self.view.dragMode()
 
-            # 一時的にラバーバンドを無効化します（選択矩形を非表示にします）。
-            self.view.setDragMode(PDFGraphicsView.DragMode.NoDrag)
+        # 一時的にラバーバンドを無効化します（選択矩形を非表示にします）。
+        self.view.setDragMode(PDFGraphicsView.DragMode.NoDrag)
 
-            # スクリーンキャプチャを実行します（少し遅延を入れて選択矩形が消えるのを待ちます）。
-            QApplication.processEvents()
+        # 選択矩形が消えてからスクリーンキャプチャを実行します。
+        self._pending_capture = (rect, original_drag_mode)
+        QTimer.singleShot(0, self._finish_capture)
+
+    def _finish_capture(self) -> None:
+        """
+        capture_visible_area で予約した領域をキャプチャし、クリップボードにコピーします。
+        """
+        if self._pending_capture is None:
+            return
+        rect, original_drag_mode = self._pending_capture
+        self._pending_capture = None
+
+        try:
             screen = self.screen()
             pixmap = None
 
@@ -223,23 +409,29 @@ class PDFViewer(QWidget):
                     0, global_rect.x(), global_rect.y(), global_rect.width(), global_rect.height()
                 )
 
-            # ドラッグモードを元に戻します。
-            self.view.setDragMode(original_drag_mode)
+            # ドラッグモードを元に戻します。待っている間に別のモードに変更された場合は、そのままにします。
+            if self.view.dragMode() == PDFGraphicsView.DragMode.NoDrag:
+                self.view.setDragMode(original_drag_mode)
 
             if pixmap and not pixmap.isNull():
-                # 一時ディレクトリを作成します。
-                Path(pdf_config.TEMP_IMAGE_DIRECTORY).mkdir(parents=True, exist_ok=True)
-
-                # 画像を保存します。
-                filepath = Path(pdf_config.TEMP_IMAGE_DIRECTORY) / f"capture-{int(time.time() * 1000)}.png"
-                pixmap.save(str(filepath))
-
-                # クリップボードにコピーします。
-                clipboard_manager = ClipboardManager()
-                clipboard_manager.copy_image_to_clipboard(str(filepath))
+                # 画像をメモリー上で PNG にエンコードします。
+                buffer = QBuffer()
+                buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+                pixmap.save(buffer, "PNG")
+                data = bytes(buffer.data())
+
+                if pdf_config.ARCHIVE_CAPTURES:
+                    # 設定で有効な場合だけ、画像をファイルにも保存します。
+                    Path(pdf_config.TEMP_IMAGE_DIRECTORY).mkdir(parents=True, exist_ok=True)
+                    filepath = Path(pdf_config.TEMP_IMAGE_DIRECTORY) / f"capture-{int(time.time() * 1000)}.png"
+                    filepath.write_bytes(data)
+
+                # ファイルを経由せずにクリップボードにコピーします。PDF のコピーと同じマネージャーを使います。
+                app = getattr(self, "app", None)
+                if app and hasattr(app, "copy_image_to_clipboard"):
+                    app.copy_image_to_clipboard(data, "image/png")
 
                 # ステータスメッセージを更新します。
-                app = getattr(self, "app", None)
                 if app and hasattr(app, "set_status_message"):
                     app.set_status_message(i18n_module._("Captured screenshot to clipboard"))
         except Exception as e:
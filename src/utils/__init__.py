@@ -5,10 +5,29 @@ PyInstaller 対応のリソースパス取得や、ファイルパス操作な
 """
 
 import os
+import platform
 import sys
+from functools import cache, lru_cache
 from pathlib import Path
 
+from ..config import ui_config
 
+# リソースのベースパスです。プロセスの実行中に変わらないため、インポート時に 1 回だけ求めます。
+if getattr(sys, "frozen", False):
+    # PyInstaller でバンドルされた環境です。
+    _BASE_PATH = getattr(sys, "_MEIPASS", os.path.dirname(sys.executable))
+else:
+    # 開発環境では src ディレクトリをベースパスとします。
+    _BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 実行中の OS 名です。起動時に 1 回だけ取得します。
+_OS = platform.system()
+
+# AUTHORS ファイルを開くコマンドです。一覧にない OS (Linux など) では xdg-open を使用します。
+_AUTHORS_VIEWER_COMMANDS = {"Windows": "notepad.exe", "Darwin": "open"}
+
+
+@cache
 def resource_path(*relative_parts: str) -> str:
     """
     リソースの絶対パスを返却します。PyInstaller との互換性があります。
@@ -26,17 +45,12 @@ def resource_path(*relative_parts: str) -> str:
     Notes
     -----
     このメソッドは、開発環境と PyInstaller でバンドルされた環境の両方で正しいパスを返します。
+    結果はプロセスの実行中に変わらないため、キャッシュします。
     """
-    if getattr(sys, "frozen", False):
-        # PyInstaller でバンドルされた環境です。
-        base_path = getattr(sys, "_MEIPASS", os.path.dirname(sys.executable))
-    else:
-        # 開発環境では src ディレクトリをベースパスとします。
-        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-
-    return os.path.join(base_path, *relative_parts)
+    return os.path.join(_BASE_PATH, *relative_parts)
 
 
+@cache
 def authors_file_path() -> str:
     """
     AUTHORS ファイルのパスを取得します。
@@ -49,6 +63,7 @@ def authors_file_path() -> str:
     Notes
     -----
     PyInstaller でバンドルされた環境と開発環境の両方に対応しています。
+    ファイルの存在確認は最初の呼び出しでだけ行い、結果をキャッシュします。
     """
     candidates = [
         resource_path("AUTHORS"),
@@ -66,6 +81,28 @@ def authors_file_path() -> str:
     return candidates[0]
 
 
+def open_authors_file() -> None:
+    """
+    AUTHORS ファイルをデフォルトのテキスト エディターで開きます。
+
+    Raises
+    ------
+    OSError
+        エディターを起動できなかった場合に送出します。
+
+    Notes
+    -----
+    起動したエディターの終了を待たずに戻ります。
+    """
+    # このモジュールを Qt なしで読み込めるように、呼び出し時にだけインポートします。
+    from PySide6.QtCore import QProcess
+
+    command = _AUTHORS_VIEWER_COMMANDS.get(_OS, "xdg-open")
+    started, _pid = QProcess.startDetached(command, [authors_file_path()])
+    if not started:
+        raise OSError(f"{command} を起動できませんでした")
+
+
 def normalize_path(filepath: str | Path) -> str:
     """
     ファイルパスを正規化します。
@@ -83,9 +120,32 @@ def normalize_path(filepath: str | Path) -> str:
     Notes
     -----
     バックスラッシュをフォワードスラッシュに変換し、パスを正規化します。
+    絶対パスへの変換と .. の除去は文字列の操作だけで行い、ファイル システムにはアクセスしません。
+    シンボリック リンクを解決する必要がある場合は canonical_path を使用してください。
+    """
+    # バックスラッシュをフォワードスラッシュに変換し、パスを正規化します。
+    return os.path.abspath(os.fspath(filepath)).replace("\\", "/")
+
+
+def canonical_path(filepath: str | Path) -> str:
+    """
+    シンボリック リンクを解決した正規のファイルパスを返します。
+
+    Parameters
+    ----------
+    filepath : Union[str, Path]
+        解決するファイルパスです。
+
+    Returns
+    -------
+    str
+        シンボリック リンクを解決し、バックスラッシュをフォワードスラッシュに変換したパスです。
+
+    Notes
+    -----
+    パスの各要素についてファイル システムにアクセスするため、normalize_path より低速です。
     """
-    # バックスラッシュをフォワードスラッシュに変換し、パスを解決します。
-    return str(Path(filepath).resolve()).replace("\\", "/")
+    return str(Path(filepath).resolve(strict=False)).replace("\\", "/")
 
 
 def truncate_path_for_display(filepath: str, max_length: int = None) -> str:
@@ -98,13 +158,26 @@ def truncate_path_for_display(filepath: str, max_length: int = None) -> str:
     Returns:
         必要に応じて省略記号付きの切り詰められたパスです。
     """
-    from ..config import ui_config
-
     if max_length is None:
         max_length = ui_config.MAX_MENU_PATH_LENGTH
     if len(filepath) <= max_length:
         return filepath
+    return _truncate_long_path(filepath, max_length)
+
+
+@lru_cache(maxsize=1024)
+def _truncate_long_path(filepath: str, max_length: int) -> str:
+    """max_length より長いファイルパスを切り詰めます。
+
+    最近使ったファイルのメニューなどで同じパスが繰り返し表示されるため、結果をキャッシュします。
+
+    Args:
+        filepath : 切り詰めるファイルパスです。
+        max_length : 表示文字列の最大長です。
 
+    Returns:
+        省略記号付きの切り詰められたパスです。
+    """
     # ファイル名を保持してディレクトリ部分を切り詰めます。
     path_obj = Path(filepath)
     filename = path_obj.name
@@ -175,9 +248,29 @@ def filter_existing_files(filepaths: list[str]) -> list[str]:
         filepaths : チェックするファイルパスのリストです。
 
     Returns:
-        存在するファイルパスのリストです。
+        存在するファイルパスのリストです。順序は filepaths と同じです。
     """
-    return [filepath for filepath in filepaths if os.path.exists(filepath)]
+    # 同じディレクトリのファイルをまとめ、ファイルごとの stat の代わりにディレクトリを 1 回だけ列挙します。
+    paths_by_parent: dict[str, list[str]] = {}
+    for filepath in filepaths:
+        paths_by_parent.setdefault(os.path.dirname(filepath), []).append(filepath)
+
+    existing: set[str] = set()
+    for parent, paths in paths_by_parent.items():
+        if len(paths) == 1:
+            # 1 ファイルだけのディレクトリは、列挙するより stat の方が安価です。
+            if os.path.exists(paths[0]):
+                existing.add(paths[0])
+            continue
+        try:
+            with os.scandir(parent or ".") as entries:
+                names = {os.path.normcase(entry.name) for entry in entries}
+        except OSError:
+            # ディレクトリが存在しない、または読み取れない場合です。
+            continue
+        existing.update(path for path in paths if os.path.normcase(os.path.basename(path)) in names)
+
+    return [filepath for filepath in filepaths if filepath in existing]
 
 
 def get_relative_path(filepath: str, base_path: str) -> str:
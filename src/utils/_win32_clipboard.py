@@ -0,0 +1,142 @@
+"""ctypes で Win32 API を直接呼び出してクリップボードのテキストを操作するモジュールです。
+
+PowerShell のプロセスを起動せずにクリップボードを読み書きします。Windows 以外の環境や、
+API の呼び出しに失敗した場合は None や False を返すので、呼び出し元で別の方法に切り替えてください。
+"""
+
+import ctypes
+import sys
+import time
+
+# クリップボードのデータ形式 (UTF-16 のテキスト) です。
+CF_UNICODETEXT = 13
+
+# 移動可能なグローバル メモリーを確保するフラグです。SetClipboardData にはこの形式で渡す必要があります。
+GMEM_MOVEABLE = 0x0002
+
+# 他のアプリケーションがクリップボードを開いている場合に再試行する回数と間隔 (秒) です。
+_OPEN_RETRIES = 5
+_OPEN_RETRY_INTERVAL = 0.01
+
+_user32 = None
+_kernel32 = None
+
+
+def _load_libraries() -> bool:
+    """user32 と kernel32 を読み込み、関数の引数と戻り値の型を設定します。
+
+    Returns:
+        読み込めた場合は True、Windows 以外の環境や読み込みに失敗した場合は False です。
+    """
+    global _user32, _kernel32
+    if _user32 is not None:
+        return True
+    if sys.platform != "win32":
+        return False
+
+    try:
+        from ctypes import wintypes
+
+        user32 = ctypes.WinDLL("user32", use_last_error=True)
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+        # 64 ビット環境でハンドルやポインターが切り詰められないように、型を明示します。
+        user32.OpenClipboard.argtypes = [wintypes.HWND]
+        user32.OpenClipboard.restype = wintypes.BOOL
+        user32.CloseClipboard.argtypes = []
+        user32.CloseClipboard.restype = wintypes.BOOL
+        user32.EmptyClipboard.argtypes = []
+        user32.EmptyClipboard.restype = wintypes.BOOL
+        user32.GetClipboardData.argtypes = [wintypes.UINT]
+        user32.GetClipboardData.restype = wintypes.HANDLE
+        user32.SetClipboardData.argtypes = [wintypes.UINT, wintypes.HANDLE]
+        user32.SetClipboardData.restype = wintypes.HANDLE
+        kernel32.GlobalAlloc.argtypes = [wintypes.UINT, ctypes.c_size_t]
+        kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+        kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+        kernel32.GlobalLock.restype = wintypes.LPVOID
+        kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+        kernel32.GlobalUnlock.restype = wintypes.BOOL
+        kernel32.GlobalFree.argtypes = [wintypes.HGLOBAL]
+        kernel32.GlobalFree.restype = wintypes.HGLOBAL
+    except (OSError, AttributeError):
+        return False
+
+    _user32, _kernel32 = user32, kernel32
+    return True
+
+
+def _open_clipboard() -> bool:
+    """クリップボードを開きます。他のアプリケーションが開いている場合は少し待って再試行します。"""
+    for _ in range(_OPEN_RETRIES):
+        if _user32.OpenClipboard(None):
+            return True
+        time.sleep(_OPEN_RETRY_INTERVAL)
+    return False
+
+
+def set_text(text: str) -> bool:
+    """クリップボードにテキストを設定します。
+
+    Args:
+        text : クリップボードに設定するテキストです。
+
+    Returns:
+        成功した場合は True、失敗した場合は False です。
+    """
+    if not _load_libraries():
+        return False
+
+    # 終端の NUL を含む UTF-16LE のバイト列です。
+    data = text.encode("utf-16-le") + b"\x00\x00"
+    if not _open_clipboard():
+        return False
+    try:
+        if not _user32.EmptyClipboard():
+            return False
+
+        handle = _kernel32.GlobalAlloc(GMEM_MOVEABLE, len(data))
+        if not handle:
+            return False
+        pointer = _kernel32.GlobalLock(handle)
+        if not pointer:
+            _kernel32.GlobalFree(handle)
+            return False
+        try:
+            ctypes.memmove(pointer, data, len(data))
+        finally:
+            _kernel32.GlobalUnlock(handle)
+
+        # 成功した場合、メモリーの所有権はシステムに移るため解放しません。
+        if not _user32.SetClipboardData(CF_UNICODETEXT, handle):
+            _kernel32.GlobalFree(handle)
+            return False
+        return True
+    finally:
+        _user32.CloseClipboard()
+
+
+def get_text() -> str | None:
+    """クリップボードのテキストを取得します。
+
+    Returns:
+        クリップボードのテキストです。テキストがない場合は空文字列、失敗した場合は None です。
+    """
+    if not _load_libraries():
+        return None
+
+    if not _open_clipboard():
+        return None
+    try:
+        handle = _user32.GetClipboardData(CF_UNICODETEXT)
+        if not handle:
+            return ""
+        pointer = _kernel32.GlobalLock(handle)
+        if not pointer:
+            return None
+        try:
+            return ctypes.wstring_at(pointer)
+        finally:
+            _kernel32.GlobalUnlock(handle)
+    finally:
+        _user32.CloseClipboard()
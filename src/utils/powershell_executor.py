@@ -1,11 +1,45 @@
 """Windows 固有操作のための PowerShell 実行ユーティリティです。"""
 
+import atexit
+import base64
+import functools
+import os
+import queue
 import subprocess
 import sys
+import threading
+import uuid
+
+from . import _win32_clipboard
+
+# Windows で PowerShell のコンソール ウィンドウを作成しないためのフラグです。
+# STARTUPINFO でウィンドウを隠すのと異なり、ウィンドウ自体が作成されないため一瞬表示されることもありません。
+_CREATION_FLAGS = subprocess.CREATE_NO_WINDOW if sys.platform == "win32" else 0
+
+
+def _encode_script(script: str) -> str:
+    """スクリプトを -EncodedCommand や FromBase64String に渡せる UTF-16LE の Base64 文字列に変換します。"""
+    return base64.b64encode(script.encode("utf-16-le")).decode("ascii")
 
 
 class PowerShellExecutor:
-    """PowerShell コマンドを安全に実行するためのユーティリティクラスです。"""
+    """PowerShell コマンドを安全に実行するためのユーティリティクラスです。
+
+    コマンドは起動したままの PowerShell のプロセス (_host) で順に実行し、
+    コマンドごとのプロセスの起動時間を省きます。
+    """
+
+    _host: "PowerShellSession | None" = None
+    _host_lock = threading.Lock()
+
+    @classmethod
+    def _get_host(cls) -> "PowerShellSession":
+        """コマンドの実行に使用する PowerShellSession を返します。最初の呼び出しで作成します。"""
+        with cls._host_lock:
+            if cls._host is None:
+                cls._host = PowerShellSession()
+                atexit.register(cls._host.close)
+            return cls._host
 
     @staticmethod
     def execute_command(command: str, timeout: int = 30) -> str | None:
@@ -18,24 +52,22 @@ class PowerShellExecutor:
         Returns:
             コマンド出力の文字列、または実行に失敗した場合は None です。
         """
+        host = PowerShellExecutor._get_host()
+        if host.start():
+            return host.execute_script_block([command], timeout)
+
+        # 常駐のプロセスを起動できない場合だけ、コマンドごとにプロセスを起動します。
         try:
-            # Windows で子プロセスのウィンドウを完全に隠すためのフラグ
-            startupinfo = None
-            if sys.platform == "win32":
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = subprocess.SW_HIDE
-            
             result = subprocess.run(
-                ["powershell", "-WindowStyle", "Hidden", "-Command", command], 
-                capture_output=True, 
-                text=True, 
-                timeout=timeout, 
+                ["powershell", "-NoProfile", "-NonInteractive", "-Command", command],
+                capture_output=True,
+                text=True,
+                timeout=timeout,
                 check=False,
-                startupinfo=startupinfo
+                creationflags=_CREATION_FLAGS,
             )
             return result.stdout.strip() if result.returncode == 0 else None
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError):
+        except (OSError, subprocess.SubprocessError):
             return None
 
     @staticmethod
@@ -52,9 +84,40 @@ class PowerShellExecutor:
         script = "; ".join(commands)
         return PowerShellExecutor.execute_command(script, timeout)
 
+    @staticmethod
+    def execute_encoded(script: str, env: dict[str, str] | None = None, timeout: int = 30) -> str | None:
+        """スクリプトを -EncodedCommand で渡して実行し、出力を返します。
+
+        ファイル パスなどの値はスクリプトに埋め込まず、env で渡した環境変数
+        ($env:名前) から参照してください。引用符や $ を含む値でもエスケープが不要です。
+
+        Args:
+            script : 実行する PowerShell スクリプトです。
+            env : 現在の環境変数に追加して子プロセスに渡す環境変数です。
+            timeout : スクリプト実行のタイムアウト (秒) です。
+
+        Returns:
+            スクリプト出力の文字列、または実行に失敗した場合は None です。
+        """
+        try:
+            result = subprocess.run(
+                ["powershell", "-NoProfile", "-NonInteractive", "-EncodedCommand", _encode_script(script)],
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                check=False,
+                creationflags=_CREATION_FLAGS,
+                env={**os.environ, **env} if env else None,
+            )
+            return result.stdout.strip() if result.returncode == 0 else None
+        except (OSError, subprocess.SubprocessError):
+            return None
+
     @staticmethod
     def add_to_clipboard(text: str) -> bool:
-        """PowerShell を使用して Windows クリップボードにテキストを追加します。
+        """Windows クリップボードにテキストを追加します。
+
+        Win32 API を直接呼び出し、失敗した場合だけ PowerShell を使用します。
 
         Args:
             text : クリップボードに追加するテキストです。
@@ -62,43 +125,187 @@ class PowerShellExecutor:
         Returns:
             成功した場合は True、そうでない場合は False です。
         """
-        escaped_text = text.replace('"', '""')
-        command = f'Set-Clipboard -Value "{escaped_text}"'
-        result = PowerShellExecutor.execute_command(command)
+        if _win32_clipboard.set_text(text):
+            return True
+        result = PowerShellExecutor.execute_encoded(
+            "Set-Clipboard -Value $env:PDFCROP_CLIPBOARD_TEXT", env={"PDFCROP_CLIPBOARD_TEXT": text}
+        )
         return result is not None
 
     @staticmethod
     def get_clipboard_content() -> str | None:
-        """PowerShell を使用して現在のクリップボードの内容を取得します。
+        """現在のクリップボードの内容を取得します。
+
+        Win32 API を直接呼び出し、失敗した場合だけ PowerShell を使用します。
 
         Returns:
             クリップボードの内容の文字列、または失敗した場合は None です。
         """
+        content = _win32_clipboard.get_text()
+        if content is not None:
+            return content
         command = "Get-Clipboard"
         return PowerShellExecutor.execute_command(command)
 
     @staticmethod
+    @functools.cache
     def is_powershell_available() -> bool:
         """システムで PowerShell が利用可能かどうかをチェックします。
 
+        PowerShell の起動には時間がかかるため、確認は最初の呼び出しで 1 回だけ行い、結果を再利用します。
+        確認に使用したプロセスは、そのまま execute_command で再利用します。
+
         Returns:
             PowerShell が利用可能な場合は True です。
         """
+        return PowerShellExecutor._get_host().execute_script_block(["echo 'test'"], timeout=5) is not None
+
+
+class PowerShellSession:
+    """PowerShell のプロセスを起動したまま、複数のスクリプトを順に実行するクラスです。
+
+    コマンドごとに PowerShell を起動すると、プロセスの起動だけで数百ミリ秒かかります。
+    このクラスは 1 つのプロセスの標準入力にスクリプトを書き込み、完了を表す目印の行が
+    標準出力に現れるまで待ちます。複数のスレッドから呼び出された場合は 1 つずつ実行します。
+    """
+
+    def __init__(self) -> None:
+        """PowerShellSession を初期化します。プロセスは最初に必要になった時点で起動します。"""
+        self._process: subprocess.Popen | None = None
+        self._lines: queue.SimpleQueue[str | None] = queue.SimpleQueue()
+        self._lock = threading.Lock()
+
+    def start(self) -> bool:
+        """PowerShell のプロセスを起動します。起動済みの場合は何もしません。
+
+        Returns:
+            プロセスが実行中の場合は True、起動できなかった場合は False です。
+        """
+        with self._lock:
+            return self._ensure_process() is not None
+
+    def _ensure_process(self) -> subprocess.Popen | None:
+        """実行中のプロセスを返し、終了している場合は起動し直します。呼び出し元でロックを取得してください。"""
+        if self._process is not None and self._process.poll() is None:
+            return self._process
+
         try:
-            # Windows で子プロセスのウィンドウを完全に隠すためのフラグ
-            startupinfo = None
-            if sys.platform == "win32":
-                startupinfo = subprocess.STARTUPINFO()
-                startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
-                startupinfo.wShowWindow = subprocess.SW_HIDE
-            
-            result = subprocess.run(
-                ["powershell", "-WindowStyle", "Hidden", "-Command", "echo 'test'"], 
-                capture_output=True, 
-                timeout=5, 
-                check=False,
-                startupinfo=startupinfo
+            process = subprocess.Popen(
+                [
+                    "powershell",
+                    "-NoLogo",
+                    "-NoProfile",
+                    "-NonInteractive",
+                    "-STA",
+                    "-Command",
+                    "-",
+                ],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+                creationflags=_CREATION_FLAGS,
             )
-            return result.returncode == 0
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
-            return False
+        except (OSError, subprocess.SubprocessError):
+            self._process = None
+            return None
+
+        # 標準出力はスレッドで読み取り、タイムアウト付きで待てるようにキューに積みます。
+        self._lines = queue.SimpleQueue()
+        threading.Thread(target=self._read_output, args=(process, self._lines), daemon=True).start()
+        self._process = process
+        return process
+
+    @staticmethod
+    def _read_output(process: subprocess.Popen, lines: "queue.SimpleQueue[str | None]") -> None:
+        """プロセスの標準出力を 1 行ずつキューに積みます。終了すると None を積みます。"""
+        for line in process.stdout:
+            lines.put(line.rstrip("\r\n"))
+        lines.put(None)
+
+    def execute_script_block(
+        self,
+        commands: list[str],
+        timeout: int = 30,
+        variables: dict[str, str] | None = None,
+        stop_on_error: bool = False,
+    ) -> str | None:
+        """複数の PowerShell コマンドをスクリプトブロックとして実行します。
+
+        Args:
+            commands : 実行する PowerShell コマンドのリストです。改行を含んでもかまいません。
+            timeout : スクリプト実行のタイムアウト (秒) です。
+            variables : スクリプトの前に設定する変数の名前と値です。値は Base64 で渡すため、
+                引用符や $ を含むファイル パスでもスクリプトに埋め込む必要がありません。
+            stop_on_error : True の場合は、終了しないエラーでもスクリプトを中断して失敗とします。
+                False の場合は、コマンドごとにプロセスを起動する場合と同じく、終了するエラーだけを失敗とします。
+
+        Returns:
+            スクリプト出力の文字列、または実行に失敗した場合は None です。
+        """
+        sentinel = f"__PDFCROP_DONE_{uuid.uuid4().hex}__"
+        statements = [
+            f"${name} = [Text.Encoding]::Unicode.GetString([Convert]::FromBase64String('{_encode_script(value)}'))"
+            for name, value in (variables or {}).items()
+        ]
+        if stop_on_error:
+            statements.append("$ErrorActionPreference = 'Stop'")
+        # 標準入力は 1 行ずつ読み取られるため、スクリプトは Base64 で渡して常に 1 行にします。
+        # 子スコープ (& { }) で実行し、変数やエラー時の動作の設定を次のスクリプトに残さないようにします。
+        encoded_script = _encode_script("\n".join(commands))
+        statements.append(
+            f"Invoke-Expression ([Text.Encoding]::Unicode.GetString([Convert]::FromBase64String('{encoded_script}')))"
+        )
+        line = (
+            f"try {{ & {{ {'; '.join(statements)} }}; Write-Output '{sentinel}:0' }} "
+            f"catch {{ Write-Output '{sentinel}:1' }}\n"
+        )
+
+        with self._lock:
+            process = self._ensure_process()
+            if process is None:
+                return None
+            try:
+                process.stdin.write(line)
+                process.stdin.flush()
+            except (OSError, ValueError):
+                self._terminate()
+                return None
+
+            output: list[str] = []
+            while True:
+                try:
+                    received = self._lines.get(timeout=timeout)
+                except queue.Empty:
+                    # 応答がないプロセスは終了し、次の呼び出しで起動し直します。
+                    self._terminate()
+                    return None
+                if received is None:
+                    self._process = None
+                    return None
+                if received.startswith(sentinel):
+                    if received.endswith(":0"):
+                        return "\n".join(output).strip()
+                    return None
+                output.append(received)
+
+    def _terminate(self) -> None:
+        """プロセスを終了します。呼び出し元でロックを取得してください。"""
+        if self._process is not None:
+            try:
+                self._process.kill()
+            except OSError:
+                pass
+            self._process = None
+
+    def close(self) -> None:
+        """PowerShell のプロセスを終了します。"""
+        with self._lock:
+            if self._process is not None and self._process.poll() is None:
+                try:
+                    self._process.stdin.close()
+                    self._process.wait(timeout=1)
+                except (OSError, ValueError, subprocess.TimeoutExpired):
+                    pass
+            self._terminate()
@@ -1,32 +1,51 @@
 """テストパッケージの初期化です。
 
-PyMuPDF (``fitz``) がインストールされていない環境でもテストが動作するように、
-簡易的なスタブを登録します。"""
+PyMuPDF (``fitz``) や Pillow がインストールされていない環境でもテストが動作するように、
+簡易的なスタブを返すインポート ファインダーを登録します。スタブはインポートされた時点で作成します。"""
 
 from __future__ import annotations
 
+import importlib.abc
+import importlib.util
 import os
 import sys
 import types
 
 os.environ["RUNNING_TESTS"] = "1"
 
-if "fitz" not in sys.modules:
-    stub = types.SimpleNamespace(
-        Document=object,
-        Page=object,
-        Matrix=lambda *args, **kwargs: None,
-        open=lambda *args, **kwargs: None,
-    )
-    sys.modules["fitz"] = stub
-
-if "PIL" not in sys.modules:
-    pil_stub = types.ModuleType("PIL")
-    pil_stub.Image = types.SimpleNamespace(open=lambda *a, **k: None)
-    pil_stub.ImageTk = types.ModuleType("ImageTk")
-    pil_stub.ImageTk.PhotoImage = object
-    pil_stub.ImageGrab = types.SimpleNamespace(grab=lambda *a, **k: None)
-    sys.modules["PIL"] = pil_stub
-    sys.modules["PIL.Image"] = pil_stub.Image
-    sys.modules["PIL.ImageTk"] = pil_stub.ImageTk
-    sys.modules["PIL.ImageGrab"] = pil_stub.ImageGrab
+# モジュール名ごとのスタブの属性です。値は関数にして、インポートされるまで作成しないようにします。
+_STUB_ATTRIBUTES = {
+    "fitz": lambda: {
+        "Document": object,
+        "Page": object,
+        "Matrix": lambda *args, **kwargs: None,
+        "open": lambda *args, **kwargs: None,
+    },
+    # サブモジュールを持つパッケージとして扱われるように __path__ を設定します。
+    "PIL": lambda: {"__path__": []},
+    "PIL.Image": lambda: {"open": lambda *a, **k: None},
+    "PIL.ImageTk": lambda: {"PhotoImage": object},
+    "PIL.ImageGrab": lambda: {"grab": lambda *a, **k: None},
+}
+
+
+class _StubFinder(importlib.abc.MetaPathFinder, importlib.abc.Loader):
+    """インストールされていないモジュールの代わりにスタブを返すファインダーです。"""
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname not in _STUB_ATTRIBUTES:
+            return None
+        return importlib.util.spec_from_loader(fullname, self)
+
+    def create_module(self, spec):
+        module = types.ModuleType(spec.name)
+        module.__dict__.update(_STUB_ATTRIBUTES[spec.name]())
+        return module
+
+    def exec_module(self, module):
+        pass
+
+
+# 末尾に追加するため、実際のモジュールが見つからない場合だけスタブが使われます。
+if not any(isinstance(finder, _StubFinder) for finder in sys.meta_path):
+    sys.meta_path.append(_StubFinder())
@@ -0,0 +1,56 @@
+"""ページ キャッシュのサイズ管理をテストします。"""
+
+import sys
+
+# 他のテスト モジュールが PySide6 をモックに置き換えている場合でも、実際の QImage でサイズを計算するため、
+# モックを一時的に外してから読み込み、読み込み後に元に戻します。
+_mocked_modules = {
+    name: sys.modules.pop(name) for name in list(sys.modules) if name == "PySide6" or name.startswith("PySide6.")
+}
+sys.modules.pop("src.pyside_ui.services.page_cache", None)
+try:
+    from PySide6.QtGui import QImage
+
+    from src.pyside_ui.services.page_cache import PageCache
+finally:
+    sys.modules.update(_mocked_modules)
+
+
+def _image(width=100, height=100):
+    """テスト用のページ画像を作成します。"""
+    image = QImage(width, height, QImage.Format.Format_RGB888)
+    image.fill(0)
+    return image
+
+
+def test_cache_size_after_replace():
+    """同じキーの画像を置き換えても、合計サイズに古い画像の分が残らないことをテストします。"""
+    cache = PageCache()
+    cache.put_image("a.pdf", 0, 1.0, _image())
+    cache.put_image("a.pdf", 0, 1.0, _image(200, 200))
+    assert cache.current_cache_size == PageCache._estimate_size(_image(200, 200))
+
+    cache.evict("a.pdf", 0, 1.0)
+    assert cache.current_cache_size == 0
+
+
+def test_cache_size_after_evict_and_clear():
+    """削除とクリアの後に、合計サイズが 0 に戻ることをテストします。"""
+    cache = PageCache()
+    cache.put_image("a.pdf", 0, 1.0, _image())
+    cache.put_image("a.pdf", 1, 1.0, _image())
+    cache.put_image("a.pdf", 1, 2.0, _image(200, 200))
+    cache.put_image("b.pdf", 0, 1.0, _image())
+
+    cache.evict("a.pdf", 0, 1.0)
+    cache.evict("a.pdf", 0, 1.0)  # 既に削除したページを削除しても、サイズは変わりません。
+    cache.clear_document_cache("a.pdf")
+    assert cache.current_cache_size == PageCache._estimate_size(_image())
+
+    cache.clear_document_cache("b.pdf")
+    assert cache.current_cache_size == 0
+    assert not cache.cache
+
+    cache.put_image("a.pdf", 0, 1.0, _image())
+    cache.clear_cache()
+    assert cache.current_cache_size == 0
@@ -0,0 +1,32 @@
+"""ファイル設定の last_accessed の移行をテストします。"""
+
+from datetime import datetime
+
+import pytest
+
+from src.models.settings.settings import _migrate_last_accessed
+
+
+def test_migrate_iso_last_accessed():
+    """ISO 形式の last_accessed がエポックからのナノ秒に変換されることをテストします。"""
+    file_settings = {"last_accessed": "2024-01-02T03:04:05"}
+    assert _migrate_last_accessed(file_settings)
+    expected = int(datetime.fromisoformat("2024-01-02T03:04:05").timestamp() * 1_000_000_000)
+    assert file_settings == {"last_accessed_ns": expected}
+
+
+@pytest.mark.parametrize(
+    "file_settings",
+    [{"last_accessed": ""}, {}, {"last_accessed": "not a date"}, {"last_accessed": None}],
+)
+def test_migrate_empty_or_invalid_last_accessed(file_settings):
+    """空、未設定、または解釈できない last_accessed が 0 に移行されることをテストします。"""
+    assert _migrate_last_accessed(file_settings)
+    assert file_settings == {"last_accessed_ns": 0}
+
+
+def test_migrate_keeps_existing_last_accessed_ns():
+    """移行済みの設定は変更されないことをテストします。"""
+    file_settings = {"last_accessed_ns": 123}
+    assert not _migrate_last_accessed(file_settings)
+    assert file_settings == {"last_accessed_ns": 123}
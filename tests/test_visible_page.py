@@ -1,7 +1,10 @@
 # PySide6 モジュールをモック化します。
 import sys
+from dataclasses import dataclass
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 sys.modules["PySide6"] = MagicMock()
 sys.modules["PySide6.QtWidgets"] = MagicMock()
 sys.modules["PySide6.QtCore"] = MagicMock()
@@ -19,19 +22,39 @@ with patch("src.pyside_ui.canvas.PDFGraphicsView", MockPDFGraphicsView):
     # この時点ではモックが有効なため、実際の PDFGraphicsView は使用されません。
     pass
 
+from src.pyside_ui.canvas import visible_page  # noqa: E402
+
+# ページの上端と高さです。どのインスタンスでも同じなので、モジュールの読み込み時に一度だけ作成して共有します。
+# 共有しても書き換えられないように、変更できないタプルで保持します。
+_PAGE_Y = (0, 1020, 2040)
+_PAGE_H = (1000, 1000, 1000)
+# ページの下端です。ページは上から順に並ぶため、_PAGE_Y と同様に昇順になり、二分探索に使えます。
+_PAGE_BOTTOMS = tuple(y + h for y, h in zip(_PAGE_Y, _PAGE_H, strict=True))
+_TOTAL_HEIGHT = 3060
+
+
+@dataclass(frozen=True)
+class FakeDoc:
+    """テスト用のドキュメントです。MagicMock と異なり、属性の参照に動的な処理を伴いません。"""
+
+    page_count: int = 3
+
 
 class DummyCanvas:
     """PDF キャンバスのテスト用モックです。"""
 
     def __init__(self, scroll_start=None, scroll_end=None):
-        self.current_document = MagicMock()
-        self.current_document.page_count = 3
-        self.page_positions = {
-            0: (0, 0, 100, 1000),
-            1: (0, 1020, 100, 1000),
-            2: (0, 2040, 100, 1000),
-        }
-        self.total_height = 3060
+        self.current_document = FakeDoc()
+        # ページの上端、高さ、下端は、共有のレイアウトへの参照だけを保持します。
+        self.page_y = _PAGE_Y
+        self.page_h = _PAGE_H
+        self.page_bottoms = _PAGE_BOTTOMS
+        # x と幅はすべてのページで共通の定数です。
+        self.page_x = 0
+        self.page_w = 100
+        self._scroll_start_ratio = 0.0
+        self._scroll_end_ratio = 0.0
+        self.total_height = _TOTAL_HEIGHT
         self._height = 800
 
         if scroll_start is not None and scroll_end is not None:
@@ -42,48 +65,48 @@ class DummyCanvas:
             self._scroll_start = 500 / self.total_height
             self._scroll_end = self._scroll_start + (self._height / self.total_height)
 
+    # 表示領域のシーン座標 (_scene_top、_scene_bottom) は、スクロール位置か全体の高さが変わったときだけ計算し直します。
+    @property
+    def total_height(self):
+        """ドキュメント全体の高さです。"""
+        return self._total_height
+
+    @total_height.setter
+    def total_height(self, value):
+        self._total_height = value
+        self._scene_top = self._scroll_start_ratio * value
+        self._scene_bottom = self._scroll_end_ratio * value
+
+    @property
+    def _scroll_start(self):
+        """表示領域の上端の位置 (全体の高さに対する割合) です。"""
+        return self._scroll_start_ratio
+
+    @_scroll_start.setter
+    def _scroll_start(self, value):
+        self._scroll_start_ratio = value
+        self._scene_top = value * self._total_height
+
+    @property
+    def _scroll_end(self):
+        """表示領域の下端の位置 (全体の高さに対する割合) です。"""
+        return self._scroll_end_ratio
+
+    @_scroll_end.setter
+    def _scroll_end(self, value):
+        self._scroll_end_ratio = value
+        self._scene_bottom = value * self._total_height
+
     def calculate_visible_page(self):
         """
         現在表示中のページを特定します。
-        PySide6 版の実装を簡略化してテスト用に再実装します。
+        PySide6 版と同じく、表示領域とページの位置を visible_page に渡します。
         """
-        if not self.current_document or not self.page_positions:
+        if not self.current_document or not self.page_y:
             return 0
 
-        # テスト用の簡略化された実装を行います。
-        visible_pages = []
-
-        # 表示領域を計算します。
-        scene_rect_top = self._scroll_start * self.total_height
-        scene_rect_bottom = self._scroll_end * self.total_height
-
-        for page_num, (_x, y, _width, height) in self.page_positions.items():
-            page_top = y
-            page_bottom = y + height
-
-            # ページが表示領域と重なっているかどうかを確認します。
-            if (page_top <= scene_rect_bottom) and (page_bottom >= scene_rect_top):
-                visible_pages.append(page_num)
-
-        if visible_pages:
-            # 表示されているページのうち最大のページ番号を返します。
-            return max(visible_pages)
-
-        # 見つからない場合は最も近いページを返します。
-        closest_page = 0
-        min_distance = float("inf")
-
-        scene_center = (scene_rect_top + scene_rect_bottom) / 2
-
-        for page_num, (_x, y, _width, height) in self.page_positions.items():
-            page_center = y + height / 2
-            distance = abs(scene_center - page_center)
-
-            if distance < min_distance:
-                min_distance = distance
-                closest_page = page_num
-
-        return closest_page
+        # 表示領域はスクロール位置の設定時に計算済みです。
+        return visible_page(self.page_y, self.page_bottoms, self._scene_top, self._scene_bottom)
 
 
 def test_calculate_visible_page_top_visible():
@@ -102,3 +125,44 @@ def test_calculate_visible_page_partially_visible():
     canvas = DummyCanvas(scroll_start, scroll_end)
     result = canvas.calculate_visible_page()
     assert result == 2, "画面内に一部でもページ 2 が表示されている場合は 2 を返すべきです。"
+
+
+@pytest.mark.parametrize(
+    ("scene_top", "scene_height", "expected"),
+    [
+        (0, 800, 0),  # ページ 0 だけが表示されています。
+        (500, 800, 1),  # ページ 0 の下部とページ 1 の上部が表示されています。
+        (1800, 800, 2),  # ページ 1 の下部とページ 2 の上部が表示されています。
+        (2200, 800, 2),  # ページ 2 だけが表示されています。
+        (1002, 10, 0),  # ページ間の隙間だけが表示され、ページ 0 の中心の方が近い位置です。
+        (1008, 10, 1),  # ページ間の隙間だけが表示され、ページ 1 の中心の方が近い位置です。
+    ],
+)
+def test_calculate_visible_page_scroll_positions(scene_top, scene_height, expected):
+    """さまざまなスクロール位置で、表示中のページが正しく求められることをテストします。"""
+    canvas = DummyCanvas(scene_top / _TOTAL_HEIGHT, (scene_top + scene_height) / _TOTAL_HEIGHT)
+    assert canvas.calculate_visible_page() == expected
+
+
+@pytest.mark.parametrize(
+    ("top", "bottom", "expected"),
+    [
+        (0, 1000, 0),  # ページ 0 がちょうど表示されています。
+        (500, 1020, 0),  # 表示領域の下端がページ 1 の上端に接しているだけです。
+        (500, 1021, 1),  # ページ 1 の上端が 1 だけ表示されています。
+        (1000, 1500, 1),  # 表示領域の上端がページ 0 の下端に接しているだけです。
+        (999, 1010, 0),  # ページ 0 の下端が 1 だけ表示され、残りは隙間です。
+        (1002, 1012, 0),  # 隙間だけが表示され、ページ 0 の中心の方が近い位置です。
+        (1008, 1018, 1),  # 隙間だけが表示され、ページ 1 の中心の方が近い位置です。
+        (3040, 3100, 2),  # 最後のページより下だけが表示されています。
+        (-100, 0, 0),  # 最初のページより上だけが表示されています。
+    ],
+)
+def test_visible_page_edges_and_gaps(top, bottom, expected):
+    """ページの端に接する場合とページ間の隙間で、表示中のページが正しく求められることをテストします。"""
+    assert visible_page(_PAGE_Y, _PAGE_BOTTOMS, top, bottom) == expected
+
+
+def test_visible_page_without_pages():
+    """ページがない場合は 0 を返すことをテストします。"""
+    assert visible_page((), (), 0, 100) == 0